@@ -0,0 +1,211 @@
+"""
+Async Queries
+=============
+
+Runs `find_path` and `exists_path_with_extra_food` from asyncio code without
+holding up the event loop.
+
+Every query works on `QuokkaMaze.snapshot()` as it was when the query was
+made, so the maze can keep changing while a search is part way through.
+By default the search runs on the event loop itself and hands control back
+after every `every` expansions (with `search.find_path_steps`), so other
+requests keep being served while a big search runs, and cancelling the task
+or running out of time stops the search at its next pause. With an
+executor the search runs there instead, in one go.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Generator, List, Tuple, Union
+
+import search
+from graph import QuokkaMaze
+from snapshot import MazeSnapshot
+from vertex import Vertex
+
+
+class AsyncQuokkaMaze:
+    """
+    Async Quokka Maze
+    -----------------
+
+    Awaitable queries on a `QuokkaMaze`.
+
+    ===== Functions =====
+
+        * find_path(s, t, k, timeout=None) - `QuokkaMaze.find_path`.
+        * exists_path_with_extra_food(s, t, k, x, timeout=None) -
+            `QuokkaMaze.exists_path_with_extra_food`.
+        * plan_path_with_extra_food(s, t, k, x, timeout=None) -
+            `QuokkaMaze.plan_path_with_extra_food`.
+
+    ===== Notes ======
+
+    * A query that runs out of `timeout` raises `asyncio.TimeoutError`.
+    * Queries search exhaustively as far as the maze's `exhaustive` allows,
+        and that search pauses like the rest.
+    * A search handed to an executor can't be stopped part way: cancelling
+        the query or timing out only stops waiting for it.
+    * Snapshots are taken on the event loop, so the maze should be changed
+        from the event loop thread too. Queries share one snapshot until the
+        maze's `_version` changes, and a new one only costs the vertices
+        changed since. It isn't built in the executor, where the maze could
+        be changing under it.
+    """
+
+    def __init__(
+            self,
+            maze: QuokkaMaze,
+            every: int = 1000,
+            executor: Union[Executor, None] = None
+    ) -> None:
+        """
+        :param maze - The maze to answer queries on.
+        :param every - The number of expansions between handing control back
+        to the event loop.
+        :param executor - Where to run the searches instead, if given.
+        """
+        self.maze = maze
+        self.every = max(every, 1)
+        self.executor = executor
+        self._snap = None
+
+    def _snapshot(self) -> MazeSnapshot:
+        """
+        The snapshot of the maze as it is now, reused while it is unchanged.
+        """
+        snap = self._snap
+        if snap is None or snap.version != self.maze._version:
+            snap = self._snap = self.maze.snapshot()
+        return snap
+
+    async def _run(
+            self,
+            steps: Generator,
+            finish: Callable[[], object],
+            timeout: Union[float, None]
+    ) -> object:
+        """
+        Drives a stepwise search (or hands `finish` to the executor) within
+        `timeout` seconds.
+        """
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            work = loop.run_in_executor(self.executor, finish)
+        else:
+            work = self._drive(steps)
+        if timeout is None:
+            return await work
+        return await asyncio.wait_for(work, timeout)
+
+    @staticmethod
+    async def _drive(steps: Generator) -> object:
+        """
+        Runs a stepwise search, letting other tasks run at every pause.
+        """
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+            await asyncio.sleep(0)
+
+    async def find_path(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            timeout: Union[float, None] = None
+    ) -> Union[List[Vertex], None]:
+        """
+        `QuokkaMaze.find_path` on the maze as it is now.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food.
+        :param timeout - The most seconds to spend, or None for no limit.
+        :returns the simple path from `s` to `t`, or None.
+        """
+        if not self.maze._valid_query(s, t, k):
+            return None
+
+        snap = self._snapshot()
+        budget = self.maze.exhaustive
+        steps = search.find_path_steps(
+            s,
+            t,
+            k,
+            snap.neighbours,
+            snap.has_food,
+            self.every,
+            budget
+        )
+        return await self._run(
+            steps,
+            lambda: search.find_path(
+                s, t, k, snap.neighbours, snap.has_food, budget
+            ),
+            timeout
+        )
+
+    async def plan_path_with_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int,
+            timeout: Union[float, None] = None
+    ) -> Union[Tuple[List[Vertex], List[Vertex]], None]:
+        """
+        `QuokkaMaze.plan_path_with_extra_food` on the maze as it is now.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food.
+        :param x - The number of extra foods to add.
+        :param timeout - The most seconds to spend, or None for no limit.
+        :returns the path and the vertices on it to place food at, or None.
+        """
+        if not self.maze._valid_query(s, t, k, x):
+            return None
+
+        snap = self._snapshot()
+        budget = self.maze.exhaustive
+        steps = search.find_path_with_extra_food_steps(
+            s,
+            t,
+            k,
+            x,
+            snap.neighbours,
+            snap.has_food,
+            self.every,
+            budget
+        )
+        return await self._run(
+            steps,
+            lambda: search.find_path_with_extra_food(
+                s, t, k, x, snap.neighbours, snap.has_food, budget
+            ),
+            timeout
+        )
+
+    async def exists_path_with_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int,
+            timeout: Union[float, None] = None
+    ) -> bool:
+        """
+        `QuokkaMaze.exists_path_with_extra_food` on the maze as it is now.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food.
+        :param x - The number of extra foods to add.
+        :param timeout - The most seconds to spend, or None for no limit.
+        :returns true if the path can be completed, else false.
+        """
+        plan = await self.plan_path_with_extra_food(s, t, k, x, timeout)
+        return plan is not None
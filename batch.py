@@ -0,0 +1,119 @@
+"""
+Batches
+=======
+
+Queued changes for `QuokkaMaze.batch()`.
+
+Inside a batch `add_vertex`, `fix_edge` and `block_edge` are checked against
+the maze as the batch would leave it and queued instead of applied. When the
+batch ends they are applied in one go and sent to the listeners as a single
+list of changes, so every index and cache updates once per batch. Changes
+that undo each other within the batch (fixing and then blocking the same
+edge) cancel out and are never sent. If the batch ends with an exception
+nothing is applied.
+"""
+
+from typing import Dict, List, Set, Tuple
+
+from vertex import Vertex
+
+
+class Batch:
+    """
+    Batch
+    -----
+
+    The changes queued in one `QuokkaMaze.batch()`.
+
+    ===== Functions =====
+
+        * add_vertex(v) / fix_edge(u, v) / block_edge(u, v) - same checks and
+            results as on `QuokkaMaze`, against the queued state.
+        * changes() - the net changes, as (operation, u, v) tuples.
+    """
+
+    def __init__(self, index: Dict[Vertex, int]) -> None:
+        """
+        :param index - The vertex -> position index of the maze.
+        """
+        self._index = index
+        self._added: List[Vertex] = []
+        self._seen: Set[Vertex] = set()
+        self._edges: Dict[Tuple[int, int], list] = {}
+
+    def _has_vertex(self, v: Vertex) -> bool:
+        """
+        Whether `v` is in the maze once the batch is applied.
+        """
+        return v in self._index or v in self._seen
+
+    def _edge(self, u: Vertex, v: Vertex) -> list:
+        """
+        The [u, v, before, after] entry of the edge between `u` and `v`,
+        starting from the maze as it is now.
+        """
+        key = (id(u), id(v)) if id(u) < id(v) else (id(v), id(u))
+        entry = self._edges.get(key)
+        if entry is None:
+            present = u.has_edge(v)
+            entry = self._edges[key] = [u, v, present, present]
+        return entry
+
+    def _valid_edge(self, u: Vertex, v: Vertex) -> bool:
+        """
+        Checks the ends of an edge.
+        """
+        if u is None or v is None or u == v:
+            return False
+        return self._has_vertex(u) and self._has_vertex(v)
+
+    def add_vertex(self, v: Vertex) -> bool:
+        """
+        :param v - The vertex to add to the graph.
+        :return true if the vertex will be added, else false.
+        """
+        if v is None or self._has_vertex(v):
+            return False
+        self._added.append(v)
+        self._seen.add(v)
+        return True
+
+    def fix_edge(self, u: Vertex, v: Vertex) -> bool:
+        """
+        :param u - A vertex
+        :param v - Another vertex
+        :return true if the edge will be fixed, else false.
+        """
+        if not self._valid_edge(u, v):
+            return False
+        entry = self._edge(u, v)
+        if entry[3]:
+            return False
+        entry[3] = True
+        return True
+
+    def block_edge(self, u: Vertex, v: Vertex) -> bool:
+        """
+        :param u - A vertex
+        :param v - Another vertex.
+        :return true if the edge will be removed, else false.
+        """
+        if not self._valid_edge(u, v):
+            return False
+        entry = self._edge(u, v)
+        if not entry[3]:
+            return False
+        entry[3] = False
+        return True
+
+    def changes(self) -> List[tuple]:
+        """
+        :return the vertices added, then the edges fixed or blocked (in the
+        order they were first touched), leaving out the edges that end the
+        batch as they started.
+        """
+        changes = [("add_vertex", v, None) for v in self._added]
+        for u, v, before, after in self._edges.values():
+            if before != after:
+                changes.append(("fix_edge" if after else "block_edge", u, v))
+        return changes
@@ -0,0 +1,377 @@
+"""
+Benchmark
+=========
+
+Times the `QuokkaMaze` hot paths on synthetic maps and prints the results as
+JSON, so runs from different versions can be compared.
+
+Every map is made by a seeded generator, so the same seed and size always
+give the same map and the same queries:
+
+    * grid - a square lattice.
+    * corridor - one long path.
+    * geometric - random points in the unit square, joined when close.
+    * scale_free - preferential attachment (Barabasi-Albert, 2 edges each).
+    * sparse_food - a geometric map where only 2% of the locations have food.
+
+For every map and size the harness records the throughput and latency
+percentiles of `add_vertex`, `fix_edge`, `find_path`,
+`exists_path_with_extra_food` and `block_edge` (in that order, on the same
+maze), and the peak memory of building the maze the same way, in a
+separate untimed build.
+
+Usage:
+
+    python benchmark.py --sizes 100 1000 10000 --output new.json
+    python benchmark.py --compare old.json new.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from graph import QuokkaMaze
+from vertex import Vertex
+
+Edges = List[Tuple[int, int]]
+
+
+def grid(n: int, rng: random.Random) -> Edges:
+    """
+    A square lattice with about `n` locations.
+    """
+    side = max(math.isqrt(n), 1)
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            i = r * side + c
+            if c + 1 < side:
+                edges.append((i, i + 1))
+            if r + 1 < side:
+                edges.append((i, i + side))
+    return edges
+
+
+def corridor(n: int, rng: random.Random) -> Edges:
+    """
+    One path through `n` locations.
+    """
+    return [(i, i + 1) for i in range(n - 1)]
+
+
+def geometric(n: int, rng: random.Random) -> Edges:
+    """
+    `n` random points in the unit square, joined when they are closer than
+    the radius that gives about 6 neighbours each.
+    """
+    radius = math.sqrt(6 / (math.pi * n))
+    cells = max(int(1 / radius), 1)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    for i, (x, y) in enumerate(points):
+        key = (min(int(x * cells), cells - 1), min(int(y * cells), cells - 1))
+        buckets.setdefault(key, []).append(i)
+
+    edges = []
+    r2 = radius * radius
+    for (cx, cy), members in buckets.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                others = buckets.get((cx + dx, cy + dy), ())
+                for i in members:
+                    xi, yi = points[i]
+                    for j in others:
+                        if j <= i:
+                            continue
+                        xj, yj = points[j]
+                        if (xi - xj) ** 2 + (yi - yj) ** 2 <= r2:
+                            edges.append((i, j))
+    return edges
+
+
+def scale_free(n: int, rng: random.Random) -> Edges:
+    """
+    Preferential attachment: every new location joins 2 earlier ones, picked
+    in proportion to their degree.
+    """
+    edges = [(0, 1)] if n > 1 else []
+    ends = [0, 1]
+    for i in range(2, n):
+        picked = set()
+        while len(picked) < min(2, i):
+            picked.add(rng.choice(ends))
+        for j in picked:
+            edges.append((j, i))
+            ends.extend((i, j))
+    return edges
+
+
+GENERATORS: Dict[str, Tuple[Callable[[int, random.Random], Edges], float]] = {
+    "grid": (grid, 0.3),
+    "corridor": (corridor, 0.3),
+    "geometric": (geometric, 0.3),
+    "scale_free": (scale_free, 0.3),
+    "sparse_food": (geometric, 0.02),
+}
+
+
+def make_map(
+        kind: str,
+        n: int,
+        seed: int
+) -> Tuple[int, Edges, List[bool]]:
+    """
+    The locations, edges and food of a map.
+
+    :param kind - A key of `GENERATORS`.
+    :param n - The (approximate) number of locations.
+    :param seed - The seed for the map.
+    :return the number of locations, the edges between location numbers and
+    whether each location has food.
+    """
+    generate, density = GENERATORS[kind]
+    rng = random.Random(f"{kind}-{n}-{seed}")
+    edges = generate(n, rng)
+    if kind == "grid":
+        n = max(math.isqrt(n), 1) ** 2
+    food = [rng.random() < density for _ in range(n)]
+    return n, edges, food
+
+
+def summarise(op: str, latencies: List[float]) -> Dict[str, float]:
+    """
+    Throughput and latency percentiles of one operation.
+    """
+    ordered = sorted(latencies)
+    total = sum(ordered)
+
+    def percentile(p: float) -> float:
+        if not ordered:
+            return 0.0
+        at = min(int(p / 100 * len(ordered)), len(ordered) - 1)
+        return ordered[at] * 1e6
+
+    return {
+        "op": op,
+        "count": len(ordered),
+        "throughput": len(ordered) / total if total else 0.0,
+        "p50_us": percentile(50),
+        "p90_us": percentile(90),
+        "p99_us": percentile(99),
+        "max_us": ordered[-1] * 1e6 if ordered else 0.0,
+    }
+
+
+def timed(calls: List[Callable[[], object]]) -> List[float]:
+    """
+    The seconds each call took.
+    """
+    latencies = []
+    clock = time.perf_counter
+    for call in calls:
+        start = clock()
+        call()
+        latencies.append(clock() - start)
+    return latencies
+
+
+def build(
+        n: int,
+        edges: Edges,
+        food: List[bool],
+        compact: bool
+) -> Tuple[QuokkaMaze, List[Vertex], List[float], List[float]]:
+    """
+    Builds a maze one vertex and one edge at a time.
+
+    :return the maze, its vertices and the latencies of every `add_vertex`
+    and `fix_edge`.
+    """
+    maze = QuokkaMaze(compact=compact)
+    vertices = [Vertex(f) for f in food]
+    added = timed([lambda v=v: maze.add_vertex(v) for v in vertices])
+    fixed = timed([
+        lambda u=vertices[i], v=vertices[j]: maze.fix_edge(u, v)
+        for i, j in edges
+    ])
+    return maze, vertices, added, fixed
+
+
+def peak_memory(
+        n: int,
+        edges: Edges,
+        food: List[bool],
+        compact: bool
+) -> int:
+    """
+    The peak bytes allocated while building the maze the way `run` does,
+    one `add_vertex` and one `fix_edge` at a time. It is a separate build,
+    as tracing would skew the latencies.
+    """
+    tracemalloc.start()
+    try:
+        build(n, edges, food, compact)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(
+        kind: str,
+        n: int,
+        seed: int,
+        queries: int,
+        k: int,
+        x: int,
+        compact: bool = False,
+        memory: bool = True
+) -> Dict[str, object]:
+    """
+    Benchmarks one map at one size.
+
+    :return the map, its size, the peak memory of building it (or None) and
+    a summary for every operation.
+    """
+    n, edges, food = make_map(kind, n, seed)
+    maze, vertices, added, fixed = build(n, edges, food, compact)
+
+    rng = random.Random(f"queries-{kind}-{n}-{seed}")
+    pairs = [
+        (rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)
+    ]
+    found = timed([lambda s=s, t=t: maze.find_path(s, t, k) for s, t in pairs])
+    exists = timed([
+        lambda s=s, t=t: maze.exists_path_with_extra_food(s, t, k, x)
+        for s, t in pairs
+    ])
+    cut = rng.sample(edges, min(queries, len(edges)))
+    blocked = timed([
+        lambda u=vertices[i], v=vertices[j]: maze.block_edge(u, v)
+        for i, j in cut
+    ])
+
+    return {
+        "map": kind,
+        "n": n,
+        "m": len(edges),
+        "compact": compact,
+        "peak_memory_bytes": peak_memory(n, edges, food, compact)
+        if memory else None,
+        "ops": [
+            summarise("add_vertex", added),
+            summarise("fix_edge", fixed),
+            summarise("find_path", found),
+            summarise("exists_path_with_extra_food", exists),
+            summarise("block_edge", blocked),
+        ],
+    }
+
+
+def compare(
+        old: Dict[str, object],
+        new: Dict[str, object]
+) -> List[Dict[str, object]]:
+    """
+    Pairs up the operations of two reports.
+
+    :return the p50 latency and throughput of both runs, and the ratio new /
+    old, for every (map, n, compact, op) in both reports.
+    """
+    def index(report):
+        return {
+            (r["map"], r["n"], r["compact"], op["op"]): op
+            for r in report["results"]
+            for op in r["ops"]
+        }
+
+    before = index(old)
+    rows = []
+    for key, op in index(new).items():
+        was = before.get(key)
+        if was is None:
+            continue
+        rows.append({
+            "map": key[0],
+            "n": key[1],
+            "compact": key[2],
+            "op": key[3],
+            "old_p50_us": was["p50_us"],
+            "new_p50_us": op["p50_us"],
+            "p50_ratio": op["p50_us"] / was["p50_us"]
+            if was["p50_us"] else None,
+            "throughput_ratio": op["throughput"] / was["throughput"]
+            if was["throughput"] else None,
+        })
+    return rows
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--maps",
+        nargs="+",
+        default=sorted(GENERATORS),
+        choices=sorted(GENERATORS)
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[100, 1000, 10000]
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=4)
+    parser.add_argument("-x", type=int, default=2)
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        reports = []
+        for path in args.compare:
+            with open(path) as f:
+                reports.append(json.load(f))
+        report = {"comparison": compare(*reports)}
+    else:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "k": args.k,
+            "x": args.x,
+            "results": [
+                run(
+                    kind,
+                    n,
+                    args.seed,
+                    args.queries,
+                    args.k,
+                    args.x,
+                    args.compact,
+                    not args.no_memory
+                )
+                for kind in args.maps
+                for n in args.sizes
+            ],
+        }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Query Cache
+===========
+
+A least recently used cache of `find_path` and `exists_path_with_extra_food`
+results.
+
+Every result is kept for the `QuokkaMaze._version` it was computed on. The
+version is bumped by every successful `add_vertex`, `fix_edge` and
+`block_edge`, so the first lookup after a change finds a different version
+and empties the cache instead of returning an answer for the old graph.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable
+
+# Returned by `QueryCache.get` when there is no result, as None is a result.
+MISSING = object()
+
+
+class QueryCache:
+    """
+    Query Cache
+    -----------
+
+    At most `size` query results for one version of a maze, dropping the
+    least recently used result when full.
+
+    ===== Functions =====
+
+        * get(key, version) - the result kept for `key`, or `MISSING`.
+        * put(key, version, result) - keeps a result.
+        * resize(size) - changes the bound, evicting results if needed.
+        * stats() - the hit, miss and eviction counters.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        """
+        Sets up an empty cache.
+
+        :param size - The most results to keep.
+        """
+        self.size = max(size, 0)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._version = None
+
+    def _check(self, version: int) -> None:
+        """
+        Empties the cache if its results are for another version.
+        """
+        if version != self._version:
+            self._results.clear()
+            self._version = version
+
+    def get(self, key: Hashable, version: int) -> object:
+        """
+        :param key - The query.
+        :param version - The current version of the maze.
+        :return the result kept for `key`, or `MISSING`.
+        """
+        self._check(version)
+        result = self._results.get(key, MISSING)
+        if result is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._results.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, version: int, result: object) -> None:
+        """
+        Keeps `result` for `key`, evicting the least recently used result if
+        the cache is full.
+
+        :param key - The query.
+        :param version - The version of the maze `result` was computed on.
+        :param result - The answer to the query.
+        """
+        self._check(version)
+        if self.size <= 0:
+            return
+        self._results[key] = result
+        self._results.move_to_end(key)
+        self._trim()
+
+    def resize(self, size: int) -> None:
+        """
+        :param size - The most results to keep from now on.
+        """
+        self.size = max(size, 0)
+        self._trim()
+
+    def _trim(self) -> None:
+        """
+        Evicts the least recently used results until the bound holds.
+        """
+        while len(self._results) > self.size:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return the hit, miss and eviction counters, with the number of
+        results kept and the bound.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._results),
+            "size": self.size
+        }
+
+    def __len__(self) -> int:
+        return len(self._results)
@@ -0,0 +1,374 @@
+"""
+Compact Maze
+============
+
+An array-backed copy of a quokka maze.
+
+Locations are numbered `0 .. n - 1` (their position in `QuokkaMaze.vertices`)
+and the whole graph lives in a handful of contiguous arrays instead of one
+Python object per location:
+
+    * `offsets` - CSR row offsets, the neighbours of `i` are
+        `targets[offsets[i]:offsets[i + 1]]`
+    * `targets` - the concatenated neighbour ids of every location
+    * `food` - a bitset, bit `i` is set when location `i` has food
+
+The searches here work purely on ids, the owning `QuokkaMaze` maps the ids
+back to its `Vertex` objects.
+
+A compact maze can also carry `rows`, an overlay of id -> neighbour ids for
+the locations that changed (or were added) since the arrays were built.
+`patched` returns a new compact maze sharing the arrays with a larger
+overlay, so a change costs the rows it touched instead of a rebuild.
+
+A compact maze can be written to disk with `save` and opened again with
+`open`, which maps the file into memory and runs the searches straight over
+the mapped buffers. This is how a process starts up on a saved maze without
+building one `Vertex` per location: it answers in ids, and only the caller
+turns the paths it needs back into its own objects. The file is laid out
+as:
+
+    * a 24 byte header: b"QMAZ", format version, byte order, 2 bytes of
+        padding, then `n` and the length of `targets` as little-endian
+        unsigned 64-bit integers
+    * `offsets` as `n + 1` signed 64-bit integers
+    * `targets` as signed 32-bit integers
+    * the food bitset, `(n + 7) // 8` bytes
+
+The arrays are stored in the byte order of the machine that wrote them.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import search
+from stats import QueryStats
+from vertex import Vertex
+
+_HEADER = struct.Struct("<4sBBxxQQ")
+_MAGIC = b"QMAZ"
+_FORMAT_VERSION = 1
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+class CompactMaze:
+    """
+    Compact Maze
+    ------------
+
+    Read-only CSR representation of an undirected graph with a food bitset.
+
+    ===== Functions =====
+
+        * from_vertices(vertices, index) - builds a compact maze from a list
+            of vertices and their vertex -> id index.
+        * patched(rows, food) - a copy with some rows replaced or added,
+            sharing the arrays.
+        * neighbours(i) - the ids connected to location `i`.
+        * has_food(i) - whether location `i` has food.
+        * find_path(s, t, k) - same contract as `QuokkaMaze.find_path`, on ids.
+        * exists_path_with_extra_food(s, t, k, x) - same contract as
+            `QuokkaMaze.exists_path_with_extra_food`, on ids.
+        * find_paths(s, targets, k) / find_paths_with_extra_food(s, targets,
+            k, x) - one shared search from `s` to many targets, on ids.
+        * save(path) - writes the arrays to a file.
+        * open(path) - maps a saved file into memory, without copying it.
+        * close() - releases the mapping of an opened file.
+    """
+
+    def __init__(
+            self,
+            offsets: Sequence[int],
+            targets: Sequence[int],
+            food: Union[bytes, bytearray],
+            rows: Union[Dict[int, Sequence[int]], None] = None
+    ) -> None:
+        """
+        Wraps already built CSR arrays.
+
+        :param offsets - row offsets into `targets`, one more than the
+        locations in the arrays.
+        :param targets - concatenated neighbour ids.
+        :param food - bitset of the locations that have food.
+        :param rows - neighbour ids that take the place of the rows in the
+        arrays, and the rows of the locations added after them.
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.food = food
+        self.rows = rows or {}
+        self.n = max(len(offsets) - 1, max(self.rows, default=-1) + 1)
+        self._mmap = None
+
+    @classmethod
+    def from_vertices(
+            cls,
+            vertices: List[Vertex],
+            index: Dict[Vertex, int]
+    ) -> 'CompactMaze':
+        """
+        Builds the CSR arrays for `vertices`.
+
+        Neighbours that are not part of `index` are not part of the maze and
+        are left out.
+
+        :param vertices - The vertices, in id order.
+        :param index - Maps every vertex to its id.
+        :return the compact maze.
+        """
+        offsets = array('q', [0])
+        targets = array('i')
+        food = bytearray((len(vertices) + 7) // 8)
+
+        for i, v in enumerate(vertices):
+            if v.has_food:
+                food[i >> 3] |= 1 << (i & 7)
+            for u in v.edges:
+                j = index.get(u)
+                if j is not None:
+                    targets.append(j)
+            offsets.append(len(targets))
+
+        return cls(offsets, targets, food)
+
+    def patched(
+            self,
+            rows: Dict[int, Sequence[int]],
+            food: Iterable[bool] = ()
+    ) -> 'CompactMaze':
+        """
+        Returns a copy of this maze with new rows, sharing the arrays and
+        the rows it already had. This maze is left as it is.
+
+        :param rows - The neighbour ids of the locations that changed, and
+        of the locations added, which are numbered on from `n`.
+        :param food - Whether each added location has food, in id order.
+        :return the patched compact maze.
+        """
+        merged = dict(self.rows)
+        merged.update(rows)
+        bits = self.food
+        food = list(food)
+        if food:
+            n = self.n + len(food)
+            bits = bytearray(bits)
+            bits.extend(bytes((n + 7) // 8 - len(bits)))
+            for i, has_food in enumerate(food, self.n):
+                if has_food:
+                    bits[i >> 3] |= 1 << (i & 7)
+        return CompactMaze(self.offsets, self.targets, bits, merged)
+
+    def _folded(self) -> 'CompactMaze':
+        """
+        A copy of this maze with its rows built into the arrays.
+        """
+        offsets = array('q', [0])
+        targets = array('i')
+        for i in range(self.n):
+            targets.extend(self.neighbours(i))
+            offsets.append(len(targets))
+        return CompactMaze(offsets, targets, bytes(self.food))
+
+    def save(self, path: str) -> None:
+        """
+        Writes this compact maze to `path`, in the format `open` maps.
+
+        :param path - The file to write.
+        """
+        if self.rows:
+            self._folded().save(path)
+            return
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC,
+                _FORMAT_VERSION,
+                _BYTE_ORDER,
+                self.n,
+                len(self.targets)
+            ))
+            f.write(array('q', self.offsets).tobytes())
+            f.write(array('i', self.targets).tobytes())
+            f.write(bytes(self.food))
+
+    @classmethod
+    def open(cls, path: str) -> 'CompactMaze':
+        """
+        Maps a file written by `save` into memory. The arrays are views into
+        the mapping, nothing is copied or parsed up front.
+
+        :param path - The file to open.
+        :return the compact maze, call `close` when done with it.
+        :raises ValueError if the file is not a compact maze this machine can
+        read.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < _HEADER.size:
+            mapped.close()
+            raise ValueError(f"{path} is not a compact maze")
+        magic, version, order, n, m = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            mapped.close()
+            raise ValueError(f"{path} is not a compact maze")
+        if order != _BYTE_ORDER:
+            mapped.close()
+            raise ValueError(f"{path} was written with another byte order")
+
+        start = _HEADER.size
+        middle = start + 8 * (n + 1)
+        end = middle + 4 * m
+        if len(mapped) != end + (n + 7) // 8:
+            mapped.close()
+            raise ValueError(f"{path} is truncated")
+
+        view = memoryview(mapped)
+        maze = cls(
+            view[start:middle].cast('q'),
+            view[middle:end].cast('i'),
+            view[end:]
+        )
+        maze._mmap = mapped
+        return maze
+
+    def close(self) -> None:
+        """
+        Releases the memory mapping of a maze from `open`. The maze can't be
+        used afterwards. Does nothing for a maze built in memory.
+        """
+        if self._mmap is None:
+            return
+        for buffer in (self.offsets, self.targets, self.food):
+            buffer.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> 'CompactMaze':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def neighbours(self, i: int) -> Sequence[int]:
+        """
+        :param i - A location id.
+        :return the ids of the locations connected to `i`.
+        """
+        rows = self.rows
+        if rows:
+            row = rows.get(i)
+            if row is not None:
+                return row
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def has_food(self, i: int) -> bool:
+        """
+        :param i - A location id.
+        :return true if location `i` has food, else false.
+        """
+        return bool(self.food[i >> 3] & (1 << (i & 7)))
+
+    def find_path(self, s: int, t: int, k: int) -> Union[List[int], None]:
+        """
+        Finds a simple path of ids from `s` to `t` such that from any location
+        with food we reach the next location with food in at most `k` steps.
+
+        :param s - The start id.
+        :param t - The destination id.
+        :param k - The maximum number of hops between locations with food.
+        :returns the list of ids from `s` to `t`, or None.
+        """
+        return search.find_path(s, t, k, self.neighbours, self.has_food)
+
+    def exists_path_with_extra_food(
+            self,
+            s: int,
+            t: int,
+            k: int,
+            x: int
+    ) -> bool:
+        """
+        Determines whether we can get from `s` to `t` along a simple path
+        where from any location with food we reach the next one in at most `k`
+        steps, by placing food at at most `x` new locations.
+
+        :param s - The start id.
+        :param t - The destination id.
+        :param k - The maximum number of hops between locations with food.
+        :param x - The number of extra foods to add.
+        :returns true if the path can be completed, else false.
+        """
+        plan = search.find_path_with_extra_food(
+            s,
+            t,
+            k,
+            x,
+            self.neighbours,
+            self.has_food
+        )
+        return plan is not None
+
+    def find_paths(
+            self,
+            s: int,
+            targets: Iterable[int],
+            k: int,
+            stats: Union[QueryStats, None] = None,
+            budget: int = 0
+    ) -> Dict[int, List[int]]:
+        """
+        `find_path` from `s` to every id in `targets`, sharing one search.
+
+        :param s - The start id.
+        :param targets - The destination ids.
+        :param k - The maximum number of hops between locations with food.
+        :param stats - Counts the work done, if given.
+        :param budget - The most states to spend per target the search
+        missed, as in `search.find_paths`.
+        :returns the path of ids to every target that was reached.
+        """
+        return search.find_paths(
+            s,
+            targets,
+            k,
+            self.neighbours,
+            self.has_food,
+            stats,
+            budget
+        )
+
+    def find_paths_with_extra_food(
+            self,
+            s: int,
+            targets: Iterable[int],
+            k: int,
+            x: int,
+            stats: Union[QueryStats, None] = None,
+            budget: int = 0
+    ) -> Dict[int, Tuple[List[int], List[int]]]:
+        """
+        `search.find_paths_with_extra_food` from `s` to every id in `targets`.
+
+        :param s - The start id.
+        :param targets - The destination ids.
+        :param k - The maximum number of hops between locations with food.
+        :param x - The number of extra foods to add.
+        :param stats - Counts the work done, if given.
+        :param budget - The most states to spend per target the search
+        missed, as in `search.find_paths_with_extra_food`.
+        :returns the path of ids and the ids that need extra food for every
+        target that was reached.
+        """
+        return search.find_paths_with_extra_food(
+            s,
+            targets,
+            k,
+            x,
+            self.neighbours,
+            self.has_food,
+            stats,
+            budget
+        )
@@ -0,0 +1,180 @@
+"""
+Connectivity
+============
+
+Keeps track of the connected components of a quokka maze while edges are
+fixed and blocked, so that queries between two components can be turned
+down without searching.
+
+    * fixing an edge merges the smaller component into the larger one.
+    * blocking an edge searches from both ends at the same time. If one side
+        runs out before the two searches meet, that side has been cut off and
+        is given a new label. Only the smaller side is ever walked in full.
+    * blocking several edges at once (a `QuokkaMaze.batch()`) walks the
+        components the blocked edges were in again.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+from search import Neighbours, Node
+
+
+class Connectivity:
+    """
+    Connectivity
+    ------------
+
+    Component labels for every location, kept up to date through
+    `maze_changed`.
+
+    ===== Functions =====
+
+        * connected(u, v) - whether `u` and `v` are in the same component.
+        * component_size(v) - the number of locations in `v`'s component.
+        * maze_changed(changes) - updates the labels for changed edges.
+    """
+
+    def __init__(self, nodes: Iterable[Node], neighbours: Neighbours) -> None:
+        """
+        Labels the components of the current graph.
+
+        :param nodes - Every location in the maze.
+        :param neighbours - Returns the locations connected to a location.
+        """
+        self._neighbours = neighbours
+        self._label: Dict[Node, int] = {}
+        self._members: Dict[int, Set[Node]] = {}
+        self._next_label = 0
+
+        for v in nodes:
+            if v in self._label:
+                continue
+            self._relabel(self._flood(v))
+
+    def _flood(self, v: Node) -> Set[Node]:
+        """
+        Every location reachable from `v`.
+        """
+        seen = {v}
+        queue = deque([v])
+        while queue:
+            u = queue.popleft()
+            for w in self._neighbours(u):
+                if w not in seen:
+                    seen.add(w)
+                    queue.append(w)
+        return seen
+
+    def _relabel(self, nodes: Set[Node]) -> None:
+        """
+        Moves `nodes` into a new component of their own.
+        """
+        label = self._next_label
+        self._next_label += 1
+        for v in nodes:
+            old = self._label.get(v)
+            if old is not None:
+                members = self._members[old]
+                members.discard(v)
+                if not members:
+                    del self._members[old]
+            self._label[v] = label
+        self._members[label] = nodes
+
+    def connected(self, u: Node, v: Node) -> bool:
+        """
+        :param u - A location.
+        :param v - Another location.
+        :return true if there is a path between `u` and `v`, else false.
+        """
+        label = self._label.get(u)
+        return label is not None and label == self._label.get(v)
+
+    def component_size(self, v: Node) -> int:
+        """
+        :param v - A location.
+        :return the number of locations reachable from `v`, including `v`.
+        """
+        label = self._label.get(v)
+        if label is None:
+            return 0
+        return len(self._members[label])
+
+    def maze_changed(self, changes: List[tuple]) -> None:
+        """
+        Updates the labels for the changed vertices and edges.
+
+        :param changes - (operation, u, v) tuples, as sent by `QuokkaMaze`.
+        The blocked edges are handled last, as the maze already has all the
+        changes when they are sent.
+        """
+        blocked = []
+        for op, u, v in changes:
+            if op == "add_vertex":
+                self._relabel({u})
+            elif op == "fix_edge":
+                self._merge(u, v)
+            elif op == "block_edge":
+                blocked.append((u, v))
+
+        if len(blocked) == 1:
+            self._split(*blocked[0])
+        elif blocked:
+            self._resplit(blocked)
+
+    def _merge(self, u: Node, v: Node) -> None:
+        """
+        Joins the components of `u` and `v`.
+        """
+        a = self._label[u]
+        b = self._label[v]
+        if a == b:
+            return
+        if len(self._members[a]) < len(self._members[b]):
+            a, b = b, a
+
+        moved = self._members.pop(b)
+        for w in moved:
+            self._label[w] = a
+        self._members[a] |= moved
+
+    def _split(self, u: Node, v: Node) -> None:
+        """
+        Checks whether `u` and `v` are still connected after the edge between
+        them was removed, and relabels the cut off side if not.
+        """
+        if not self.connected(u, v):
+            return
+
+        sides = [{u}, {v}]
+        queues = [deque([u]), deque([v])]
+        while queues[0] and queues[1]:
+            for i in (0, 1):
+                x = queues[i].popleft()
+                for w in self._neighbours(x):
+                    if w in sides[1 - i]:
+                        return
+                    if w not in sides[i]:
+                        sides[i].add(w)
+                        queues[i].append(w)
+                if not queues[i]:
+                    break
+
+        cut = sides[0] if not queues[0] else sides[1]
+        self._relabel(cut)
+
+    def _resplit(self, blocked: List[tuple]) -> None:
+        """
+        Labels the components again that several removed edges were in. One
+        `_split` per edge isn't enough, as it already sees the other edges
+        removed.
+        """
+        stale = {self._label[w] for edge in blocked for w in edge}
+        nodes = set()
+        for label in stale:
+            nodes |= self._members[label]
+        while nodes:
+            part = self._flood(next(iter(nodes)))
+            nodes -= part
+            self._relabel(part)
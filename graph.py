@@ -16,10 +16,50 @@ All functions to implement are marked with a `TODO` comment.
 Please implement these methods to help the quokkas find their new home!
 """
 
-from typing import List, Union
+import time
+from collections import deque
+from contextlib import contextmanager
+from math import isqrt
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    Union
+)
 
+import search
+from batch import Batch
+from cache import MISSING, QueryCache
+from compact import CompactMaze
+from connectivity import Connectivity
+from landmarks import Landmarks
+from oracle import FoodOracle
+from routes import Routes
+from snapshot import MazeSnapshot, Snapshots
+from stats import QueryStats, StatsRecorder
 from vertex import Vertex
 
+_JOURNAL = 4096
+_COMPACT_ROWS = 64
+
+
+def _edges(v: Vertex) -> List[Vertex]:
+    """
+    The neighbours of `v`, for the searches in `search`.
+    """
+    return v.edges
+
+
+def _has_food(v: Vertex) -> bool:
+    """
+    Whether `v` has food, for the searches in `search`.
+    """
+    return v.has_food
+
 
 class QuokkaMaze:
     """
@@ -39,6 +79,12 @@ class QuokkaMaze:
         * block_edge(u, v) - removes the edge between vertex `u` and vertex `v`
         * fix_edge(u, v) - fixes the edge between vertex `u` and `v`. or adds an
             edge if non-existent
+        * add_vertices(vertices) / fix_edges(pairs) - bulk versions of
+            `add_vertex` and `fix_edge` for loading whole maps
+        * batch() - a `with` block whose changes are applied together, as one
+            change
+        * journal(size) / changes_since(version) - keep the latest changes,
+            and return the ones made after an earlier `_version`
         * find_path(s, t, k) - find a SIMPLE path from veretx `s` to vertex `t`
             such that from any location with food along this simple path we
             reach the next location with food in at most `k` steps
@@ -46,6 +92,19 @@ class QuokkaMaze:
             possible for the quokkas to make it from s to t along a simple path
             where from any location with food we reach the next location with
             food in at most k steps, by placing food at at most x new locations
+        * plan_path_with_extra_food(s, t, k, x) - the path and food
+            placements behind a True `exists_path_with_extra_food`
+        * min_extra_food(s, t, k) - the fewest new locations with food (and
+            where to put them) for the quokkas to make it from s to t
+        * min_k(s, t) / find_path_profile(s, t) - the smallest k that
+            `find_path` needs, and its path for every k, from one search
+        * reachable_from(s, k, x) - every vertex reachable from s, with its
+            hops and the vertex before it, from one kept search
+        * find_paths(queries) / exists_paths_with_extra_food(queries) - answer
+            many queries in one call, sharing the search between queries from
+            the same source
+        * track_route(s, t, k) / route(id) / untrack_route(id) - hand out a
+            `find_path` route that is kept valid as edges are blocked
 
     ===== Notes ======
 
@@ -61,13 +120,421 @@ class QuokkaMaze:
         way.
     * All vertices in the graph SHOULD BE UNIQUE! IT SHOULD NOT BE POSSIBLE
         TO ADD DUPLICATE VERTICES! (i.e the same vertex instance)
+    * The path searches run in polynomial time but can miss a route that
+        only exists by passing a location that their pruning turned down
+        (see `search`): every path returned is valid, but None and False
+        are not proof that there is none. With `exhaustive=n`,
+        `find_path`, `exists_path_with_extra_food`,
+        `plan_path_with_extra_food` and the batch queries spend up to `n`
+        more states per missed destination searching simple paths
+        exhaustively, and so does the async front end. Snapshots, the food
+        oracle and `reachable_from` don't.
+    * With `compact=True` the path queries run on a `CompactMaze` (CSR
+        arrays + food bitset) built from the vertices, and it captures
+        `has_food` when it is built. After `add_vertex`/`fix_edge`/
+        `block_edge` the rows of the changed locations are overlaid on the
+        arrays, which are only rebuilt once more locations have changed than
+        the square root of the maze (and `_COMPACT_ROWS`). Mazes that change
+        a lot between queries pay for the rebuilds.
+    * A `food_oracle(k)` answers `find_path(s, t, k)` with a path of the
+        same length as the search would, weighing each food hop by the
+        locations it walks through.
+    * Indexes over the maze (such as the `FoodOracle`s from `food_oracle(k)`)
+        are registered as listeners, and every successful change is sent to
+        their `maze_changed(changes)` as a list of (operation, u, v) tuples.
+    * Inside `with maze.batch():` the changes are checked and queued, and
+        the queries still see the maze from before the batch. When the block
+        ends they are applied at once, with a single `_version` bump and a
+        single list of changes for the listeners and the journal. If the
+        block raises, nothing is applied.
+    * The journal is off until `journal()` is called, and then keeps at
+        most `size` changes, dropping whole lists of changes from the oldest.
+    * Once `connectivity()` has been called, queries between two different
+        components are answered without searching.
+    * Once `landmarks()` has been called, `find_path(..., method="astar")`
+        is steered towards `t` by landmark distance bounds.
+    * `snapshot()` freezes the edges at the current version for readers in
+        other threads. Later snapshots share the edge tuples of the vertices
+        that didn't change.
+    * Once `stats()` has been called, every query is measured (states
+        expanded and pushed, largest frontier, path length and wall time) and
+        the records go to the `StatsRecorder` and its subscribers.
+    * Once `query_cache()` has been called, repeated `find_path` and
+        `exists_path_with_extra_food` queries are answered from an LRU cache
+        that is emptied whenever `_version` changes.
+    * A tracked route that a `block_edge` breaks is repaired by a local
+        detour around the break, and only searched for again from `s` when
+        there is no detour. A repaired route may be longer than a fresh
+        `find_path` route.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, compact: bool = False, exhaustive: int = 0) -> None:
         """
         Initialises an empty graph with a list of empty vertices.
+
+        `_index` maps every vertex to its position in `vertices` so that
+        membership checks are O(1) instead of a scan over the whole maze.
+        `_version` is bumped by every successful change to the graph, and the
+        change is sent to every listener in `_listeners`. `_trees` holds the
+        searches from `reachable_from`, for the `_trees_version` of the graph.
+        Once `journal()` is called, `_journal` keeps the latest lists of
+        changes with the version each one led to, `_journal_changes` of them
+        in all, and `_journal_from` is the version it goes back to. `_batch`
+        queues the changes of an open `batch()`.
+
+        :param compact - whether the path queries should run on the compact
+        array-backed copy of the maze.
+        :param exhaustive - the most states a query may spend looking for a
+        route its search missed, 0 to never look (see the notes).
         """
         self.vertices = []
+        self._index = {}
+        self._version = 0
+        self.compact = compact
+        self.exhaustive = max(exhaustive, 0)
+        self._compact = None
+        self._compact_version = -1
+        self._compact_dirty: Set[Vertex] = set()
+        self._listeners = []
+        self._oracles: Dict[int, FoodOracle] = {}
+        self._connectivity = None
+        self._landmarks = None
+        self._trees: Dict[Tuple[Vertex, int, int], tuple] = {}
+        self._trees_version = 0
+        self._cache = None
+        self._snapshots = None
+        self._stats = None
+        self._record = None
+        self._routes = None
+        self._journal = None
+        self._journal_size = 0
+        self._journal_changes = 0
+        self._journal_from = 0
+        self._batch = None
+
+    def _changed(self, changes: List[tuple]) -> None:
+        """
+        Records successful changes to the graph.
+
+        :param changes - (operation, u, v) tuples. The operation is the name
+        of the method, e.g. "fix_edge", `u` is the vertex added or one end of
+        the edge and `v` is the other end (None for "add_vertex").
+        """
+        self._version += 1
+        if self._journal is not None:
+            self._journal.append((self._version, changes))
+            self._journal_changes += len(changes)
+            self._trim_journal()
+        if self._compact is not None:
+            self._compact_changed(changes)
+        for listener in self._listeners:
+            listener.maze_changed(changes)
+
+    def _compact_changed(self, changes: List[tuple]) -> None:
+        """
+        Records the locations whose rows the compact view no longer has, and
+        drops the view once a rebuild is cheaper than overlaying them all.
+        """
+        dirty = self._compact_dirty
+        for _, u, v in changes:
+            dirty.add(u)
+            if v is not None:
+                dirty.add(v)
+        view = self._compact
+        limit = max(_COMPACT_ROWS, isqrt(view.n))
+        if len(view.rows) + len(dirty) > limit:
+            self._compact = None
+            dirty.clear()
+
+    def _trim_journal(self) -> None:
+        """
+        Drops the oldest lists of changes from the journal while it holds
+        more than `_journal_size` changes.
+        """
+        journal = self._journal
+        while self._journal_changes > self._journal_size:
+            self._journal_from, dropped = journal.popleft()
+            self._journal_changes -= len(dropped)
+
+    @contextmanager
+    def batch(self) -> Iterator[Batch]:
+        """
+        Queues the `add_vertex`, `fix_edge` and `block_edge` calls (and their
+        bulk versions) made inside a `with` block, and applies them together
+        when it ends. A batch opened inside another one joins it.
+
+        :return the `Batch` the changes are queued in.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = self._batch = Batch(self._index)
+        try:
+            yield batch
+        finally:
+            self._batch = None
+        self._apply(batch.changes())
+
+    def _apply(self, changes: List[tuple]) -> None:
+        """
+        Makes checked changes to the graph and records them as one change.
+        """
+        for op, u, v in changes:
+            if op == "add_vertex":
+                self._index[u] = len(self.vertices)
+                self.vertices.append(u)
+            elif op == "fix_edge":
+                u.add_edge(v)
+                v.add_edge(u)
+            else:
+                u.rm_edge(v)
+                v.rm_edge(u)
+        if changes:
+            self._changed(changes)
+
+    def journal(self, size: int = _JOURNAL) -> None:
+        """
+        Starts keeping the changes made to the graph, for `changes_since`.
+
+        :param size - The most changes to keep, an existing journal is
+        trimmed to it.
+        """
+        self._journal_size = max(size, 0)
+        if self._journal is None:
+            self._journal = deque()
+            self._journal_changes = 0
+            self._journal_from = self._version
+        else:
+            self._trim_journal()
+
+    def drop_journal(self) -> bool:
+        """
+        Stops keeping the changes made to the graph.
+
+        :return true if they were being kept, else false.
+        """
+        if self._journal is None:
+            return False
+        self._journal = None
+        return True
+
+    def changes_since(self, version: int) -> Union[List[tuple], None]:
+        """
+        Returns the changes made to the graph after `version`, for callers
+        that keep their own copy of something derived from the maze.
+
+        :param version - An earlier `_version` (or `MazeSnapshot.version`).
+        :return the (operation, u, v) tuples in the order they were made, or
+        None if the journal is off or no longer goes back that far.
+        """
+        if version > self._version:
+            return None
+        if version == self._version:
+            return []
+        journal = self._journal
+        if journal is None or version < self._journal_from:
+            return None
+        return [
+            change
+            for at, changes in journal if at > version
+            for change in changes
+        ]
+
+    def food_oracle(self, k: int) -> Union[FoodOracle, None]:
+        """
+        Returns the food-hop index for `k`, creating it if needed. While it
+        exists, `find_path(s, t, k)` is answered through it.
+
+        :param k - The maximum number of hops between locations with food.
+        :return the `FoodOracle` for `k`, or None if `k` is invalid.
+        """
+        if k is None or k < 0:
+            return None
+        oracle = self._oracles.get(k)
+        if oracle is None:
+            oracle = FoodOracle(k, _edges, _has_food)
+            self._oracles[k] = oracle
+            self._listeners.append(oracle)
+        return oracle
+
+    def drop_food_oracle(self, k: int) -> bool:
+        """
+        Removes the food-hop index for `k`.
+
+        :param k - The `k` the index was created for.
+        :return true if there was an index to remove, else false.
+        """
+        oracle = self._oracles.pop(k, None)
+        if oracle is None:
+            return False
+        self._listeners.remove(oracle)
+        return True
+
+    def compact_view(self) -> CompactMaze:
+        """
+        Returns the compact copy of this maze, patching in the rows of the
+        locations that changed since it was last built, or rebuilding it if
+        too many did.
+
+        :return the `CompactMaze` of the current graph, ids are positions in
+        `vertices`.
+        """
+        view = self._compact
+        if view is None:
+            view = CompactMaze.from_vertices(self.vertices, self._index)
+        elif self._compact_version != self._version:
+            index = self._index
+            view = view.patched(
+                {
+                    index[v]: tuple(index[u] for u in v.edges if u in index)
+                    for v in self._compact_dirty
+                },
+                (v.has_food for v in self.vertices[view.n:])
+            )
+            self._compact_dirty.clear()
+        self._compact = view
+        self._compact_version = self._version
+        return view
+
+    def connectivity(self) -> Connectivity:
+        """
+        Returns the component labels of this maze, creating them if needed.
+        From then on they are kept up to date by every change.
+
+        :return the `Connectivity` of this maze.
+        """
+        if self._connectivity is None:
+            self._connectivity = Connectivity(self.vertices, _edges)
+            self._listeners.append(self._connectivity)
+        return self._connectivity
+
+    def save(self, path: str) -> None:
+        """
+        Writes the compact copy of this maze to `path`. Workers that only run
+        queries can map it with `CompactMaze.open(path)`, ids are positions
+        in `vertices`. That is the cold-start path: opening the file creates
+        no `Vertex` objects, only the paths returned are lists of ids.
+
+        :param path - The file to write.
+        """
+        self.compact_view().save(path)
+
+    def query_cache(self, size: int = 1024) -> QueryCache:
+        """
+        Returns the result cache of this maze, creating it if needed. From
+        then on `find_path` (with the default method) and
+        `exists_path_with_extra_food` keep their results in it.
+
+        :param size - The most results to keep, an existing cache is resized.
+        :return the `QueryCache` of this maze.
+        """
+        if self._cache is None:
+            self._cache = QueryCache(size)
+        else:
+            self._cache.resize(size)
+        return self._cache
+
+    def drop_query_cache(self) -> bool:
+        """
+        Removes the result cache.
+
+        :return true if there was a cache to remove, else false.
+        """
+        if self._cache is None:
+            return False
+        self._cache = None
+        return True
+
+    def stats(self, keep: int = 1000) -> StatsRecorder:
+        """
+        Returns the query stats recorder of this maze, creating it if needed.
+        From then on every `find_path`, `exists_path_with_extra_food` and
+        `plan_path_with_extra_food` call is measured and recorded.
+
+        :param keep - The number of latest records to keep, when creating it.
+        :return the `StatsRecorder` of this maze.
+        """
+        if self._stats is None:
+            self._stats = StatsRecorder(keep)
+        return self._stats
+
+    def drop_stats(self) -> bool:
+        """
+        Stops measuring queries.
+
+        :return true if queries were being measured, else false.
+        """
+        if self._stats is None:
+            return False
+        self._stats = None
+        return True
+
+    def snapshot(self) -> MazeSnapshot:
+        """
+        Returns an immutable view of the maze as it is now. It can be queried
+        from other threads without locks while this maze keeps changing.
+        Take snapshots from the thread that changes the maze.
+
+        :return the `MazeSnapshot` of the current version, the same object
+        until the maze changes.
+        """
+        if self._snapshots is None:
+            self._snapshots = Snapshots()
+            self._listeners.append(self._snapshots)
+        return self._snapshots.take(self.vertices, self._version)
+
+    def landmarks(self, count: int = 8) -> Landmarks:
+        """
+        Returns the landmark distance bounds of this maze, creating them if
+        needed. From then on `find_path(..., method="astar")` uses them.
+
+        :param count - The number of landmarks, when creating them.
+        :return the `Landmarks` of this maze.
+        """
+        if self._landmarks is None:
+            self._landmarks = Landmarks(lambda: self.vertices, _edges, count)
+            self._listeners.append(self._landmarks)
+        return self._landmarks
+
+    def track_route(self, s: Vertex, t: Vertex, k: int) -> Union[int, None]:
+        """
+        Finds a route with `find_path` and keeps it valid from then on: when
+        a blocked edge breaks it, it is repaired around the break.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food.
+        :return the id of the route for `route`, or None if the query is
+        invalid. A route with no path yet (e.g. between components that are
+        not connected) is still tracked, and found once an edge is fixed.
+        """
+        if not self._valid_params(s, t, k):
+            return None
+        if self._routes is None:
+            self._routes = Routes(_edges, _has_food)
+            self._listeners.append(self._routes)
+        return self._routes.add(s, t, k, self.find_path(s, t, k))
+
+    def route(self, route_id: int) -> Union[List[Vertex], None]:
+        """
+        :param route_id - An id from `track_route`.
+        :return the current path of the route, or None if there is none.
+        """
+        if self._routes is None:
+            return None
+        return self._routes.path(route_id)
+
+    def untrack_route(self, route_id: int) -> bool:
+        """
+        Stops keeping a route valid.
+
+        :param route_id - An id from `track_route`.
+        :return true if the route was tracked, else false.
+        """
+        if self._routes is None:
+            return False
+        return self._routes.remove(route_id)
 
     def add_vertex(self, v: Vertex) -> bool:
         """
@@ -77,21 +544,18 @@ class QuokkaMaze:
         :param v - The vertex to add to the graph.
         :return true if the vertex was correctly added, else false
         """
-        # TODO implement me, please?
+        if self._batch is not None:
+            return self._batch.add_vertex(v)
         if v is None:
             return False
-
-        find = False
-        for i in range(len(self.vertices)):
-            if self.vertices[i] == v:
-                find = True
-
-        if find is False:
-            self.vertices.append(v)
-            return True
-        else:
+        if v in self._index:
             return False
 
+        self._index[v] = len(self.vertices)
+        self.vertices.append(v)
+        self._changed([("add_vertex", v, None)])
+        return True
+
     def fix_edge(self, u: Vertex, v: Vertex) -> bool:
         """
         Fixes the edge between two vertices, u and v.
@@ -101,36 +565,73 @@ class QuokkaMaze:
         :param v - Another vertex
         :return true if the edge was successfully fixed, else false.
         """
-
-        # TODO implement me please.
-
+        if self._batch is not None:
+            return self._batch.fix_edge(u, v)
         if u is None:
             return False
         if v is None:
             return False
-
-        find_u = False
-        find_v = False
-        vu = None
-        vv = None
-
-        for i in range(len(self.vertices)):
-            if self.vertices[i] == u:
-                find_u = True
-                vu = self.vertices[i]
-            if self.vertices[i] == v:
-                find_v = True
-                vv = self.vertices[i]
-
-        if find_v & find_u is True:
-            for i in range(len(vu.edges)):
-                if vu.edges[i] == vv:
-                    return False
-            vu.add_edge(vv)
-            vv.add_edge(vu)
-            return True
-        else:
+        if u == v:
             return False
+        if u not in self._index or v not in self._index:
+            return False
+        if u.has_edge(v):
+            return False
+
+        u.add_edge(v)
+        v.add_edge(u)
+        self._changed([("fix_edge", u, v)])
+        return True
+
+    def add_vertices(self, vertices: Iterable[Vertex]) -> int:
+        """
+        Adds many vertices to the graph in one pass.
+        Vertices that are None, already in the graph or repeated are skipped.
+
+        :param vertices - The vertices to add to the graph.
+        :return the number of vertices that were added.
+        """
+        if self._batch is not None:
+            return sum(self._batch.add_vertex(v) for v in vertices)
+        changes = []
+        for v in vertices:
+            if v is None or v in self._index:
+                continue
+            self._index[v] = len(self.vertices)
+            self.vertices.append(v)
+            changes.append(("add_vertex", v, None))
+
+        if changes:
+            self._changed(changes)
+        return len(changes)
+
+    def fix_edges(self, pairs: Iterable[Tuple[Vertex, Vertex]]) -> int:
+        """
+        Fixes the edges between many pairs of vertices in one pass.
+        Pairs that `fix_edge` would reject, including pairs repeated within
+        `pairs`, are skipped.
+
+        :param pairs - (u, v) pairs of vertices.
+        :return the number of edges that were fixed.
+        """
+        if self._batch is not None:
+            return sum(self._batch.fix_edge(u, v) for u, v in pairs)
+        index = self._index
+        changes = []
+        for u, v in pairs:
+            if u is None or v is None or u == v:
+                continue
+            if u not in index or v not in index:
+                continue
+            if u.has_edge(v):
+                continue
+            u.add_edge(v)
+            v.add_edge(u)
+            changes.append(("fix_edge", u, v))
+
+        if changes:
+            self._changed(changes)
+        return len(changes)
 
     def block_edge(self, u: Vertex, v: Vertex) -> bool:
         """
@@ -142,27 +643,31 @@ class QuokkaMaze:
         :param v - Another vertex.
         :return true if the edge was successfully removed, else false.
         """
-
-        # TODO implement me, please!
+        if self._batch is not None:
+            return self._batch.block_edge(u, v)
         if u is None:
             return False
         if v is None:
             return False
-
-        if u not in v.edges and v not in u.edges:
-            return False
         if u == v:
             return False
+        if u not in self._index or v not in self._index:
+            return False
+        if not u.has_edge(v) and not v.has_edge(u):
+            return False
 
         u.rm_edge(v)
         v.rm_edge(u)
+        self._changed([("block_edge", u, v)])
         return True
 
     def find_path(
             self,
             s: Vertex,
             t: Vertex,
-            k: int
+            k: int,
+            method: str = "bfs",
+            heuristic: Callable[[Vertex, Vertex], int] = None
     ) -> Union[List[Vertex], None]:
         """
         find_path returns a SIMPLE path between `s` and `t` such that from any
@@ -173,12 +678,23 @@ class QuokkaMaze:
         :param t - The destination for the quokka colony
         :param k - The maximum number of hops between locations with food, so
         that the colony can survive!
+        :param method - How to search:
+            * "bfs" - from `s` outwards, the path has the fewest hops. With
+            a `food_oracle(k)` it is answered through the index, still with
+            the fewest hops (ties may pick another path).
+            * "bidirectional" - from `s` and `t` at once until they meet,
+            explores far less on long routes but the path may not have the
+            fewest hops.
+            * "astar" - A* towards `t`, the path has the fewest hops.
+        :param heuristic - For "astar", `heuristic(v, t)` gives a lower bound
+        on the hops from `v` to `t` (e.g. from coordinates). Defaults to the
+        bounds from `landmarks()` if they were created, else to 0.
         :returns
             * The list of vertices to form the simple path from `s` to `t`
             satisfying the conditions.
             OR
-            * None if no simple path exists that can satisfy the conditions, or
-            is invalid.
+            * None if no simple path exists that can satisfy the conditions
+            (or the search missed it, see the notes), or is invalid.
 
         Example:
         (* means the vertex has food)
@@ -193,115 +709,70 @@ class QuokkaMaze:
             3/ find_path(s=A, t=C, k=4) -> returns: [A, B, C]
 
         """
-        # TODO implement me please
-        if k < 0:
+        if self._stats is not None and self._record is None:
+            return self._measured(
+                "find_path",
+                self.find_path,
+                s,
+                t,
+                k,
+                method,
+                heuristic
+            )
+        if not self._valid_query(s, t, k):
             return None
-        if s == None:
-            return None
-        if t == None:
+
+        if method == "bidirectional":
+            return self._on_backend(
+                search.find_path_bidirectional,
+                s,
+                t,
+                k,
+                budget=self.exhaustive
+            )
+        if method == "astar":
+            estimate = self._heuristic_to(t, heuristic)
+            if self.compact:
+                vertices = self.vertices
+                return self._on_backend(
+                    search.find_path_astar,
+                    s,
+                    t,
+                    k,
+                    heuristic=lambda i: estimate(vertices[i]),
+                    budget=self.exhaustive
+                )
+            return self._on_backend(
+                search.find_path_astar,
+                s,
+                t,
+                k,
+                heuristic=estimate,
+                budget=self.exhaustive
+            )
+        if method != "bfs":
             return None
 
-        for v in self.vertices:
-            v.visited = False
-            v.n_visited = False
-            v.count = 0
-        queue: List[List[Vertex]] = []
-        count: int = 0
-
-        queue.append([s])
-        s.visited = True
-        s.n_visited = True
-
-        while queue:
-            path = queue.pop(0)  # dequeue
-            curr = path[-1]
-            count = curr.count
-
-            for i in curr.edges:
-                if i == t and count < k:
-                    path.append(i)
-                    return path
-
-            if curr == t:
-                return path
-
-            for adjacent in curr.edges:
-                if adjacent.visited == False:
-                    if adjacent.has_food == True:
-                        adjacent.count = 0
-                        count = adjacent.count
-                    else:
-                        adjacent.count = curr.count + 1
-                        count = adjacent.count
-                    if count < k:
-                        new_path = list(path)
-                        new_path.append(adjacent)
-                        queue.append(new_path)
-                        adjacent.visited = True
-        return None
-
-    # def dfs_find_path(self, v: Vertex, t: Vertex, count: int, k: int) -> bool:
-    #     if count <= k and v == t:
-    #         return True
-    #     if count == k and v.has_food == False:
-    #         return False
-    #     if v.has_food == True:
-    #         count = 0
-    #     for i in v.edges:
-    #         if i.n_visited == False:
-    #             count += 1
-    #             i.n_visited = True
-    #             return self.dfs_find_path(i, t, count, k)
-    #     return True
-
-    #     if k < 0:
-    #         return None
-    #
-    #     if s is None:
-    #         return None
-    #     if t is None:
-    #         return None
-    #
-    #     supply = k
-    #     res = []
-    #     start = None
-    #     end = None
-    #
-    #     for i in range(len(self.vertices)):
-    #         self.vertices[i].visited = False
-    #
-    #     for i in range(len(self.vertices)):
-    #         if self.vertices[i] == s:
-    #             start = s
-    #         if self.vertices[i] == t:
-    #             end = t
-    #
-    #     cur = []
-    #
-    #     if start and end is not None:
-    #         start.visited = True
-    #         cur.append(start)
-    #         cur = self.dfs(k, supply, cur, start, end)
-    #         res = cur
-    #
-    #     return res
-    #
-    # def dfs(self, k: int, supply: int, ls: [], v: Vertex, end: Vertex) -> []:
-    #     for x in range(len(v.edges)):
-    #         if v.edges[x] == end:
-    #             ls.append(end)
-    #             return ls
-    #     if k == 0:
-    #         return None
-    #     for i in range(len(v.edges)):
-    #         if not v.edges[i].visited:
-    #             v.edges[i].visited = True
-    #             if v.edges[i].has_food:
-    #                 k = supply
-    #             k = k - 1
-    #             ls.append(v.edges[i])
-    #             return self.dfs(k, supply, ls, v.edges[i], end)
-    #     return None
+        cache = self._cache
+        if cache is not None:
+            key = ("find_path", s, t, k)
+            path = cache.get(key, self._version)
+            if path is not MISSING:
+                return None if path is None else list(path)
+
+        oracle = self._oracles.get(k)
+        if oracle is not None:
+            path = oracle.find_path(s, t)
+        else:
+            path = self._paths_from(s, [t], k).get(t)
+
+        if cache is not None:
+            cache.put(
+                key,
+                self._version,
+                None if path is None else list(path)
+            )
+        return path
 
     def exists_path_with_extra_food(
             self,
@@ -340,97 +811,594 @@ class QuokkaMaze:
                 (Yes, if we put food on `B`, `C`, `D` then we reach E!)
 
         """
+        if self._stats is not None and self._record is None:
+            return self._measured(
+                "exists_path_with_extra_food",
+                self.exists_path_with_extra_food,
+                s,
+                t,
+                k,
+                x
+            )
+        if not self._valid_query(s, t, k, x):
+            return False
+
+        cache = self._cache
+        if cache is not None:
+            key = ("exists_path_with_extra_food", s, t, k, x)
+            found = cache.get(key, self._version)
+            if found is not MISSING:
+                return found
+
+        found = t in self._plans_from(s, [t], k, x)
+        if cache is not None:
+            cache.put(key, self._version, found)
+        return found
 
-        # TODO implement me please
-        if k < 0:
+    def plan_path_with_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int
+    ) -> Union[Tuple[List[Vertex], List[Vertex]], None]:
+        """
+        Like `exists_path_with_extra_food`, but returns the plan that the
+        search found instead of only whether one exists. `has_food` is not
+        modified, the placements are only returned.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food, so
+        that the colony can survive!
+        :param x - The number of extra foods to add.
+        :returns
+            * A tuple of the simple path from `s` to `t` and the vertices on
+            it to place food at (at most `x` of them, in path order).
+            OR
+            * None if `exists_path_with_extra_food(s, t, k, x)` is False.
+
+        Example:
+        (* means the vertex has food)
+                            *
+            A---B---C---D---E
+
+            1/ plan_path_with_extra_food(A, E, 2, 1)
+                -> returns: ([A, B, C, D, E], [C])
+
+            2/ plan_path_with_extra_food(A, E, 2, 0) -> returns: None
+        """
+        if self._stats is not None and self._record is None:
+            return self._measured(
+                "plan_path_with_extra_food",
+                self.plan_path_with_extra_food,
+                s,
+                t,
+                k,
+                x
+            )
+        if not self._valid_query(s, t, k, x):
+            return None
+
+        return self._plans_from(s, [t], k, x).get(t)
+
+    def min_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int
+    ) -> Union[Tuple[int, List[Vertex]], None]:
+        """
+        Finds the fewest new locations that need food so that the quokkas can
+        make it from s to t along a SIMPLE path where from any location with
+        food we reach the next location with food in at most k steps.
+        `has_food` is not modified, the placements are only returned. It
+        runs one search, so like `find_path` it can miss the cheapest route
+        (see the notes): the count is then more than the fewest, but the
+        placements always work.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food, so
+        that the colony can survive!
+        :returns
+            * A tuple of the number of new locations and the vertices to
+            place the food at.
+            OR
+            * None if no simple path was found, or the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                            *
+            A---B---C---D---E
+
+            1/ min_extra_food(A, E, 2) -> returns: (1, [C])
+
+            2/ min_extra_food(A, E, 1) -> returns: (3, [B, C, D])
+        """
+        if not self._valid_query(s, t, k):
+            return None
+
+        plan = self._plan_on_backend(search.min_extra_food, s, t, k)
+        if plan is None:
+            return None
+        return len(plan[1]), plan[1]
+
+    def min_k(self, s: Vertex, t: Vertex) -> Union[int, None]:
+        """
+        Finds the smallest k for which `find_path(s, t, k)` finds a path,
+        from the one search of `find_path_profile`. Like it, the k can be
+        more than the smallest when the search misses a route (see the
+        notes).
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :returns
+            * The smallest k, the longest stretch between locations with food
+            on the best path.
+            OR
+            * None if there is no path at all, or the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                    *       *
+            A---B---C---D---E
+
+            1/ min_k(A, E) -> returns: 2
+
+            2/ min_k(A, A) -> returns: 0
+        """
+        profile = self.find_path_profile(s, t)
+        if not profile:
+            return None
+        return profile[0][0]
+
+    def find_path_profile(
+            self,
+            s: Vertex,
+            t: Vertex
+    ) -> List[Tuple[int, List[Vertex]]]:
+        """
+        Finds the `find_path(s, t, k)` path for every k with a single search.
+        It never searches exhaustively, so a k whose route `find_path` only
+        finds with `exhaustive` is left out (see the notes).
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :returns (k, path) tuples in increasing k. The path of a tuple has the
+        fewest hops for its k and every larger k up to the next tuple's. The
+        first k is `min_k(s, t)` and the list is empty if there is no path at
+        all, or the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                    *       *
+            A---B---C---D---E
+             \\             /
+              F-----------G
+
+            1/ find_path_profile(A, E) -> returns:
+                [(2, [A, B, C, D, E]), (3, [A, F, G, E])]
+        """
+        if not self._valid_query(s, t, 0):
+            return []
+
+        if not self.compact:
+            return search.find_path_profile(s, t, _edges, _has_food)
+
+        view = self.compact_view()
+        vertices = self.vertices
+        profile = search.find_path_profile(
+            self._index[s],
+            self._index[t],
+            view.neighbours,
+            view.has_food
+        )
+        return [(k, [vertices[i] for i in path]) for k, path in profile]
+
+    def reachable_from(
+            self,
+            s: Vertex,
+            k: int,
+            x: int = 0
+    ) -> Dict[Vertex, Tuple[int, Union[Vertex, None]]]:
+        """
+        Finds every vertex the quokkas can reach from s along a SIMPLE path
+        where from any location with food we reach the next location with
+        food in at most k steps, by placing food at at most x new locations.
+
+        The search is kept until the graph changes, and until then
+        `find_path(s, t, k)` (or with x, `exists_path_with_extra_food` and
+        `plan_path_with_extra_food`) looks its answer up in it instead of
+        searching again. It never searches exhaustively, so like `find_path`
+        without `exhaustive` it can miss a vertex (see the notes).
+
+        :param s - The start vertex for the quokka colony
+        :param k - The maximum number of hops between locations with food, so
+        that the colony can survive!
+        :param x - The number of extra foods to add.
+        :returns the number of hops on the path to every reachable vertex and
+        the vertex before it on that path (None for `s`), by vertex. Empty if
+        the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                    *       *
+            A---B---C---D---E
+
+            1/ reachable_from(A, 1) -> returns: {A: (0, None), B: (1, A)}
+
+            2/ reachable_from(A, 2) -> returns:
+                {A: (0, None), B: (1, A), C: (2, B), D: (3, C), E: (4, D)}
+        """
+        if not self._valid_query(s, s, k, x):
+            return {}
+
+        key = (s, k, x)
+        tree = self._tree(key)
+        if tree is None:
+            if not self.compact:
+                tree = search.reach(s, k, _edges, _has_food, x)
+            else:
+                view = self.compact_view()
+                tree = search.reach(
+                    self._index[s],
+                    k,
+                    view.neighbours,
+                    view.has_food,
+                    x
+                )
+            self._trees[key] = tree
+
+        reached = tree[0]
+        if not self.compact:
+            return {
+                v: (hops, None if state is None else state[0])
+                for v, (hops, state) in reached.items()
+            }
+        vertices = self.vertices
+        return {
+            vertices[i]: (hops, None if state is None else vertices[state[0]])
+            for i, (hops, state) in reached.items()
+        }
+
+    def find_paths(
+            self,
+            queries: Iterable[Tuple[Vertex, Vertex, int]]
+    ) -> List[Union[List[Vertex], None]]:
+        """
+        Answers many `find_path` queries at once.
+
+        Queries with the same `s` and `k` share one search, which stops once
+        all of their destinations have been reached.
+
+        :param queries - (s, t, k) tuples.
+        :returns the result `find_path(s, t, k)` would give for every query,
+        in the same order as `queries`.
+        """
+        queries = list(queries)
+        results: List[Union[List[Vertex], None]] = [None] * len(queries)
+        groups: Dict[Tuple[Vertex, int], List[int]] = {}
+
+        for i, (s, t, k) in enumerate(queries):
+            if not self._valid_query(s, t, k):
+                continue
+            oracle = self._oracles.get(k)
+            if oracle is not None:
+                results[i] = oracle.find_path(s, t)
+                continue
+            groups.setdefault((s, k), []).append(i)
+
+        for (s, k), members in groups.items():
+            paths = self._paths_from(s, [queries[i][1] for i in members], k)
+            for i in members:
+                path = paths.get(queries[i][1])
+                if path is not None:
+                    results[i] = list(path)
+        return results
+
+    def exists_paths_with_extra_food(
+            self,
+            queries: Iterable[Tuple[Vertex, Vertex, int, int]]
+    ) -> List[bool]:
+        """
+        Answers many `exists_path_with_extra_food` queries at once.
+
+        Queries with the same `s`, `k` and `x` share one search.
+
+        :param queries - (s, t, k, x) tuples.
+        :returns the result `exists_path_with_extra_food(s, t, k, x)` would
+        give for every query, in the same order as `queries`.
+        """
+        queries = list(queries)
+        results = [False] * len(queries)
+        groups: Dict[Tuple[Vertex, int, int], List[int]] = {}
+
+        for i, (s, t, k, x) in enumerate(queries):
+            if self._valid_query(s, t, k, x):
+                groups.setdefault((s, k, x), []).append(i)
+
+        for (s, k, x), members in groups.items():
+            plans = self._plans_from(
+                s,
+                [queries[i][1] for i in members],
+                k,
+                x
+            )
+            for i in members:
+                results[i] = queries[i][1] in plans
+        return results
+
+    def _valid_query(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int = 0
+    ) -> bool:
+        """
+        Checks the parameters of a path query, and that `s` and `t` are not
+        known to be in different components.
+        """
+        if not self._valid_params(s, t, k, x):
             return False
-        if s == None:
+        if self._connectivity is not None:
+            if not self._connectivity.connected(s, t):
+                return False
+        return True
+
+    def _valid_params(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int = 0
+    ) -> bool:
+        """
+        Checks the parameters of a path query, whether or not a path can
+        exist right now.
+        """
+        if k < 0 or x < 0:
             return False
-        if t == None:
+        if s is None or t is None:
             return False
+        return s in self._index and t in self._index
+
+    def _heuristic_to(
+            self,
+            t: Vertex,
+            heuristic: Union[Callable[[Vertex, Vertex], int], None]
+    ) -> Callable[[Vertex], int]:
+        """
+        The lower bound on the hops to `t` that an "astar" search uses.
+        """
+        if heuristic is not None:
+            return lambda v: heuristic(v, t)
+        if self._landmarks is not None:
+            return self._landmarks.heuristic_to(t)
+        return lambda v: 0
+
+    def _on_backend(
+            self,
+            find: Callable[..., Union[List, None]],
+            s: Vertex,
+            t: Vertex,
+            *args: int,
+            **kwargs
+    ) -> Union[List[Vertex], None]:
+        """
+        Runs a single path search from `search` on whichever backend this
+        maze uses, as `find(s, t, *args, neighbours, has_food, **kwargs)`.
+        """
+        if not self.compact:
+            return find(
+                s,
+                t,
+                *args,
+                self._counted(_edges),
+                _has_food,
+                **kwargs
+            )
+
+        view = self.compact_view()
+        path = find(
+            self._index[s],
+            self._index[t],
+            *args,
+            self._counted(view.neighbours),
+            view.has_food,
+            **kwargs
+        )
+        if path is None:
+            return None
+        return [self.vertices[i] for i in path]
+
+    def _plan_on_backend(
+            self,
+            find: Callable[..., Union[Tuple[List, List], None]],
+            s: Vertex,
+            t: Vertex,
+            *args: int
+    ) -> Union[Tuple[List[Vertex], List[Vertex]], None]:
+        """
+        Runs a search from `search` that returns a (path, placements) plan
+        on whichever backend this maze uses.
+        """
+        if not self.compact:
+            return find(s, t, *args, self._counted(_edges), _has_food)
+
+        view = self.compact_view()
+        plan = find(
+            self._index[s],
+            self._index[t],
+            *args,
+            self._counted(view.neighbours),
+            view.has_food
+        )
+        if plan is None:
+            return None
+        vertices = self.vertices
+        return [vertices[i] for i in plan[0]], [vertices[i] for i in plan[1]]
+
+    def _counted(self, neighbours: Callable) -> Callable:
+        """
+        `neighbours`, counting the calls as expansions of the query being
+        measured, if there is one.
+        """
+        record = self._record
+        if record is None:
+            return neighbours
+
+        def counted(v):
+            record.expanded += 1
+            return neighbours(v)
+
+        return counted
+
+    def _measured(self, query: str, run: Callable, *args) -> object:
+        """
+        Calls `run(*args)` (a public query method) with a `QueryStats` record
+        for the searches to fill in, and hands the record to the recorder.
+        """
+        record = QueryStats(query)
+        self._record = record
+        start = time.perf_counter()
+        try:
+            result = run(*args)
+        finally:
+            record.seconds = time.perf_counter() - start
+            self._record = None
+
+        path = result[0] if isinstance(result, tuple) else result
+        if isinstance(path, list):
+            record.path_length = len(path) - 1
+        self._stats.add(record)
+        return result
+
+    def _paths_from(
+            self,
+            s: Vertex,
+            targets: List[Vertex],
+            k: int
+    ) -> Dict[Vertex, List[Vertex]]:
+        """
+        Runs `search.find_paths` on whichever backend this maze uses, or
+        looks the paths up in the search from `reachable_from(s, k)`.
+        """
+        tree = None if self.exhaustive else self._tree((s, k, 0))
+        if tree is not None:
+            plans = self._tree_plans(tree, targets)
+            return {t: path for t, (path, _) in plans.items()}
+
+        if not self.compact:
+            return search.find_paths(
+                s,
+                targets,
+                k,
+                _edges,
+                _has_food,
+                self._record,
+                self.exhaustive
+            )
+
+        index = self._index
+        vertices = self.vertices
+        found = self.compact_view().find_paths(
+            index[s],
+            [index[t] for t in targets],
+            k,
+            self._record,
+            self.exhaustive
+        )
+        return {
+            vertices[t]: [vertices[i] for i in path]
+            for t, path in found.items()
+        }
+
+    def _plans_from(
+            self,
+            s: Vertex,
+            targets: List[Vertex],
+            k: int,
+            x: int
+    ) -> Dict[Vertex, Tuple[List[Vertex], List[Vertex]]]:
+        """
+        Runs `search.find_paths_with_extra_food` on whichever backend this
+        maze uses, or looks the plans up in the search from
+        `reachable_from(s, k, x)`.
+        """
+        tree = None if self.exhaustive else self._tree((s, k, x))
+        if tree is not None:
+            return self._tree_plans(tree, targets)
+
+        if not self.compact:
+            return search.find_paths_with_extra_food(
+                s,
+                targets,
+                k,
+                x,
+                _edges,
+                _has_food,
+                self._record,
+                self.exhaustive
+            )
+
+        index = self._index
+        vertices = self.vertices
+        found = self.compact_view().find_paths_with_extra_food(
+            index[s],
+            [index[t] for t in targets],
+            k,
+            x,
+            self._record,
+            self.exhaustive
+        )
+        return {
+            vertices[t]: (
+                [vertices[i] for i in path],
+                [vertices[i] for i in placed]
+            )
+            for t, (path, placed) in found.items()
+        }
+
+    def _tree(
+            self,
+            key: Tuple[Vertex, int, int]
+    ) -> Union[tuple, None]:
+        """
+        The kept `search.reach` result for an (s, k, x) key, if the graph
+        hasn't changed since it was made.
+        """
+        if self._trees_version != self._version:
+            self._trees = {}
+            self._trees_version = self._version
+        return self._trees.get(key)
+
+    def _tree_plans(
+            self,
+            tree: tuple,
+            targets: List[Vertex]
+    ) -> Dict[Vertex, Tuple[List[Vertex], List[Vertex]]]:
+        """
+        Looks up the plan to every target in a kept `search.reach` result.
+        """
+        reached, parent = tree
+        if not self.compact:
+            plans = {}
+            for t in targets:
+                plan = search.reach_plan(reached, parent, t)
+                if plan is not None:
+                    plans[t] = plan
+            return plans
 
-        for v in self.vertices:
-            v.visited = False
-            v.count = 0
-        queue: List[List[Vertex]] = []
-        count: int = 0
-
-        s.visited = True
-        s.food = x
-        queue.append([s])
-
-        while queue:
-            path = queue.pop(0)  # dequeue
-            curr = path[-1]
-            count = curr.count
-            x = curr.food
-            for i in curr.edges:
-                if i == t and count < k:
-                    return True
-            for adjacent in curr.edges:
-                if adjacent.visited == False:
-                    adjacent.food = curr.food
-                    if adjacent.has_food == True:
-                        adjacent.count = 0
-                        count = adjacent.count
-                    else:
-                        adjacent.count = curr.count + 1
-                        count = adjacent.count
-
-                    if count >= k and x == 0:
-                        break
-                    if count >= k and x > 0:
-                        adjacent.food -= 1
-                        adjacent.count = 0
-                        count = 0
-                    if count < k:
-                        new_path = list(path)
-                        new_path.append(adjacent)
-                        queue.append(new_path)
-                        adjacent.visited = True
-        return False
-    #     if k < 0:
-    #         return False
-    #
-    #     if s is None:
-    #         return False
-    #     if t is None:
-    #         return False
-    #
-    #     for i in range(len(self.vertices)):
-    #         self.vertices[i].visited = False
-    #
-    #     food = x
-    #     supply = k
-    #
-    #     start = s
-    #     end = t
-    #
-    #     for i in range(len(self.vertices)):
-    #         if self.vertices[i] == s:
-    #             start = s
-    #         if self.vertices[i] == t:
-    #             end = t
-    #
-    #     if start and end is not None:
-    #         start.visited = True
-    #         return self.dfs1(k, supply, food, start, end)
-    #
-    # def dfs1(self, k: int, supply: int, food: int, v: Vertex, end: Vertex) -> bool:
-    #     for x in range(len(v.edges)):
-    #         if v.edges[x] == end:
-    #             return True
-    #     if k == 0:
-    #         if food != 0:
-    #             k = supply
-    #             food = food - 1
-    #         else:
-    #             return False
-    #     for i in range(len(v.edges)):
-    #         if not v.edges[i].visited:
-    #             v.edges[i].visited = True
-    #             if v.edges[i].has_food:
-    #                 k = supply
-    #             k = k - 1
-    #             return self.dfs1(k, supply, food, v.edges[i], end)
-    #     return False
+        index = self._index
+        vertices = self.vertices
+        plans = {}
+        for t in targets:
+            plan = search.reach_plan(reached, parent, index[t])
+            if plan is not None:
+                plans[t] = (
+                    [vertices[i] for i in plan[0]],
+                    [vertices[i] for i in plan[1]]
+                )
+        return plans
@@ -0,0 +1,153 @@
+"""
+Landmarks
+=========
+
+Landmark (ALT) distance bounds for steering `find_path` towards its
+destination.
+
+A few landmark locations are picked and the hop distance from each of them
+to every location is stored. By the triangle inequality
+
+    d(v, t) >= |d(l, t) - d(l, v)|
+
+for every landmark `l`, and the largest of these bounds is used as the A*
+heuristic in `search.find_path_astar`.
+
+Blocking an edge can only make distances longer, so the stored distances
+stay valid lower bounds. Fixing an edge can make them shorter, so the
+distances are rebuilt before the next estimate.
+"""
+
+from collections import deque
+from typing import Callable, Dict, Iterable, List
+
+from search import Neighbours, Node
+
+
+class Landmarks:
+    """
+    Landmarks
+    ---------
+
+    Hop distances from a handful of landmarks, kept valid through
+    `maze_changed`.
+
+    ===== Functions =====
+
+        * estimate(v, t) - a lower bound on the hops from `v` to `t`.
+        * heuristic_to(t) - `estimate(., t)` as a one argument function.
+        * maze_changed(changes) - marks the distances stale after a fix.
+    """
+
+    def __init__(
+            self,
+            nodes: Callable[[], Iterable[Node]],
+            neighbours: Neighbours,
+            count: int = 8
+    ) -> None:
+        """
+        Sets up the landmarks, they are picked and measured on first use.
+
+        :param nodes - Returns every location in the maze.
+        :param neighbours - Returns the locations connected to a location.
+        :param count - The number of landmarks to use.
+        """
+        self.count = count
+        self._nodes = nodes
+        self._neighbours = neighbours
+        self.landmarks: List[Node] = []
+        self._distances: List[Dict[Node, int]] = []
+        self._stale = True
+
+    def _bfs(self, source: Node) -> Dict[Node, int]:
+        """
+        Hop distances from `source` to every location it can reach.
+        """
+        distances = {source: 0}
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            d = distances[v] + 1
+            for w in self._neighbours(v):
+                if w not in distances:
+                    distances[w] = d
+                    queue.append(w)
+        return distances
+
+    def _build(self) -> None:
+        """
+        Picks landmarks by farthest-point selection: each new landmark is the
+        location farthest from the ones picked so far, preferring locations
+        none of them can reach.
+        """
+        nodes = list(self._nodes())
+        self.landmarks = []
+        self._distances = []
+        self._stale = False
+        if not nodes:
+            return
+
+        closest = {v: None for v in nodes}
+        pick = nodes[0]
+        for _ in range(min(self.count, len(nodes))):
+            distances = self._bfs(pick)
+            self.landmarks.append(pick)
+            self._distances.append(distances)
+
+            pick = None
+            farthest = -1
+            for v in nodes:
+                d = distances.get(v)
+                if d is not None and (closest[v] is None or d < closest[v]):
+                    closest[v] = d
+                far = float("inf") if closest[v] is None else closest[v]
+                if far > farthest:
+                    pick, farthest = v, far
+            if farthest <= 0:
+                break
+
+    def estimate(self, v: Node, t: Node) -> int:
+        """
+        :param v - A location.
+        :param t - The destination.
+        :return a lower bound on the number of hops from `v` to `t`.
+        """
+        return self.heuristic_to(t)(v)
+
+    def heuristic_to(self, t: Node) -> Callable[[Node], int]:
+        """
+        :param t - The destination.
+        :return a function giving the lower bound on the hops from a
+        location to `t`.
+        """
+        if self._stale:
+            self._build()
+        rows = [
+            (distances, distances[t])
+            for distances in self._distances
+            if t in distances
+        ]
+
+        def heuristic(v: Node) -> int:
+            bound = 0
+            for distances, dt in rows:
+                dv = distances.get(v)
+                if dv is None:
+                    continue
+                diff = dv - dt if dv > dt else dt - dv
+                if diff > bound:
+                    bound = diff
+            return bound
+
+        return heuristic
+
+    def maze_changed(self, changes: List[tuple]) -> None:
+        """
+        Marks the distances stale if an edge was fixed.
+
+        :param changes - (operation, u, v) tuples, as sent by `QuokkaMaze`.
+        """
+        for op, _, _ in changes:
+            if op == "fix_edge":
+                self._stale = True
+                return
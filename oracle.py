@@ -0,0 +1,243 @@
+"""
+Food Oracle
+===========
+
+A food-hop index for answering many `find_path(s, t, k)` queries with the
+same `k`.
+
+Two locations with food are linked in the food-hop graph when one can be
+reached from the other in at most `k` steps without passing another location
+with food. Every valid route is a chain of such hops, so a query only has to
+search the (much smaller) food-hop graph, weighing every hop by its length,
+and then expand each hop back into the locations it walks through.
+
+The rows of the index are built lazily, and `fix_edge`/`block_edge` only
+drop the rows of the locations with food within `k - 1` steps of the change.
+"""
+
+import heapq
+from typing import Dict, List, Tuple, Union
+
+import search
+from search import HasFood, Neighbours, Node
+
+
+class FoodOracle:
+    """
+    Food Oracle
+    -----------
+
+    Food-hop index for a fixed `k`, kept up to date through `maze_changed`.
+
+    ===== Functions =====
+
+        * row(f) - the locations with food one hop away from `f`, each with
+            the locations walked through to get there.
+        * find_path(s, t) - `QuokkaMaze.find_path(s, t, k)` through the index.
+        * maze_changed(changes) - drops the rows an edge change can affect.
+
+    ===== Notes ======
+
+    * Queries run Dijkstra over the hops, each weighing one more than the
+        locations it walks through, so the route found has the fewest hops
+        in the maze, not the fewest hops between locations with food.
+    * Hops are expanded into real paths lazily. When two hops share a
+        location the expanded path would not be simple, so the full search in
+        `search.find_path` answers that query instead.
+    """
+
+    def __init__(
+            self,
+            k: int,
+            neighbours: Neighbours,
+            has_food: HasFood
+    ) -> None:
+        """
+        Initialises an empty index, rows are filled in on first use.
+
+        :param k - The maximum number of hops between locations with food.
+        :param neighbours - Returns the locations connected to a location.
+        :param has_food - Returns whether a location has food.
+        """
+        self.k = k
+        self._neighbours = neighbours
+        self._has_food = has_food
+        self._rows: Dict[Node, Dict[Node, Tuple[Node, ...]]] = {}
+
+    def _scan(
+            self,
+            f: Node,
+            extra: Union[Node, None] = None
+    ) -> Dict[Node, Tuple[Node, ...]]:
+        """
+        BFS from `f` through locations without food, up to `k` steps.
+
+        :param f - The location to start from.
+        :param extra - A location to stop at as if it had food.
+        :return the locations with food that were reached, each mapped to
+        the locations walked through between `f` and it.
+        """
+        parent: Dict[Node, Union[Node, None]] = {f: None}
+        found: Dict[Node, Tuple[Node, ...]] = {}
+        frontier = [f]
+
+        for depth in range(1, self.k + 1):
+            next_frontier = []
+            for v in frontier:
+                for w in self._neighbours(v):
+                    if w in parent or w in found:
+                        continue
+                    if w == extra or self._has_food(w):
+                        found[w] = self._walk(parent, v)
+                    elif depth < self.k:
+                        parent[w] = v
+                        next_frontier.append(w)
+            frontier = next_frontier
+        return found
+
+    @staticmethod
+    def _walk(
+            parent: Dict[Node, Union[Node, None]],
+            v: Node
+    ) -> Tuple[Node, ...]:
+        """
+        The locations from just after the start of a scan up to `v`.
+        """
+        walk = []
+        while parent[v] is not None:
+            walk.append(v)
+            v = parent[v]
+        walk.reverse()
+        return tuple(walk)
+
+    def _near(self, v: Node) -> List[Node]:
+        """
+        The locations with food whose hops can pass through `v`, that is the
+        ones within `k - 1` steps of it without food in between.
+        """
+        if self._has_food(v):
+            return [v]
+
+        found = []
+        seen = {v}
+        frontier = [v]
+        for depth in range(1, self.k):
+            next_frontier = []
+            for u in frontier:
+                for w in self._neighbours(u):
+                    if w in seen:
+                        continue
+                    seen.add(w)
+                    if self._has_food(w):
+                        found.append(w)
+                    else:
+                        next_frontier.append(w)
+            frontier = next_frontier
+        return found
+
+    def row(self, f: Node) -> Dict[Node, Tuple[Node, ...]]:
+        """
+        Returns the hops out of `f`, building them if needed.
+
+        :param f - A location with food.
+        :return the locations with food one hop away, each mapped to the
+        locations walked through to get there.
+        """
+        row = self._rows.get(f)
+        if row is None:
+            row = self._rows[f] = self._scan(f)
+        return row
+
+    def maze_changed(self, changes: List[tuple]) -> None:
+        """
+        Drops the rows that the changed edges can be part of.
+
+        :param changes - (operation, u, v) tuples, as sent by `QuokkaMaze`.
+        """
+        for op, u, v in changes:
+            if op == "add_vertex":
+                continue
+            for end in (u, v):
+                for f in self._near(end):
+                    self._rows.pop(f, None)
+
+    def find_path(self, s: Node, t: Node) -> Union[List[Node], None]:
+        """
+        Finds a simple path from `s` to `t` such that from any location with
+        food we reach the next location with food in at most `k` steps.
+
+        :param s - The start location.
+        :param t - The destination.
+        :returns the locations from `s` to `t`, or None if there is no such
+        path.
+        """
+        if s == t:
+            return [s]
+
+        # The start and destination count as food, even when they have none.
+        start = self.row(s) if self._has_food(s) else self._scan(s)
+        into_t = self._scan(t, s)
+
+        # Dijkstra over the hops, each weighing the locations it walks, so
+        # the chain found is the shortest route rather than the one with the
+        # fewest hops. `t` is only ever reached through `into_t`.
+        parent: Dict[Node, Union[Node, None]] = {s: None}
+        hops: Dict[Node, int] = {s: 0}
+        heap = [(0, 0, s)]
+        order = 1
+        done = set()
+        while heap:
+            d, _, g = heapq.heappop(heap)
+            if g in done:
+                continue
+            done.add(g)
+            if g == t:
+                g = parent[t]
+                path = self._expand(parent, g, start)
+                path.extend(reversed(into_t[g]))
+                path.append(t)
+                if len(set(path)) == len(path):
+                    return path
+                return search.find_path(
+                    s,
+                    t,
+                    self.k,
+                    self._neighbours,
+                    self._has_food
+                )
+
+            row = start if g == s else self.row(g)
+            moves = [(h, len(walk) + 1) for h, walk in row.items() if h != t]
+            if g in into_t:
+                moves.append((t, len(into_t[g]) + 1))
+            for h, cost in moves:
+                if h in done:
+                    continue
+                if h not in hops or d + cost < hops[h]:
+                    hops[h] = d + cost
+                    parent[h] = g
+                    heapq.heappush(heap, (d + cost, order, h))
+                    order += 1
+        return None
+
+    def _expand(
+            self,
+            parent: Dict[Node, Union[Node, None]],
+            g: Node,
+            start: Dict[Node, Tuple[Node, ...]]
+    ) -> List[Node]:
+        """
+        Expands the chain of hops from the start of the query to `g` into the
+        locations walked through.
+        """
+        hops = [g]
+        while parent[hops[-1]] is not None:
+            hops.append(parent[hops[-1]])
+        hops.reverse()
+
+        path = [hops[0]]
+        for a, b in zip(hops, hops[1:]):
+            row = start if a == hops[0] else self.row(a)
+            path.extend(row[b])
+            path.append(b)
+        return path
@@ -0,0 +1,210 @@
+"""
+Parallel Queries
+================
+
+Runs `find_path` and `exists_path_with_extra_food` queries on a pool of
+worker processes.
+
+The maze is published once: it is saved in the compact on-disk format and
+every worker maps that file with `CompactMaze.open`, so the workers share the
+page cache instead of each holding a copy of the maze. Queries are sent as
+ids (positions in `QuokkaMaze.vertices`) and the id paths that come back are
+mapped to the caller's `Vertex` objects.
+"""
+
+import multiprocessing
+import os
+import tempfile
+from typing import Dict, Iterable, List, Tuple, Union
+
+from compact import CompactMaze
+from graph import QuokkaMaze
+from vertex import Vertex
+
+# The maze a worker process answers queries on, set by `_open_worker`.
+_worker_view = None
+
+
+def _open_worker(path: str) -> None:
+    """
+    Pool initialiser, maps the published maze into this worker.
+    """
+    global _worker_view
+    _worker_view = CompactMaze.open(path)
+
+
+def _find_paths_chunk(
+        chunk: List[Tuple[int, List[int], int]]
+) -> List[Dict[int, List[int]]]:
+    """
+    Runs one shared `find_paths` search per (s, targets, k) group.
+    """
+    return [_worker_view.find_paths(s, targets, k) for s, targets, k in chunk]
+
+
+def _exists_chunk(
+        chunk: List[Tuple[int, List[int], int, int]]
+) -> List[List[int]]:
+    """
+    Runs one shared extra food search per (s, targets, k, x) group and
+    returns the targets that can be reached.
+    """
+    return [
+        list(_worker_view.find_paths_with_extra_food(s, targets, k, x))
+        for s, targets, k, x in chunk
+    ]
+
+
+class QueryPool:
+    """
+    Query Pool
+    ----------
+
+    A pool of worker processes answering queries on a published maze.
+
+    ===== Functions =====
+
+        * find_paths(queries) - `QuokkaMaze.find_paths` on the workers.
+        * exists_paths_with_extra_food(queries) -
+            `QuokkaMaze.exists_paths_with_extra_food` on the workers.
+        * close() - stops the workers and removes the published file.
+
+    ===== Notes ======
+
+    * If the maze changes, the next call publishes it again and restarts
+        the workers, so answers are never taken from an old copy.
+    * Food-hop indexes of the maze are not used by the workers, but its
+        connectivity labels still turn down queries between components.
+    """
+
+    def __init__(self, maze: QuokkaMaze, processes: int = None) -> None:
+        """
+        Sets up a pool for `maze`. The maze is published and the workers are
+        started by the first batch of queries.
+
+        :param maze - The maze to answer queries on.
+        :param processes - The number of workers, defaults to the number of
+        CPUs.
+        """
+        self.maze = maze
+        self.processes = processes or os.cpu_count() or 1
+        self._pool = None
+        self._path = None
+        self._version = -1
+
+    def _publish(self) -> None:
+        """
+        Saves the current maze and (re)starts the workers on it.
+        """
+        if self._pool is not None and self._version == self.maze._version:
+            return
+        self.close()
+
+        fd, self._path = tempfile.mkstemp(suffix=".qmaz")
+        os.close(fd)
+        self.maze.save(self._path)
+        self._version = self.maze._version
+        self._pool = multiprocessing.Pool(
+            self.processes,
+            initializer=_open_worker,
+            initargs=(self._path,)
+        )
+
+    def _chunks(self, groups: list) -> List[list]:
+        """
+        Deals the groups out into a few chunks per worker.
+        """
+        count = min(len(groups), 4 * self.processes)
+        return [groups[i::count] for i in range(count)]
+
+    def find_paths(
+            self,
+            queries: Iterable[Tuple[Vertex, Vertex, int]]
+    ) -> List[Union[List[Vertex], None]]:
+        """
+        Answers many `find_path` queries on the workers.
+
+        :param queries - (s, t, k) tuples.
+        :returns the result `find_path(s, t, k)` would give for every query,
+        in the same order as `queries`.
+        """
+        self._publish()
+        maze = self.maze
+        index = maze._index
+        vertices = maze.vertices
+
+        queries = list(queries)
+        results: List[Union[List[Vertex], None]] = [None] * len(queries)
+        members: Dict[Tuple[int, int], List[int]] = {}
+        for i, (s, t, k) in enumerate(queries):
+            if maze._valid_query(s, t, k):
+                members.setdefault((index[s], k), []).append(i)
+
+        groups = [
+            (s, [index[queries[i][1]] for i in group], k)
+            for (s, k), group in members.items()
+        ]
+        chunks = self._chunks(groups)
+        answers = self._pool.map(_find_paths_chunk, chunks)
+
+        for chunk, found in zip(chunks, answers):
+            for (s, targets, k), paths in zip(chunk, found):
+                for i in members[(s, k)]:
+                    path = paths.get(index[queries[i][1]])
+                    if path is not None:
+                        results[i] = [vertices[j] for j in path]
+        return results
+
+    def exists_paths_with_extra_food(
+            self,
+            queries: Iterable[Tuple[Vertex, Vertex, int, int]]
+    ) -> List[bool]:
+        """
+        Answers many `exists_path_with_extra_food` queries on the workers.
+
+        :param queries - (s, t, k, x) tuples.
+        :returns the result `exists_path_with_extra_food(s, t, k, x)` would
+        give for every query, in the same order as `queries`.
+        """
+        self._publish()
+        maze = self.maze
+        index = maze._index
+
+        queries = list(queries)
+        results = [False] * len(queries)
+        members: Dict[Tuple[int, int, int], List[int]] = {}
+        for i, (s, t, k, x) in enumerate(queries):
+            if maze._valid_query(s, t, k, x):
+                members.setdefault((index[s], k, x), []).append(i)
+
+        groups = [
+            (s, [index[queries[i][1]] for i in group], k, x)
+            for (s, k, x), group in members.items()
+        ]
+        chunks = self._chunks(groups)
+        answers = self._pool.map(_exists_chunk, chunks)
+
+        for chunk, found in zip(chunks, answers):
+            for (s, targets, k, x), reached in zip(chunk, found):
+                reached = set(reached)
+                for i in members[(s, k, x)]:
+                    results[i] = index[queries[i][1]] in reached
+        return results
+
+    def close(self) -> None:
+        """
+        Stops the workers and removes the published maze.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._path is not None:
+            os.remove(self._path)
+            self._path = None
+
+    def __enter__(self) -> 'QueryPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
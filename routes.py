@@ -0,0 +1,250 @@
+"""
+Routes
+======
+
+Keeps handed out `find_path` routes valid while edges are blocked.
+
+Every tracked route is filed under the edges it walks, so a `block_edge`
+only touches the routes that used that edge. A broken route is repaired
+locally: the nearest locations with food (or the ends of the route) on
+either side of the break are anchors that the rest of the route is still
+valid up to, so only a detour between the two anchors has to be found,
+avoiding the locations the kept parts of the route use. If there is no such
+detour the anchors move one location with food further out, and after
+`window` tries the whole route is searched for again.
+
+A repaired route is valid and simple, but may have more hops than a fresh
+`find_path` would give. Fixing an edge never breaks a route, it only gives
+the routes that were lost another try.
+"""
+
+from typing import Dict, List, Set, Tuple, Union
+
+import search
+from search import HasFood, Neighbours, Node
+
+Route = Tuple[Node, Node, int, Union[List[Node], None]]
+
+
+def _key(u: Node, v: Node) -> Tuple[Node, Node]:
+    """
+    The same key for both directions of an edge.
+    """
+    return (u, v) if id(u) < id(v) else (v, u)
+
+
+class Routes:
+    """
+    Routes
+    ------
+
+    Tracked routes, repaired through `maze_changed`.
+
+    ===== Functions =====
+
+        * add(s, t, k, path) - tracks a route, returns its id.
+        * path(route) - the current path of a route, None if it was lost.
+        * remove(route) - stops tracking a route.
+        * maze_changed(changes) - repairs the routes a blocked edge broke.
+
+    ===== Notes ======
+
+    * `local_repairs`, `full_repairs` and `lost` count how each broken route
+        was handled.
+    """
+
+    def __init__(
+            self,
+            neighbours: Neighbours,
+            has_food: HasFood,
+            window: int = 3
+    ) -> None:
+        """
+        :param neighbours - Returns the locations connected to a location.
+        :param has_food - Returns whether a location has food.
+        :param window - The number of detours to try before searching for
+        the whole route again.
+        """
+        self.window = window
+        self._neighbours = neighbours
+        self._has_food = has_food
+        self._routes: Dict[int, Route] = {}
+        self._by_edge: Dict[Tuple[Node, Node], Set[int]] = {}
+        self._lost: Set[int] = set()
+        self._next = 0
+        self.local_repairs = 0
+        self.full_repairs = 0
+        self.lost = 0
+
+    def add(
+            self,
+            s: Node,
+            t: Node,
+            k: int,
+            path: Union[List[Node], None]
+    ) -> int:
+        """
+        :param s - The start of the route.
+        :param t - The destination of the route.
+        :param k - The maximum number of hops between locations with food.
+        :param path - The path handed out for the route, or None.
+        :return the id of the route.
+        """
+        route = self._next
+        self._next += 1
+        self._set(route, (s, t, k, path))
+        return route
+
+    def path(self, route: int) -> Union[List[Node], None]:
+        """
+        :param route - The id of a tracked route.
+        :return the current path of the route, or None if it was lost (or
+        isn't tracked).
+        """
+        entry = self._routes.get(route)
+        if entry is None or entry[3] is None:
+            return None
+        return list(entry[3])
+
+    def remove(self, route: int) -> bool:
+        """
+        :param route - The id of a tracked route.
+        :return true if the route was tracked, else false.
+        """
+        if route not in self._routes:
+            return False
+        self._unfile(route)
+        del self._routes[route]
+        self._lost.discard(route)
+        return True
+
+    def _set(self, route: int, entry: Route) -> None:
+        """
+        Stores a route and files it under the edges of its path.
+        """
+        self._routes[route] = entry
+        path = entry[3]
+        if path is None:
+            self._lost.add(route)
+            return
+        self._lost.discard(route)
+        by_edge = self._by_edge
+        for u, v in zip(path, path[1:]):
+            by_edge.setdefault(_key(u, v), set()).add(route)
+
+    def _unfile(self, route: int) -> None:
+        """
+        Removes a route from the edges of its path.
+        """
+        path = self._routes[route][3]
+        if path is None:
+            return
+        by_edge = self._by_edge
+        for u, v in zip(path, path[1:]):
+            key = _key(u, v)
+            routes = by_edge.get(key)
+            if routes is not None:
+                routes.discard(route)
+                if not routes:
+                    del by_edge[key]
+
+    def _detour(
+            self,
+            path: List[Node],
+            broken: int,
+            k: int
+    ) -> Union[List[Node], None]:
+        """
+        Repairs `path`, whose edge from `path[broken]` to `path[broken + 1]`
+        is gone, by finding detours between widening anchors. Gives up (None)
+        once the anchors are the ends of the route.
+        """
+        has_food = self._has_food
+        neighbours = self._neighbours
+        anchors = [0]
+        anchors.extend(
+            i for i in range(1, len(path) - 1) if has_food(path[i])
+        )
+        anchors.append(len(path) - 1)
+
+        left = max(a for a, i in enumerate(anchors) if i <= broken)
+        right = left + 1
+        for _ in range(self.window):
+            lo, hi = anchors[left], anchors[right]
+            if lo == 0 and hi == len(path) - 1:
+                return None
+            avoid = set(path[:lo])
+            avoid.update(path[hi + 1:])
+            detour = search.find_path(
+                path[lo],
+                path[hi],
+                k,
+                lambda v: [w for w in neighbours(v) if w not in avoid],
+                has_food
+            )
+            if detour is not None:
+                return path[:lo] + detour + path[hi + 1:]
+            left = max(left - 1, 0)
+            right = min(right + 1, len(anchors) - 1)
+        return None
+
+    def _repair(self, route: int, u: Node, v: Node) -> None:
+        """
+        Repairs a route whose path used the edge between `u` and `v`.
+        """
+        s, t, k, path = self._routes[route]
+        self._unfile(route)
+        broken = next(
+            i for i in range(len(path) - 1)
+            if _key(path[i], path[i + 1]) == _key(u, v)
+        )
+
+        repaired = self._detour(path, broken, k)
+        if repaired is not None:
+            self.local_repairs += 1
+        else:
+            repaired = search.find_path(
+                s,
+                t,
+                k,
+                self._neighbours,
+                self._has_food
+            )
+            if repaired is not None:
+                self.full_repairs += 1
+            else:
+                self.lost += 1
+        self._set(route, (s, t, k, repaired))
+
+    def _retry(self) -> None:
+        """
+        Searches again for the routes that were lost.
+        """
+        for route in list(self._lost):
+            s, t, k, _ = self._routes[route]
+            path = search.find_path(
+                s,
+                t,
+                k,
+                self._neighbours,
+                self._has_food
+            )
+            if path is not None:
+                self._set(route, (s, t, k, path))
+
+    def maze_changed(self, changes: List[tuple]) -> None:
+        """
+        Repairs the routes that used a blocked edge, and retries the lost
+        routes after an edge is fixed.
+
+        :param changes - (operation, u, v) tuples, as sent by `QuokkaMaze`.
+        """
+        fixed = False
+        for op, u, v in changes:
+            if op == "block_edge":
+                for route in self._by_edge.pop(_key(u, v), ()):
+                    self._repair(route, u, v)
+            elif op == "fix_edge":
+                fixed = True
+        if fixed and self._lost:
+            self._retry()
@@ -0,0 +1,1167 @@
+"""
+Search
+======
+
+The path searches behind `QuokkaMaze` and `CompactMaze`.
+
+Both mazes describe their graph with two callables, so the same searches run
+on `Vertex` objects and on integer ids:
+
+    * `neighbours(v)` - the locations connected to `v`.
+    * `has_food(v)` - whether `v` has food.
+
+A search state is a location together with the number of steps taken since
+the last location with food (and, with extra food, how much of it has been
+placed so far). The start and the destination are always treated as having
+food.
+
+A state is dropped when the same location has already been reached with a
+state that is at least as good (no more steps since food and no more extra
+food used), so every location is queued at most `k` times (`k * (x + 1)`
+with extra food). The parent chain of every state is kept simple: a location
+that is already on it is never added again, so the returned paths are always
+SIMPLE paths. Checking that walks back along the chain, but only as far as
+the depth the location was first reached at, so a search costs O(V * k * d)
+for routes of up to `d` hops rather than O(V * k).
+
+Without that check the searches would be exact for walks, which may repeat
+locations. With it they can turn down the only state that leads on to a
+simple path, so they can miss a route that exists (they never return one
+that isn't valid). Telling for sure is a search over simple paths, which
+takes exponential time on some mazes, so it is opt-in: given a `budget`,
+the searches that turned a state down and missed a destination hand it to
+`_complete`, a depth-first search over simple paths pruned by the cheapest
+walk from every state to the destination (`_costs_to`). It gives up (and
+the destination stays missed) after entering `budget` states, and its paths
+don't always have the fewest hops.
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+    Union
+)
+
+from stats import QueryStats
+
+Node = TypeVar('Node', bound=Hashable)
+
+Neighbours = Callable[[Node], Iterable[Node]]
+HasFood = Callable[[Node], bool]
+
+
+def _on_chain(parent: dict, state: tuple, node: Node, limit: int) -> bool:
+    """
+    Checks whether `node` is used by `state` or any of its ancestors.
+
+    Every state is one hop deeper than its parent, so when `state` is `d`
+    hops from the start and `node` was first reached at `d0` hops, only the
+    `limit = d - d0 + 1` states nearest to `state` need checking.
+    """
+    while state is not None and limit > 0:
+        if state[0] == node:
+            return True
+        state = parent[state]
+        limit -= 1
+    return False
+
+
+def _chain(parent: dict, state: tuple) -> List[tuple]:
+    """
+    Returns the states from the start of the search to `state`.
+    """
+    states = []
+    while state is not None:
+        states.append(state)
+        state = parent[state]
+    states.reverse()
+    return states
+
+
+def find_path(
+        s: Node,
+        t: Node,
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        budget: int = 0
+) -> Union[List[Node], None]:
+    """
+    Finds a simple path from `s` to `t` such that from any location with food
+    we reach the next location with food in at most `k` steps.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param k - The maximum number of hops between locations with food.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param budget - The most states `_complete` may enter, 0 for none.
+    :returns the locations from `s` to `t`, or None if there is no such path
+    (or none was found).
+    """
+    return find_paths(
+        s, [t], k, neighbours, has_food, budget=budget
+    ).get(t)
+
+
+def find_paths(
+        s: Node,
+        targets: Iterable[Node],
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        stats: Union[QueryStats, None] = None,
+        budget: int = 0
+) -> Dict[Node, List[Node]]:
+    """
+    Finds a simple path from `s` to each of `targets` such that from any
+    location with food we reach the next location with food in at most `k`
+    steps.
+
+    Searches over (location, steps since food) states in BFS order, so every
+    path returned has the fewest hops among the ones found. One search is
+    shared by all the targets and stops once they have all been reached. Each
+    target gets the same path as a search for it alone. With a `budget`,
+    targets it misses after turning a state down are handed to `_complete`.
+
+    :param s - The start location.
+    :param targets - The destinations.
+    :param k - The maximum number of hops between locations with food.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param stats - Counts the work done, if given.
+    :param budget - The most states `_complete` may enter per target, 0 for
+    none.
+    :returns the path to every target that was reached, by target.
+    """
+    found: Dict[Node, List[Node]] = {}
+    remaining = set(targets)
+    if s in remaining:
+        found[s] = [s]
+        remaining.discard(s)
+    if not remaining:
+        return found
+
+    parent: Dict[Tuple[Node, int], Union[Tuple[Node, int], None]] = {
+        (s, 0): None
+    }
+    turned_down = set()
+    for w, state in _reached(
+            s, k, neighbours, has_food, parent, 0, stats, turned_down
+    ):
+        if w in remaining:
+            found[w] = [u for u, _ in _chain(parent, state)] + [w]
+            remaining.discard(w)
+            if not remaining:
+                break
+    if stats is not None:
+        stats.pushed += len(parent) - 1
+
+    if turned_down and budget > 0:
+        for t in remaining:
+            plan = _complete(s, t, k, 0, neighbours, has_food, budget, stats)
+            if plan is not None:
+                found[t] = plan[0]
+    return found
+
+
+def _reached(
+        s: Node,
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        parent: dict,
+        pause: int = 0,
+        stats: Union[QueryStats, None] = None,
+        turned_down: Union[set, None] = None
+) -> Iterator[Tuple[Node, Tuple[Node, int]]]:
+    """
+    The search behind `find_paths`. Yields every location other than `s`
+    the first time it is reached, with the state it was reached from, and
+    fills in `parent` as it goes. With `pause`, also yields None (with the
+    current state) after every `pause` expansions. With `stats`, counts the
+    expansions and the largest queue. With `turned_down`, adds every
+    location whose state was dropped for already being on its chain.
+    """
+    seen = {s}
+    # Fewest steps since food a location has been queued with, and the hops
+    # it was first queued at.
+    best: Dict[Node, int] = {s: 0}
+    first: Dict[Node, int] = {s: 0}
+    queue = deque([((s, 0), 0)])
+    expanded = 0
+
+    while queue:
+        state, hops = queue.popleft()
+        v, steps = state
+        if steps >= k:
+            continue
+        if stats is not None:
+            stats.expanded += 1
+            if len(queue) >= stats.peak_frontier:
+                stats.peak_frontier = len(queue) + 1
+        if pause:
+            expanded += 1
+            if expanded == pause:
+                expanded = 0
+                yield None, state
+
+        for w in neighbours(v):
+            if w not in seen:
+                seen.add(w)
+                yield w, state
+
+            w_steps = 0 if has_food(w) else steps + 1
+            if w_steps >= k:
+                continue
+
+            queued = best.get(w)
+            if queued is None:
+                first[w] = hops + 1
+            elif queued <= w_steps:
+                continue
+            elif _on_chain(parent, state, w, hops - first[w] + 1):
+                if turned_down is not None:
+                    turned_down.add(w)
+                continue
+
+            best[w] = w_steps
+            parent[(w, w_steps)] = state
+            queue.append(((w, w_steps), hops + 1))
+
+
+def find_path_with_extra_food(
+        s: Node,
+        t: Node,
+        k: int,
+        x: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        budget: int = 0
+) -> Union[Tuple[List[Node], List[Node]], None]:
+    """
+    Finds a simple path from `s` to `t` such that from any location with food
+    we reach the next location with food in at most `k` steps, after placing
+    food at at most `x` new locations.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param k - The maximum number of hops between locations with food.
+    :param x - The maximum number of new locations to place food at.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param budget - The most states `_complete` may enter, 0 for none.
+    :returns a tuple of the locations from `s` to `t` and the locations on
+    it that need extra food, or None if there is no such path (or none was
+    found).
+    """
+    return find_paths_with_extra_food(
+        s,
+        [t],
+        k,
+        x,
+        neighbours,
+        has_food,
+        budget=budget
+    ).get(t)
+
+
+def find_paths_with_extra_food(
+        s: Node,
+        targets: Iterable[Node],
+        k: int,
+        x: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        stats: Union[QueryStats, None] = None,
+        budget: int = 0
+) -> Dict[Node, Tuple[List[Node], List[Node]]]:
+    """
+    Finds a simple path from `s` to each of `targets` such that from any
+    location with food we reach the next location with food in at most `k`
+    steps, after placing food at at most `x` new locations.
+
+    Searches over (location, steps since food, food placed) states, keeping
+    only the states of a location that no other state of it dominates. Like
+    `find_paths`, one search is shared by all the targets, and a `budget`
+    lets `_complete` look for the targets it missed. Nothing is written
+    back to the locations, the placements are only reported.
+
+    :param s - The start location.
+    :param targets - The destinations.
+    :param k - The maximum number of hops between locations with food.
+    :param x - The maximum number of new locations to place food at.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param stats - Counts the work done, if given.
+    :param budget - The most states `_complete` may enter per target, 0 for
+    none.
+    :returns a tuple of the path and the locations on it that need extra
+    food for every target that was reached, by target.
+    """
+    found: Dict[Node, Tuple[List[Node], List[Node]]] = {}
+    remaining = set(targets)
+    if s in remaining:
+        found[s] = ([s], [])
+        remaining.discard(s)
+    if not remaining:
+        return found
+
+    parent: Dict[
+        Tuple[Node, int, int],
+        Union[Tuple[Node, int, int], None]
+    ] = {(s, 0, 0): None}
+    turned_down = set()
+    for w, state in _reached_with_extra_food(
+            s, k, x, neighbours, has_food, parent, 0, stats, turned_down
+    ):
+        if w in remaining:
+            found[w] = _plan(parent, state, w)
+            remaining.discard(w)
+            if not remaining:
+                break
+    if stats is not None:
+        stats.pushed += len(parent) - 1
+
+    if turned_down and budget > 0:
+        for t in remaining:
+            plan = _complete(s, t, k, x, neighbours, has_food, budget, stats)
+            if plan is not None:
+                found[t] = plan
+    return found
+
+
+def _reached_with_extra_food(
+        s: Node,
+        k: int,
+        x: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        parent: dict,
+        pause: int = 0,
+        stats: Union[QueryStats, None] = None,
+        turned_down: Union[set, None] = None
+) -> Iterator[Tuple[Node, Tuple[Node, int, int]]]:
+    """
+    The search behind `find_paths_with_extra_food`. Yields every location
+    other than `s` the first time it is reached, with the state it was
+    reached from, and fills in `parent` as it goes. With `pause`, also
+    yields None (with the current state) after every `pause` expansions.
+    With `stats`, counts the expansions and the largest queue. With
+    `turned_down`, adds every location whose states were dropped for
+    already being on their chain.
+    """
+    seen = {s}
+    # steps since food -> fewest food placed, for the states of a location
+    # that are not dominated, and the hops a location was first queued at.
+    labels: Dict[Node, Dict[int, int]] = {s: {0: 0}}
+    first: Dict[Node, int] = {s: 0}
+    queue = deque([((s, 0, 0), 0)])
+    expanded = 0
+
+    while queue:
+        state, hops = queue.popleft()
+        v, steps, used = state
+        if steps >= k:
+            continue
+        if stats is not None:
+            stats.expanded += 1
+            if len(queue) >= stats.peak_frontier:
+                stats.peak_frontier = len(queue) + 1
+        if pause:
+            expanded += 1
+            if expanded == pause:
+                expanded = 0
+                yield None, state
+
+        for w in neighbours(v):
+            if w not in seen:
+                seen.add(w)
+                yield w, state
+
+            if has_food(w):
+                options = [(0, used)]
+            else:
+                options = []
+                if steps + 1 < k:
+                    options.append((steps + 1, used))
+                if used < x:
+                    options.append((0, used + 1))
+
+            w_labels = labels.get(w)
+            checked = False
+            for w_steps, w_used in options:
+                if w_labels is None:
+                    w_labels = labels[w] = {}
+                    first[w] = hops + 1
+                    checked = True
+                elif any(
+                        c <= w_steps and u <= w_used
+                        for c, u in w_labels.items()
+                ):
+                    continue
+                elif not checked:
+                    if _on_chain(parent, state, w, hops - first[w] + 1):
+                        if turned_down is not None:
+                            turned_down.add(w)
+                        break
+                    checked = True
+
+                w_labels[w_steps] = w_used
+                parent[(w, w_steps, w_used)] = state
+                queue.append(((w, w_steps, w_used), hops + 1))
+
+
+def _plan(
+        parent: dict,
+        state: tuple,
+        t: Node
+) -> Tuple[List[Node], List[Node]]:
+    """
+    The path through `state` on to `t`, and the locations on it where the
+    states placed extra food.
+    """
+    states = _chain(parent, state)
+    placed = [
+        b[0] for a, b in zip(states, states[1:]) if len(b) > 2 and b[2] > a[2]
+    ]
+    return [u[0] for u in states] + [t], placed
+
+
+def _costs_to(
+        t: Node,
+        k: int,
+        x: int,
+        neighbours: Neighbours,
+        food: HasFood,
+        pause: int = 0
+) -> Generator[None, None, Dict[Tuple[Node, int], int]]:
+    """
+    The fewest extra food a walk from each (location, steps since food)
+    state on to `t` needs, ignoring whether the walk is simple. A 0-1 BFS
+    backwards from `t`: a state one hop from `t` needs nothing more, and a
+    state moving on to a location without food either carries its steps on
+    or places food there for one more.
+
+    :param food - Returns whether a location counts as having food.
+    :param pause - Yields after every `pause` states taken off the queue, if
+    given.
+    :returns (as the value of the `StopIteration` that ends it) the cost of
+    every state that needs at most `x`, leaving out `t` itself.
+    """
+    costs: Dict[Tuple[Node, int], int] = {}
+    queue = deque()
+    if k < 1:
+        return costs
+    expanded = 0
+
+    def into(y: Node, steps: int, cost: int, front: bool) -> None:
+        # The states that move on to (y, steps) at `cost`.
+        for w in neighbours(y):
+            if w == t:
+                continue
+            if food(w):
+                options = (0,) if steps in (-1, 0) else ()
+            elif steps == -1:
+                options = range(k)
+            else:
+                options = (steps,)
+            for a in options:
+                known = costs.get((w, a))
+                if known is None or cost < known:
+                    costs[(w, a)] = cost
+                    if front:
+                        queue.appendleft((w, a, cost))
+                    else:
+                        queue.append((w, a, cost))
+
+    # -1: any steps since food will do.
+    into(t, -1, 0, False)
+    while queue:
+        y, steps, cost = queue.popleft()
+        if costs[(y, steps)] != cost:
+            continue
+        if pause:
+            expanded += 1
+            if expanded == pause:
+                expanded = 0
+                yield
+        if steps:
+            into(y, steps - 1, cost, True)
+        elif food(y):
+            into(y, -1, cost, True)
+        elif cost < x:
+            into(y, -1, cost + 1, False)
+    return costs
+
+
+def _complete_steps(
+        s: Node,
+        t: Node,
+        k: int,
+        x: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        pause: int = 0,
+        budget: Union[int, None] = None,
+        stats: Union[QueryStats, None] = None
+) -> Generator[None, None, Union[Tuple[List[Node], List[Node]], None]]:
+    """
+    `find_path_with_extra_food` by a depth-first search over simple paths,
+    for when the searches above turned a state down. A state is only
+    entered if `_costs_to(t)` says a walk from it can still make it within
+    `x`, so it gives up at once when no walk reaches `t` at all. With
+    `budget`, it also gives up after entering that many states. With
+    `pause`, yields after every `pause` states entered. With `stats`, counts
+    the states entered as expansions. The plan is the value of the
+    `StopIteration` that ends it.
+    """
+    if s == t:
+        return [s], []
+
+    def food(v: Node) -> bool:
+        return v == s or v == t or has_food(v)
+
+    costs = yield from _costs_to(t, k, x, neighbours, food, pause)
+    if costs.get((s, 0), x + 1) > x:
+        return None
+
+    def moves(v: Node, steps: int, used: int) -> Union[list, None]:
+        # The states to try after (v, steps, used), or None if `t` is next.
+        found = []
+        for w in neighbours(v):
+            if w == t:
+                return None
+            if w in on_path:
+                continue
+            if food(w):
+                options = [(0, used)]
+            else:
+                options = [(steps + 1, used), (0, used + 1)]
+            for w_steps, w_used in options:
+                if w_used + costs.get((w, w_steps), x + 1) <= x:
+                    found.append((w, w_steps, w_used))
+        return found
+
+    path = [s]
+    placed = []
+    on_path = {s}
+    first = moves(s, 0, 0)
+    if first is None:
+        return [s, t], []
+    stack = [iter(first)]
+    used = [0]
+    expanded = 0
+
+    while stack:
+        move = next(stack[-1], None)
+        if move is None:
+            stack.pop()
+            used.pop()
+            v = path.pop()
+            on_path.discard(v)
+            if placed and placed[-1] == v:
+                placed.pop()
+            continue
+
+        w, w_steps, w_used = move
+        if w in on_path:
+            continue
+        if budget is not None:
+            if budget <= 0:
+                return None
+            budget -= 1
+        if stats is not None:
+            stats.expanded += 1
+        if pause:
+            expanded += 1
+            if expanded == pause:
+                expanded = 0
+                yield
+
+        path.append(w)
+        on_path.add(w)
+        if w_used > used[-1]:
+            placed.append(w)
+        after = moves(w, w_steps, w_used)
+        if after is None:
+            return path + [t], placed
+        stack.append(iter(after))
+        used.append(w_used)
+    return None
+
+
+def _complete(
+        s: Node,
+        t: Node,
+        k: int,
+        x: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        budget: Union[int, None] = None,
+        stats: Union[QueryStats, None] = None
+) -> Union[Tuple[List[Node], List[Node]], None]:
+    """
+    `_complete_steps`, run to the end.
+    """
+    steps = _complete_steps(
+        s, t, k, x, neighbours, has_food, 0, budget, stats
+    )
+    try:
+        while True:
+            next(steps)
+    except StopIteration as done:
+        return done.value
+
+
+def find_path_steps(
+        s: Node,
+        t: Node,
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        pause: int,
+        budget: int = 0
+) -> Generator[None, None, Union[List[Node], None]]:
+    """
+    `find_path`, as a generator that yields after every `pause` expansions
+    so that the caller can run other work (or give up) in between. The path
+    is the value of the `StopIteration` that ends it.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param k - The maximum number of hops between locations with food.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param pause - The number of expansions between yields.
+    :param budget - The most states `_complete` may enter, 0 for none.
+    :returns the locations from `s` to `t`, or None if there is no such path
+    (or none was found).
+    """
+    if s == t:
+        return [s]
+
+    parent = {(s, 0): None}
+    turned_down = set()
+    for w, state in _reached(
+            s, k, neighbours, has_food, parent, pause, None, turned_down
+    ):
+        if w is None:
+            yield
+        elif w == t:
+            return [u for u, _ in _chain(parent, state)] + [w]
+
+    if turned_down and budget > 0:
+        plan = yield from _complete_steps(
+            s, t, k, 0, neighbours, has_food, pause, budget
+        )
+        if plan is not None:
+            return plan[0]
+    return None
+
+
+def find_path_with_extra_food_steps(
+        s: Node,
+        t: Node,
+        k: int,
+        x: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        pause: int,
+        budget: int = 0
+) -> Generator[None, None, Union[Tuple[List[Node], List[Node]], None]]:
+    """
+    `find_path_with_extra_food`, as a generator that yields after every
+    `pause` expansions. The plan is the value of the `StopIteration` that
+    ends it.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param k - The maximum number of hops between locations with food.
+    :param x - The maximum number of new locations to place food at.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param pause - The number of expansions between yields.
+    :param budget - The most states `_complete` may enter, 0 for none.
+    :returns a tuple of the locations from `s` to `t` and the locations on
+    it that need extra food, or None if there is no such path (or none was
+    found).
+    """
+    if s == t:
+        return [s], []
+
+    parent = {(s, 0, 0): None}
+    turned_down = set()
+    for w, state in _reached_with_extra_food(
+            s, k, x, neighbours, has_food, parent, pause, None, turned_down
+    ):
+        if w is None:
+            yield
+        elif w == t:
+            return _plan(parent, state, w)
+
+    if turned_down and budget > 0:
+        return (yield from _complete_steps(
+            s, t, k, x, neighbours, has_food, pause, budget
+        ))
+    return None
+
+
+def reach(
+        s: Node,
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        x: int = 0
+) -> Tuple[Dict[Node, Tuple[int, Union[tuple, None]]], dict]:
+    """
+    Runs the `find_paths` search from `s` (or, with `x`, the
+    `find_paths_with_extra_food` one) to every location at once.
+
+    Nothing is copied out per location: every location reached keeps its hop
+    count and the search state it was reached from, and `reach_plan` rebuilds
+    its path from the parent states in time proportional to the path. The
+    locations are the ones the single search reaches, so a location only
+    reachable through a state it turned down is left out, exactly as a
+    `find_paths` search for it without a budget would miss it.
+
+    :param s - The start location.
+    :param k - The maximum number of hops between locations with food.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param x - The maximum number of new locations to place food at.
+    :returns a tuple of (hops, state reached from) by location, with
+    (0, None) for `s`, and the parent of every search state.
+    """
+    if x:
+        parent = {(s, 0, 0): None}
+        reached = _reached_with_extra_food(
+            s, k, x, neighbours, has_food, parent
+        )
+    else:
+        parent = {(s, 0): None}
+        reached = _reached(s, k, neighbours, has_food, parent)
+
+    tree = {s: (0, None)}
+    depth = {}
+    for w, state in reached:
+        # Hops to a state, found by walking up to one already known.
+        chain = []
+        at = state
+        while at is not None and at not in depth:
+            chain.append(at)
+            at = parent[at]
+        hops = -1 if at is None else depth[at]
+        for at in reversed(chain):
+            hops += 1
+            depth[at] = hops
+        tree[w] = (depth[state] + 1, state)
+
+    return tree, parent
+
+
+def reach_plan(
+        tree: Dict[Node, Tuple[int, Union[tuple, None]]],
+        parent: dict,
+        t: Node
+) -> Union[Tuple[List[Node], List[Node]], None]:
+    """
+    Looks up the path to `t` in a search from `reach`.
+
+    :param tree - The locations reached, as returned by `reach`.
+    :param parent - The parent states, as returned by `reach`.
+    :param t - The destination.
+    :returns a tuple of the path to `t` and the locations on it that need
+    extra food (none without `x`), or None if `t` wasn't reached.
+    """
+    entry = tree.get(t)
+    if entry is None:
+        return None
+    if entry[1] is None:
+        return [t], []
+    return _plan(parent, entry[1], t)
+
+
+def find_path_bidirectional(
+        s: Node,
+        t: Node,
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        budget: int = 0
+) -> Union[List[Node], None]:
+    """
+    `find_path`, searching from `s` and from `t` at the same time.
+
+    The constraint reads the same in both directions, so the search from `t`
+    uses the same (location, steps since food) states as the one from `s`.
+    A forward state with `a` steps since food and a backward state with `b`
+    steps at the same location join into a valid route when `a + b <= k`,
+    and the two halves are only joined when they share no other location.
+    The side with the smaller frontier grows by one level at a time.
+
+    The path found is valid and simple but, unlike `find_path`, not always
+    the one with the fewest hops. If the searches run out after turning down
+    a state or a join that would not have been simple, `find_path` (with the
+    same `budget`) answers instead.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param k - The maximum number of hops between locations with food.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param budget - The most states `_complete` may enter, 0 for none.
+    :returns the locations from `s` to `t`, or None if there is no such path
+    (or none was found).
+    """
+    if s == t:
+        return [s]
+
+    def food(v: Node) -> bool:
+        return v == s or v == t or has_food(v)
+
+    # Per side: fewest steps since food queued per location, the parent of
+    # every state and every steps since food queued per location.
+    best: List[Dict[Node, int]] = [{s: 0}, {t: 0}]
+    parent: List[dict] = [{(s, 0): None}, {(t, 0): None}]
+    at: List[Dict[Node, List[int]]] = [{s: [0]}, {t: [0]}]
+    frontiers = [[(s, 0)], [(t, 0)]]
+    # Per side: the levels grown so far, and the level every location was
+    # first queued at.
+    levels = [0, 0]
+    first: List[Dict[Node, int]] = [{s: 0}, {t: 0}]
+    turned_down = False
+
+    while frontiers[0] and frontiers[1]:
+        i = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        other = 1 - i
+        next_frontier = []
+        level = levels[i]
+        levels[i] += 1
+
+        for state in frontiers[i]:
+            v, steps = state
+            if steps >= k:
+                continue
+
+            for w in neighbours(v):
+                w_steps = 0 if food(w) else steps + 1
+                if w_steps >= k:
+                    continue
+
+                seen = best[i].get(w)
+                if seen is None:
+                    first[i][w] = level + 1
+                elif seen <= w_steps:
+                    continue
+                elif _on_chain(
+                        parent[i], state, w, level - first[i][w] + 1
+                ):
+                    turned_down = True
+                    continue
+
+                new = (w, w_steps)
+                best[i][w] = w_steps
+                parent[i][new] = state
+                at[i].setdefault(w, []).append(w_steps)
+                next_frontier.append(new)
+
+                for other_steps in at[other].get(w, ()):
+                    if w_steps + other_steps > k:
+                        continue
+                    half = [u for u, _ in _chain(parent[i], new)]
+                    rest = [
+                        u for u, _ in _chain(parent[other], (w, other_steps))
+                    ]
+                    rest.pop()
+                    path = half + rest[::-1]
+                    if len(set(path)) != len(path):
+                        turned_down = True
+                        continue
+                    if i == 1:
+                        path.reverse()
+                    return path
+
+        frontiers[i] = next_frontier
+
+    if turned_down:
+        return find_path(s, t, k, neighbours, has_food, budget)
+    return None
+
+
+def find_path_astar(
+        s: Node,
+        t: Node,
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood,
+        heuristic: Callable[[Node], int],
+        budget: int = 0
+) -> Union[List[Node], None]:
+    """
+    `find_path`, expanding states in order of hops so far plus
+    `heuristic(v)`, a lower bound on the hops left from `v` to `t`.
+
+    States are (location, steps since food) as in `find_path`. A state is
+    dropped when the same location already has one with no more steps since
+    food and no more hops from `s`. As long as `heuristic` never
+    overestimates, the path has the fewest hops, like the one from
+    `find_path`. An overestimate only costs optimality, not validity. If
+    the search runs out after turning a state down, `_complete` gets the
+    `budget` to look further.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param k - The maximum number of hops between locations with food.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :param heuristic - Returns a lower bound on the hops from a location
+    to `t`.
+    :param budget - The most states `_complete` may enter, 0 for none.
+    :returns the locations from `s` to `t`, or None if there is no such path
+    (or none was found).
+    """
+    if s == t:
+        return [s]
+
+    # steps since food -> fewest hops from s, per location. States carry
+    # their hops, so a better way to a state never rewrites a parent chain.
+    labels: Dict[Node, Dict[int, int]] = {s: {0: 0}}
+    parent: Dict[
+        Tuple[Node, int, int],
+        Union[Tuple[Node, int, int], None]
+    ] = {(s, 0, 0): None}
+    tie = count()
+    heap = [(heuristic(s), next(tie), (s, 0, 0))]
+    turned_down = False
+
+    while heap:
+        _, _, state = heapq.heappop(heap)
+        v, steps, hops = state
+        if labels[v].get(steps) != hops:
+            continue
+        if v == t:
+            return [u for u, _, _ in _chain(parent, state)]
+        if steps >= k:
+            continue
+
+        for w in neighbours(v):
+            w_steps = 0 if w == t or has_food(w) else steps + 1
+            if w_steps >= k:
+                continue
+
+            w_hops = hops + 1
+            w_labels = labels.get(w)
+            if w_labels is None:
+                w_labels = labels[w] = {}
+            else:
+                if any(
+                        c <= w_steps and g <= w_hops
+                        for c, g in w_labels.items()
+                ):
+                    continue
+                limit = hops - min(w_labels.values()) + 1
+                if _on_chain(parent, state, w, limit):
+                    turned_down = True
+                    continue
+
+            new = (w, w_steps, w_hops)
+            w_labels[w_steps] = w_hops
+            parent[new] = state
+            heapq.heappush(heap, (w_hops + heuristic(w), next(tie), new))
+
+    if turned_down and budget > 0:
+        plan = _complete(s, t, k, 0, neighbours, has_food, budget)
+        if plan is not None:
+            return plan[0]
+    return None
+
+
+def min_extra_food(
+        s: Node,
+        t: Node,
+        k: int,
+        neighbours: Neighbours,
+        has_food: HasFood
+) -> Union[Tuple[List[Node], List[Node]], None]:
+    """
+    Finds a simple path from `s` to `t` that needs the fewest new locations
+    with food so that from any location with food we reach the next one in
+    at most `k` steps.
+
+    A 0-1 BFS over (location, steps since food) states: moving on costs
+    nothing and placing food costs one, so states come off the deque in
+    order of food placed and the first time `t` does, nothing cheaper is
+    left. States carry their cost, and a state is dropped when the same
+    location already has one with no more steps since food and no more food
+    placed. Like the other searches it keeps every chain simple, so it can
+    turn down the only state that leads to a cheaper simple path: the food
+    it places is then more than the fewest needed, and it can even miss
+    `t`. The path it returns is always valid.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param k - The maximum number of hops between locations with food.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :returns a tuple of the locations from `s` to `t` and the locations on
+    it that need extra food, or None if `t` can't be reached at all (or
+    wasn't found).
+    """
+    if s == t:
+        return [s], []
+
+    # steps since food -> fewest food placed, per location.
+    labels: Dict[Node, Dict[int, int]] = {s: {0: 0}}
+    parent: Dict[
+        Tuple[Node, int, int],
+        Union[Tuple[Node, int, int], None]
+    ] = {(s, 0, 0): None}
+    # The fewest hops any state of a location was queued at.
+    low: Dict[Node, int] = {s: 0}
+    queue = deque([((s, 0, 0), 0)])
+    plan = None
+
+    while queue:
+        state, hops = queue.popleft()
+        v, steps, used = state
+        if labels[v].get(steps) != used:
+            continue
+        if v == t:
+            states = _chain(parent, state)
+            placed = [b[0] for a, b in zip(states, states[1:]) if b[2] > a[2]]
+            plan = [u for u, _, _ in states], placed
+            break
+        if steps >= k:
+            continue
+
+        for w in neighbours(v):
+            if w == t or has_food(w):
+                options = [(0, used)]
+            else:
+                options = [(0, used + 1)]
+                if steps + 1 < k:
+                    options.append((steps + 1, used))
+
+            w_labels = labels.get(w)
+            checked = False
+            for w_steps, w_used in options:
+                if w_labels is None:
+                    w_labels = labels[w] = {}
+                    low[w] = hops + 1
+                    checked = True
+                elif any(
+                        c <= w_steps and u <= w_used
+                        for c, u in w_labels.items()
+                ):
+                    continue
+                elif not checked:
+                    if _on_chain(parent, state, w, hops - low[w] + 1):
+                        break
+                    checked = True
+
+                new = (w, w_steps, w_used)
+                w_labels[w_steps] = w_used
+                parent[new] = state
+                low[w] = min(low[w], hops + 1)
+                if w_used == used:
+                    queue.appendleft((new, hops + 1))
+                else:
+                    queue.append((new, hops + 1))
+
+    return plan
+
+
+def find_path_profile(
+        s: Node,
+        t: Node,
+        neighbours: Neighbours,
+        has_food: HasFood
+) -> List[Tuple[int, List[Node]]]:
+    """
+    Finds the `find_path` answer for every `k` at once.
+
+    The `k` a path needs is its longest stretch between locations with food,
+    so a single BFS runs over (location, steps since food) states that also
+    carry the longest stretch so far. A state is dropped when the same
+    location already has one with no more steps since food and no longer
+    stretch. Every time `t` is reached with a shorter longest stretch than
+    before, that path has the fewest hops for all `k` from its stretch up
+    to the previous one. States that can't beat the best stretch found so
+    far are not expanded. Like `find_path` without a budget it can turn down
+    the only state leading to a route, so a `k` can be missing from the
+    profile (or be listed with a longer path) when `find_path` would have
+    found its route exhaustively.
+
+    :param s - The start location.
+    :param t - The destination.
+    :param neighbours - Returns the locations connected to a location.
+    :param has_food - Returns whether a location has food.
+    :returns (k, path) tuples in increasing `k`: each path is a fewest hops
+    path for its `k` and every larger `k` up to the next tuple. Empty if `t`
+    can't be reached.
+    """
+    if s == t:
+        return [(0, [s])]
+
+    profile: List[Tuple[int, List[Node]]] = []
+    best = None
+
+    # steps since food -> shortest longest stretch, per location.
+    labels: Dict[Node, Dict[int, int]] = {s: {0: 0}}
+    parent: Dict[
+        Tuple[Node, int, int],
+        Union[Tuple[Node, int, int], None]
+    ] = {(s, 0, 0): None}
+    first: Dict[Node, int] = {s: 0}
+    queue = deque([((s, 0, 0), 0)])
+
+    while queue:
+        state, hops = queue.popleft()
+        v, steps, stretch = state
+        if best is not None and stretch >= best:
+            continue
+
+        for w in neighbours(v):
+            w_stretch = max(stretch, steps + 1)
+            if best is not None and w_stretch >= best:
+                continue
+            if w == t:
+                best = w_stretch
+                path = [u for u, _, _ in _chain(parent, state)] + [w]
+                profile.append((best, path))
+                if best <= 1:
+                    profile.reverse()
+                    return profile
+                continue
+
+            w_steps = 0 if has_food(w) else steps + 1
+            w_labels = labels.get(w)
+            if w_labels is None:
+                w_labels = labels[w] = {}
+                first[w] = hops + 1
+            elif any(
+                    c <= w_steps and b <= w_stretch
+                    for c, b in w_labels.items()
+            ):
+                continue
+            elif _on_chain(parent, state, w, hops - first[w] + 1):
+                continue
+
+            new = (w, w_steps, w_stretch)
+            w_labels[w_steps] = w_stretch
+            parent[new] = state
+            queue.append((new, hops + 1))
+
+    profile.reverse()
+    return profile
@@ -0,0 +1,287 @@
+"""
+Snapshots
+=========
+
+Immutable views of a quokka maze for readers running alongside a writer.
+
+A `MazeSnapshot` holds the edges of every vertex as tuples, frozen at one
+`QuokkaMaze._version`. The maze only ever changes the `Vertex.edges` lists,
+never the tuples, so readers can query a snapshot from any number of threads
+without locks while the writer carries on with `fix_edge`/`block_edge`.
+
+Snapshots share structure. The first one builds a vertex -> tuple table of
+the whole maze, the base. Later ones share that base and only hold an
+overlay of the vertices that were added or had an edge changed since it was
+built, so a snapshot after a few changes costs the changed vertices, not a
+copy of the maze. Once the overlay outgrows the square root of the base
+(and `_OVERLAY`), the next snapshot folds it into a new base, which spreads
+the cost of the copy over at least that many changes.
+"""
+
+from collections import ChainMap
+from math import isqrt
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Set, Tuple, Union
+
+import search
+from vertex import Vertex
+
+_OVERLAY = 64
+
+
+class MazeSnapshot:
+    """
+    Maze Snapshot
+    -------------
+
+    The edges of a maze at one version, for querying without locks.
+
+    ===== Functions =====
+
+        * neighbours(v) - the vertices connected to `v` in this snapshot.
+        * has_food(v) - whether `v` has food.
+        * find_path(s, t, k) - same contract as `QuokkaMaze.find_path`.
+        * exists_path_with_extra_food(s, t, k, x) - same contract as
+            `QuokkaMaze.exists_path_with_extra_food`.
+        * plan_path_with_extra_food(s, t, k, x) - same contract as
+            `QuokkaMaze.plan_path_with_extra_food`.
+    """
+
+    __slots__ = ("version", "_vertices", "_added", "_base", "_overlay",
+                 "_lookup")
+
+    def __init__(
+            self,
+            version: int,
+            vertices: Tuple[Vertex, ...],
+            base: Dict[Vertex, Tuple[Vertex, ...]],
+            added: Tuple[Vertex, ...] = (),
+            overlay: Union[Dict[Vertex, Tuple[Vertex, ...]], None] = None
+    ) -> None:
+        """
+        :param version - The version of the maze this is a snapshot of.
+        :param vertices - The vertices of the maze when `base` was built, in
+        order.
+        :param base - The neighbours of every vertex in `vertices`.
+        :param added - The vertices added since, in order.
+        :param overlay - The neighbours of the vertices added or changed
+        since, which take the place of the ones in `base`.
+
+        `base` and `overlay` are owned by the snapshot from now on and must
+        not be changed. `base` may be shared with other snapshots.
+        """
+        self.version = version
+        self._vertices = vertices
+        self._added = added
+        self._base = base
+        self._overlay = overlay or {}
+        self._lookup = self._layered if overlay else base.__getitem__
+
+    @property
+    def vertices(self) -> Tuple[Vertex, ...]:
+        """
+        The vertices of the maze when the snapshot was taken, in order.
+        """
+        if not self._added:
+            return self._vertices
+        return self._vertices + self._added
+
+    @property
+    def adjacency(self) -> Mapping[Vertex, Tuple[Vertex, ...]]:
+        """
+        A read-only vertex -> neighbours mapping of the snapshot.
+        """
+        return MappingProxyType(ChainMap(self._overlay, self._base))
+
+    def _layered(self, v: Vertex) -> Tuple[Vertex, ...]:
+        """
+        The neighbours of `v`, from the overlay if it changed since the base.
+        """
+        edges = self._overlay.get(v)
+        if edges is None:
+            return self._base[v]
+        return edges
+
+    def neighbours(self, v: Vertex) -> Tuple[Vertex, ...]:
+        """
+        :param v - A vertex of the maze.
+        :return the vertices connected to `v` when the snapshot was taken.
+        """
+        return self._lookup(v)
+
+    @staticmethod
+    def has_food(v: Vertex) -> bool:
+        """
+        :param v - A vertex of the maze.
+        :return true if `v` has food, else false. The maze never changes it.
+        """
+        return v.has_food
+
+    def _valid_query(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int = 0
+    ) -> bool:
+        """
+        Checks the parameters of a path query.
+        """
+        if k < 0 or x < 0:
+            return False
+        for v in (s, t):
+            if v not in self._base and v not in self._overlay:
+                return False
+        return True
+
+    def find_path(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int
+    ) -> Union[List[Vertex], None]:
+        """
+        `QuokkaMaze.find_path` on the snapshot.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food.
+        :returns the simple path from `s` to `t`, or None.
+        """
+        if not self._valid_query(s, t, k):
+            return None
+        return search.find_path(
+            s,
+            t,
+            k,
+            self._lookup,
+            self.has_food
+        )
+
+    def exists_path_with_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int
+    ) -> bool:
+        """
+        `QuokkaMaze.exists_path_with_extra_food` on the snapshot.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food.
+        :param x - The number of extra foods to add.
+        :returns true if the path can be completed, else false.
+        """
+        return self.plan_path_with_extra_food(s, t, k, x) is not None
+
+    def plan_path_with_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int
+    ) -> Union[Tuple[List[Vertex], List[Vertex]], None]:
+        """
+        `QuokkaMaze.plan_path_with_extra_food` on the snapshot.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food.
+        :param x - The number of extra foods to add.
+        :returns the path and the vertices on it to place food at, or None.
+        """
+        if not self._valid_query(s, t, k, x):
+            return None
+        return search.find_path_with_extra_food(
+            s,
+            t,
+            k,
+            x,
+            self._lookup,
+            self.has_food
+        )
+
+
+class Snapshots:
+    """
+    Snapshots
+    ---------
+
+    Keeps the latest snapshot of a maze and the vertices changed since.
+
+    ===== Functions =====
+
+        * take(vertices, version) - the snapshot for `version`.
+        * maze_changed(changes) - records the vertices that changed.
+    """
+
+    def __init__(self) -> None:
+        self._latest: Union[MazeSnapshot, None] = None
+        self._dirty: Set[Vertex] = set()
+        self._added: List[Vertex] = []
+
+    def take(self, vertices: List[Vertex], version: int) -> MazeSnapshot:
+        """
+        Returns the snapshot of the maze at `version`, reusing the latest one
+        if nothing changed and sharing its base otherwise.
+
+        :param vertices - The vertices of the maze.
+        :param version - The current version of the maze.
+        :return a `MazeSnapshot` of the maze as it is now.
+        """
+        latest = self._latest
+        if latest is not None and latest.version == version:
+            return latest
+
+        if latest is None:
+            snap = MazeSnapshot(
+                version,
+                tuple(vertices),
+                {v: tuple(v.edges) for v in vertices}
+            )
+        else:
+            base = latest._base
+            overlay = dict(latest._overlay)
+            for v in self._dirty:
+                overlay[v] = tuple(v.edges)
+            added = latest._added
+            if self._added:
+                added += tuple(self._added)
+
+            if len(overlay) > max(_OVERLAY, isqrt(len(base))):
+                base = dict(base)
+                base.update(overlay)
+                snap = MazeSnapshot(
+                    version,
+                    latest._vertices + added,
+                    base
+                )
+            else:
+                snap = MazeSnapshot(
+                    version,
+                    latest._vertices,
+                    base,
+                    added,
+                    overlay
+                )
+
+        self._dirty = set()
+        self._added = []
+        self._latest = snap
+        return snap
+
+    def maze_changed(self, changes: List[tuple]) -> None:
+        """
+        Records the vertices whose edges the changes touched.
+
+        :param changes - (operation, u, v) tuples, as sent by `QuokkaMaze`.
+        """
+        dirty = self._dirty
+        for op, u, v in changes:
+            if op == "add_vertex":
+                self._added.append(u)
+            dirty.add(u)
+            if v is not None:
+                dirty.add(v)
@@ -0,0 +1,138 @@
+"""
+Query Stats
+===========
+
+Opt-in measurements of the queries a `QuokkaMaze` answers.
+
+While `QuokkaMaze.stats()` is switched on, every `find_path`,
+`exists_path_with_extra_food` and `plan_path_with_extra_food` call gets a
+`QueryStats` record:
+
+    * `expanded` - the search states taken off the queue and expanded.
+    * `pushed` - the search states put on the queue.
+    * `peak_frontier` - the most states on the queue at once.
+    * `path_length` - the hops on the path found, None if there is none.
+    * `seconds` - the wall time of the call.
+
+The counters are filled in by the BFS searches in `search`. The other
+searches (A*, bidirectional) count their neighbour lookups as expansions
+but leave `pushed` and `peak_frontier` at 0, and answers taken from an index
+or the cache do no search work at all. Switched off, the searches only check
+once per expansion that no record was passed in.
+"""
+
+from collections import deque
+from typing import Callable, Dict, List, Union
+
+
+class QueryStats:
+    """
+    Query Stats
+    -----------
+
+    The measurements of one query.
+
+    ===== Functions =====
+
+        * as_dict() - the measurements as a plain dictionary.
+    """
+
+    __slots__ = (
+        "query",
+        "expanded",
+        "pushed",
+        "peak_frontier",
+        "path_length",
+        "seconds"
+    )
+
+    def __init__(self, query: str) -> None:
+        """
+        :param query - The name of the method that was called.
+        """
+        self.query = query
+        self.expanded = 0
+        self.pushed = 0
+        self.peak_frontier = 0
+        self.path_length: Union[int, None] = None
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Union[str, int, float, None]]:
+        """
+        :return the measurements, keyed by name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class StatsRecorder:
+    """
+    Stats Recorder
+    --------------
+
+    Collects the `QueryStats` of a maze and passes them on.
+
+    ===== Functions =====
+
+        * add(stats) - records a query and calls every subscriber with it.
+        * subscribe(callback) - calls `callback(stats)` after every query.
+        * unsubscribe(callback) - stops calling `callback`.
+        * recent() - the latest records, as dictionaries.
+        * totals() - the number of queries and summed counters, by query.
+    """
+
+    def __init__(self, keep: int = 1000) -> None:
+        """
+        :param keep - The number of latest records to keep.
+        """
+        self.records = deque(maxlen=max(keep, 0))
+        self._callbacks: List[Callable[[QueryStats], None]] = []
+        self._totals: Dict[str, Dict[str, Union[int, float]]] = {}
+
+    def add(self, stats: QueryStats) -> None:
+        """
+        :param stats - The measurements of a finished query.
+        """
+        self.records.append(stats)
+        total = self._totals.get(stats.query)
+        if total is None:
+            total = self._totals[stats.query] = {
+                "count": 0,
+                "expanded": 0,
+                "pushed": 0,
+                "seconds": 0.0
+            }
+        total["count"] += 1
+        total["expanded"] += stats.expanded
+        total["pushed"] += stats.pushed
+        total["seconds"] += stats.seconds
+        for callback in self._callbacks:
+            callback(stats)
+
+    def subscribe(self, callback: Callable[[QueryStats], None]) -> None:
+        """
+        :param callback - Called with the `QueryStats` of every query.
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[QueryStats], None]) -> bool:
+        """
+        :param callback - A subscribed callback.
+        :return true if it was subscribed, else false.
+        """
+        if callback not in self._callbacks:
+            return False
+        self._callbacks.remove(callback)
+        return True
+
+    def recent(self) -> List[Dict[str, Union[str, int, float, None]]]:
+        """
+        :return the kept records, oldest first, as dictionaries.
+        """
+        return [stats.as_dict() for stats in self.records]
+
+    def totals(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        :return the number of queries and the summed expansions, pushes and
+        seconds, by query.
+        """
+        return {query: dict(total) for query, total in self._totals.items()}
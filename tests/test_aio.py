@@ -0,0 +1,205 @@
+import asyncio
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from vertex import Vertex
+from graph import QuokkaMaze
+from aio import AsyncQuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def corridor(n):
+    """
+    A maze that is one long corridor with food everywhere.
+    """
+
+    vertices = [Vertex(True) for _ in range(n)]
+    maze = QuokkaMaze()
+    maze.add_vertices(vertices)
+    maze.fix_edges(zip(vertices, vertices[1:]))
+    return maze, vertices
+
+
+class TestAsyncQuokkaMaze(unittest.TestCase):
+
+    def test_matches_maze(self):
+        """
+        The async queries should give the same answers as the maze.
+        """
+
+        rng = random.Random(2)
+        vertices = [Vertex(rng.random() < 0.3) for _ in range(40)]
+        maze = QuokkaMaze()
+        maze.add_vertices(vertices)
+        maze.fix_edges(
+            (rng.choice(vertices), rng.choice(vertices)) for _ in range(80)
+        )
+        queries = [
+            (
+                rng.choice(vertices),
+                rng.choice(vertices),
+                rng.randint(-1, 3),
+                rng.randint(0, 2)
+            )
+            for _ in range(40)
+        ]
+
+        async def run(front):
+            return [
+                (
+                    await front.find_path(s, t, k),
+                    await front.exists_path_with_extra_food(s, t, k, x),
+                    await front.plan_path_with_extra_food(s, t, k, x)
+                )
+                for s, t, k, x in queries
+            ]
+
+        expected = [
+            (
+                maze.find_path(s, t, k),
+                maze.exists_path_with_extra_food(s, t, k, x),
+                maze.plan_path_with_extra_food(s, t, k, x)
+            )
+            for s, t, k, x in queries
+        ]
+        should_be_equal(
+            asyncio.run(run(AsyncQuokkaMaze(maze, every=3))),
+            expected,
+            "aio.find_path"
+        )
+        with ThreadPoolExecutor(2) as executor:
+            should_be_equal(
+                asyncio.run(run(AsyncQuokkaMaze(maze, executor=executor))),
+                expected,
+                "aio.find_path"
+            )
+
+    def test_snapshot_reused(self):
+        """
+        Queries should share a snapshot until the maze changes.
+        """
+
+        maze, vertices = corridor(5)
+        taken = []
+        snapshot = maze.snapshot
+
+        def counted():
+            taken.append(maze._version)
+            return snapshot()
+
+        maze.snapshot = counted
+        front = AsyncQuokkaMaze(maze)
+        first, last = vertices[0], vertices[-1]
+
+        async def run():
+            paths = [await front.find_path(first, last, 1)]
+            paths.append(await front.find_path(first, last, 1))
+            maze.block_edge(vertices[1], vertices[2])
+            paths.append(await front.find_path(first, last, 1))
+            paths.append(
+                await front.plan_path_with_extra_food(first, last, 1, 0)
+            )
+            return paths
+
+        should_be_equal(
+            asyncio.run(run()),
+            [vertices, vertices, None, None],
+            "aio.find_path"
+        )
+        should_be_equal(taken, [2, 3], "aio.find_path")
+
+    def test_other_tasks_keep_running(self):
+        """
+        A long search should hand control back to the event loop.
+        """
+
+        maze, vertices = corridor(2000)
+        front = AsyncQuokkaMaze(maze, every=50)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            path = await front.find_path(vertices[0], vertices[-1], 1)
+            ticker.cancel()
+            return path
+
+        should_be_equal(asyncio.run(run()), vertices, "aio.find_path")
+        assert len(ticks) >= 1999 // 50, "The search never paused"
+
+    def test_exhaustive_search_pauses(self):
+        """
+        The exhaustive search a missed route gets, including working out
+        its pruning, should hand control back to the event loop too.
+        """
+
+        # A corridor of food, then p - c1 - c2 - t one hop too long for
+        # k = 3, with food hanging off c1 that can't be used.
+        vertices = [Vertex(True) for _ in range(1000)]
+        p, c1, c2, t = (Vertex(False) for _ in range(4))
+        side = Vertex(True)
+        maze = QuokkaMaze(exhaustive=1)
+        maze.add_vertices(vertices + [p, c1, c2, t, side])
+        maze.fix_edges(
+            list(zip(vertices, vertices[1:]))
+            + [(vertices[-1], p), (p, c1), (c1, c2), (c2, t), (c1, side)]
+        )
+        front = AsyncQuokkaMaze(maze, every=10)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            path = await front.find_path(vertices[0], t, 3)
+            ticker.cancel()
+            return path
+
+        should_be_equal(asyncio.run(run()), None, "aio.find_path")
+        # Both the search and the costs behind the pruning cover the
+        # corridor, pausing every 10 states.
+        assert len(ticks) >= 2 * 1000 // 10, "The search never paused"
+
+    def test_timeout_and_cancel(self):
+        """
+        A search should stop when it runs out of time or is cancelled.
+        """
+
+        maze, vertices = corridor(5000)
+        front = AsyncQuokkaMaze(maze, every=1)
+
+        async def slow():
+            return await front.find_path(vertices[0], vertices[-1], 1, 0.001)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(slow())
+
+        async def cancel():
+            task = asyncio.ensure_future(
+                front.find_path(vertices[0], vertices[-1], 1)
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                return True
+            return False
+
+        should_be_equal(asyncio.run(cancel()), True, "aio.find_path")
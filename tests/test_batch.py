@@ -0,0 +1,262 @@
+import random
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class Recorder:
+    """
+    A listener that keeps every list of changes it is sent.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def maze_changed(self, changes):
+        self.calls.append(changes)
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_batch_is_one_change(self):
+        """
+        A batch should be applied when it ends, as a single change.
+        """
+
+        A = Vertex(False)
+        B = Vertex(True)
+        C = Vertex(False)
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B])
+        m.fix_edge(A, B)
+        recorder = Recorder()
+        m._listeners.append(recorder)
+        m.journal()
+        version = m._version
+
+        with m.batch():
+            should_be_equal(m.add_vertex(C), True, "maze.add_vertex")
+            should_be_equal(m.add_vertex(C), False, "maze.add_vertex")
+            should_be_equal(m.fix_edge(B, C), True, "maze.fix_edge")
+            should_be_equal(m.fix_edge(C, B), False, "maze.fix_edge")
+            should_be_equal(m.block_edge(A, B), True, "maze.block_edge")
+            should_be_equal(m.block_edge(A, C), False, "maze.block_edge")
+
+            # Queries still see the maze from before the batch.
+            should_be_equal(m.find_path(A, B, 1), [A, B], "maze.find_path")
+            should_be_equal(C.edges, [], "maze.batch")
+            should_be_equal(m._version, version, "maze.batch")
+
+        should_be_equal(m._version, version + 1, "maze.batch")
+        should_be_equal(m.vertices, [A, B, C], "maze.batch")
+        should_be_equal(A.edges, [], "maze.batch")
+        should_be_equal(B.edges, [C], "maze.batch")
+        should_be_equal(
+            recorder.calls,
+            [[
+                ("add_vertex", C, None),
+                ("fix_edge", B, C),
+                ("block_edge", A, B)
+            ]],
+            "maze.batch"
+        )
+        should_be_equal(
+            m.changes_since(version),
+            recorder.calls[0],
+            "maze.changes_since"
+        )
+
+    def test_batch_cancels_and_rolls_back(self):
+        """
+        Changes undone within a batch should not be sent, and a batch that
+        raises should change nothing.
+        """
+
+        A = Vertex(False)
+        B = Vertex(False)
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B])
+        version = m._version
+
+        with m.batch():
+            m.fix_edge(A, B)
+            m.block_edge(B, A)
+        should_be_equal(m._version, version, "maze.batch")
+
+        with self.assertRaises(ValueError):
+            with m.batch():
+                m.fix_edges([(A, B)])
+                with m.batch():
+                    m.add_vertex(Vertex(True))
+                raise ValueError
+        should_be_equal(m._version, version, "maze.batch")
+        should_be_equal(len(m.vertices), 2, "maze.batch")
+        should_be_equal(A.edges, [], "maze.batch")
+
+        with m.batch():
+            m.fix_edges([(A, B)])
+        should_be_equal(A.edges, [B], "maze.batch")
+
+    def test_changes_since(self):
+        """
+        The journal should be off until asked for, return the changes after
+        a version, and give up once it no longer goes back that far.
+        """
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(False)
+
+        m = QuokkaMaze()
+        m.add_vertex(A)
+        should_be_equal(m.changes_since(1), [], "maze.changes_since")
+        should_be_equal(m.changes_since(0), None, "maze.changes_since")
+        should_be_equal(m.changes_since(2), None, "maze.changes_since")
+
+        m.journal(4)
+        should_be_equal(m.changes_since(0), None, "maze.changes_since")
+        m.add_vertices([B, C])
+        m.fix_edge(A, B)
+        should_be_equal(
+            m.changes_since(1),
+            [("add_vertex", B, None), ("add_vertex", C, None),
+             ("fix_edge", A, B)],
+            "maze.changes_since"
+        )
+        should_be_equal(
+            m.changes_since(2),
+            [("fix_edge", A, B)],
+            "maze.changes_since"
+        )
+
+        # The journal holds 4 changes, so the list of two goes.
+        m.fix_edge(B, C)
+        m.fix_edge(A, C)
+        should_be_equal(m.changes_since(1), None, "maze.changes_since")
+        should_be_equal(
+            m.changes_since(2),
+            [("fix_edge", A, B), ("fix_edge", B, C), ("fix_edge", A, C)],
+            "maze.changes_since"
+        )
+
+        # A list bigger than the journal is not kept at all.
+        with m.batch():
+            m.block_edge(A, B)
+            m.block_edge(B, C)
+            m.block_edge(A, C)
+            m.add_vertex(Vertex(True))
+            m.add_vertex(Vertex(True))
+        should_be_equal(m.changes_since(m._version - 1), None,
+                        "maze.changes_since")
+        m.fix_edge(A, B)
+        should_be_equal(
+            m.changes_since(m._version - 1),
+            [("fix_edge", A, B)],
+            "maze.changes_since"
+        )
+
+        m.journal(0)
+        should_be_equal(m.changes_since(m._version - 1), None,
+                        "maze.changes_since")
+        should_be_equal(m.drop_journal(), True, "maze.drop_journal")
+        should_be_equal(m.drop_journal(), False, "maze.drop_journal")
+        m.block_edge(A, B)
+        should_be_equal(m.changes_since(m._version - 1), None,
+                        "maze.changes_since")
+
+    def test_batch_splits_components(self):
+        """
+        Blocking every edge of a location in one batch should split the
+        components on either side of it.
+        """
+
+        # D -- A -- C -- B -- E
+
+        A, B, C, D, E = (Vertex(False) for _ in range(5))
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B, C, D, E])
+        m.fix_edges([(D, A), (A, C), (C, B), (B, E)])
+        connectivity = m.connectivity()
+
+        with m.batch():
+            m.block_edge(A, C)
+            m.block_edge(C, B)
+
+        should_be_equal(connectivity.connected(A, B), False,
+                        "Connectivity.connected")
+        should_be_equal(connectivity.connected(D, A), True,
+                        "Connectivity.connected")
+        should_be_equal(connectivity.component_size(C), 1,
+                        "Connectivity.component_size")
+
+    def test_batches_keep_indexes_up_to_date(self):
+        """
+        The indexes updated by a batch should agree with ones built from
+        scratch afterwards.
+        """
+
+        rng = random.Random(25)
+        vertices = [Vertex(rng.random() < 0.3) for _ in range(30)]
+        m = QuokkaMaze()
+        m.add_vertices(vertices)
+        m.fix_edges(
+            (u, v) for i, u in enumerate(vertices)
+            for v in vertices[i + 1:] if rng.random() < 0.1
+        )
+        connectivity = m.connectivity()
+        oracle = m.food_oracle(2)
+
+        for _ in range(30):
+            m.snapshot()
+            with m.batch():
+                for _ in range(8):
+                    u, v = rng.sample(vertices, 2)
+                    if rng.random() < 0.5:
+                        m.fix_edge(u, v)
+                    else:
+                        m.block_edge(u, v)
+                for u in vertices:
+                    for v in list(u.edges):
+                        if rng.random() < 0.05:
+                            m.block_edge(u, v)
+
+            fresh = QuokkaMaze()
+            fresh.vertices = vertices
+            fresh._index = m._index
+            rebuilt = fresh.connectivity()
+            snap = m.snapshot()
+            for v in vertices:
+                should_be_equal(
+                    snap.neighbours(v),
+                    tuple(v.edges),
+                    "maze.snapshot"
+                )
+            for _ in range(20):
+                s, t = rng.sample(vertices, 2)
+                should_be_equal(
+                    connectivity.connected(s, t),
+                    rebuilt.connected(s, t),
+                    "Connectivity.connected"
+                )
+                should_be_equal(
+                    oracle.find_path(s, t) is None,
+                    fresh.find_path(s, t, 2) is None,
+                    "FoodOracle.find_path"
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import time
+import unittest
+
+import benchmark
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_maps_are_reproducible(self):
+        """
+        The same seed should always give the same simple map.
+        """
+
+        for kind in benchmark.GENERATORS:
+            n, edges, food = benchmark.make_map(kind, 200, 1)
+            should_be_equal(
+                benchmark.make_map(kind, 200, 1),
+                (n, edges, food),
+                "benchmark.make_map"
+            )
+            should_be_equal(len(food), n, "benchmark.make_map")
+            pairs = {frozenset(e) for e in edges}
+            should_be_equal(len(pairs), len(edges), "benchmark.make_map")
+            assert all(len(p) == 2 for p in pairs), "Map has a self loop"
+            assert all(0 <= i < n for e in edges for i in e), \
+                "Map has an edge to a location that doesn't exist"
+
+        should_be_equal(
+            len(benchmark.make_map("grid", 100, 0)[1]),
+            180,
+            "benchmark.grid"
+        )
+
+    def test_run_reports_every_operation(self):
+        """
+        A small run should report every operation it timed.
+        """
+
+        result = benchmark.run("grid", 100, 0, 10, 4, 2, memory=False)
+        should_be_equal(
+            [op["op"] for op in result["ops"]],
+            [
+                "add_vertex",
+                "fix_edge",
+                "find_path",
+                "exists_path_with_extra_food",
+                "block_edge"
+            ],
+            "benchmark.run"
+        )
+        should_be_equal(result["ops"][0]["count"], 100, "benchmark.run")
+        should_be_equal(result["ops"][2]["count"], 10, "benchmark.run")
+        should_be_equal(
+            benchmark.compare({"results": [result]}, {"results": [result]})[0]
+            ["p50_ratio"],
+            1.0,
+            "benchmark.compare"
+        )
+
+    def test_every_map_finishes(self):
+        """
+        Every map should run at a real size in reasonable time, with the
+        memory of the same build that was timed.
+        """
+
+        for kind in sorted(benchmark.GENERATORS):
+            start = time.perf_counter()
+            result = benchmark.run(kind, 1000, 0, 50, 4, 2)
+            took = time.perf_counter() - start
+            assert took < 30, f"[benchmark.run] {kind} took {took:.1f}s"
+
+            n, edges, food = benchmark.make_map(kind, 1000, 0)
+            should_be_equal(result["n"], n, "benchmark.run")
+            assert result["peak_memory_bytes"] > 0, \
+                f"[benchmark.run] {kind} reported no memory"
+            should_be_equal(
+                [op["count"] for op in result["ops"]],
+                [n, len(edges), 50, 50, 50],
+                "benchmark.run"
+            )
@@ -0,0 +1,99 @@
+import unittest
+
+from cache import MISSING, QueryCache
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestQueryCache(unittest.TestCase):
+
+    def test_least_recently_used_is_evicted(self):
+        """
+        A full cache should drop the result that was used longest ago.
+        """
+
+        cache = QueryCache(2)
+        cache.put("a", 0, 1)
+        cache.put("b", 0, None)
+        should_be_equal(cache.get("a", 0), 1, "cache.get")
+        cache.put("c", 0, 3)
+
+        should_be_equal(cache.get("b", 0), MISSING, "cache.get")
+        should_be_equal(cache.get("a", 0), 1, "cache.get")
+        should_be_equal(cache.get("c", 0), 3, "cache.get")
+        should_be_equal(
+            cache.stats(),
+            {"hits": 3, "misses": 1, "evictions": 1, "entries": 2, "size": 2},
+            "cache.stats"
+        )
+
+        cache.resize(1)
+        should_be_equal(len(cache), 1, "cache.resize")
+        should_be_equal(cache.get("c", 0), 3, "cache.resize")
+
+        # Results for an older version are never returned.
+        should_be_equal(cache.get("c", 1), MISSING, "cache.get")
+        should_be_equal(len(cache), 0, "cache.get")
+
+    def test_maze_answers_stay_fresh(self):
+        """
+        Cached answers should be reused until the maze changes.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B, C, D, E])
+        m.fix_edges([(A, B), (B, C), (C, D), (D, E)])
+        cache = m.query_cache(16)
+
+        path = m.find_path(A, E, 2)
+        should_be_equal(path, [A, B, C, D, E], "maze.find_path")
+        path.append(A)
+        should_be_equal(
+            m.find_path(A, E, 2),
+            [A, B, C, D, E],
+            "maze.find_path"
+        )
+        should_be_equal(m.find_path(A, E, 1), None, "maze.find_path")
+        should_be_equal(m.find_path(A, E, 1), None, "maze.find_path")
+        should_be_equal(
+            m.exists_path_with_extra_food(A, E, 1, 2),
+            True,
+            "maze.exists_path_with_extra_food"
+        )
+        should_be_equal(
+            m.exists_path_with_extra_food(A, E, 1, 2),
+            True,
+            "maze.exists_path_with_extra_food"
+        )
+        should_be_equal(cache.hits, 3, "cache.hits")
+        should_be_equal(cache.misses, 3, "cache.misses")
+
+        m.block_edge(C, D)
+        should_be_equal(m.find_path(A, E, 2), None, "maze.find_path")
+        should_be_equal(
+            m.exists_path_with_extra_food(A, E, 1, 2),
+            False,
+            "maze.exists_path_with_extra_food"
+        )
+        should_be_equal(cache.misses, 5, "cache.misses")
+
+        should_be_equal(m.drop_query_cache(), True, "maze.drop_query_cache")
+        should_be_equal(m.drop_query_cache(), False, "maze.drop_query_cache")
@@ -0,0 +1,221 @@
+import os
+import random
+import tempfile
+import unittest
+
+from compact import CompactMaze
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def random_maze(seed, n, m, compact):
+    """
+    Builds the same random maze for a given seed, in either mode.
+    """
+
+    rng = random.Random(seed)
+    maze = QuokkaMaze(compact=compact)
+    vertices = [Vertex(rng.random() < 0.3) for _ in range(n)]
+    for v in vertices:
+        maze.add_vertex(v)
+    for _ in range(m):
+        maze.fix_edge(rng.choice(vertices), rng.choice(vertices))
+    return maze, vertices
+
+
+class TestCompactMaze(unittest.TestCase):
+
+    def test_csr_layout(self):
+        """
+        Does the compact view hold the same adjacency and food?
+        """
+
+        maze, vertices = random_maze(1, 30, 60, True)
+        view = maze.compact_view()
+
+        should_be_equal(view.n, len(vertices), "compact.from_vertices")
+        for i, v in enumerate(vertices):
+            should_be_equal(
+                sorted(view.neighbours(i)),
+                sorted(maze.vertices.index(u) for u in v.edges),
+                "compact.neighbours"
+            )
+            should_be_equal(view.has_food(i), v.has_food, "compact.has_food")
+
+    def test_rebuilt_after_changes(self):
+        """
+        Blocking an edge should be visible to the next compact query.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze(compact=True)
+        for v in [A, B, C, D, E]:
+            m.add_vertex(v)
+        m.fix_edge(A, B)
+        m.fix_edge(B, C)
+        m.fix_edge(C, D)
+        m.fix_edge(D, E)
+
+        should_be_equal(m.find_path(A, E, 2), [A, B, C, D, E], "find_path")
+        should_be_equal(m.find_path(A, E, 1), None, "find_path")
+
+        m.block_edge(C, D)
+        should_be_equal(m.find_path(A, E, 2), None, "find_path")
+        should_be_equal(
+            m.exists_path_with_extra_food(A, C, 1, 1),
+            True,
+            "exists_path_with_extra_food"
+        )
+
+    def test_changes_are_overlaid(self):
+        """
+        Changes should be overlaid on the arrays of the last build, until
+        enough rows changed for a rebuild, and saved with the overlay in.
+        """
+
+        maze, vertices = random_maze(2, 300, 600, True)
+        rng = random.Random(2)
+        first = maze.compact_view()
+        rows = [list(first.neighbours(i)) for i in range(first.n)]
+        views = [first]
+
+        for _ in range(120):
+            u, v = rng.sample(vertices, 2)
+            if rng.random() < 0.1:
+                maze.add_vertex(Vertex(rng.random() < 0.5))
+            elif not maze.block_edge(u, v):
+                maze.fix_edge(u, v)
+
+            view = maze.compact_view()
+            should_be_equal(view.n, len(maze.vertices), "compact.patched")
+            for i, w in enumerate(maze.vertices):
+                should_be_equal(
+                    sorted(view.neighbours(i)),
+                    sorted(maze._index[x] for x in w.edges),
+                    "compact.patched"
+                )
+                should_be_equal(view.has_food(i), w.has_food,
+                                "compact.patched")
+            views.append(view)
+
+        should_be_equal(views[1].targets is first.targets, True,
+                        "compact.patched")
+        should_be_equal(views[1] is first, False, "compact.patched")
+        should_be_equal(views[-1].targets is first.targets, False,
+                        "maze.compact_view")
+        should_be_equal(
+            [list(first.neighbours(i)) for i in range(first.n)],
+            rows,
+            "compact.patched"
+        )
+
+        maze.add_vertex(Vertex(True))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "maze.bin")
+            maze.save(path)
+            with CompactMaze.open(path) as mapped:
+                view = maze.compact_view()
+                should_be_equal(mapped.n, view.n, "compact.save")
+                for i in range(view.n):
+                    should_be_equal(
+                        list(mapped.neighbours(i)),
+                        list(view.neighbours(i)),
+                        "compact.save"
+                    )
+                    should_be_equal(mapped.has_food(i), view.has_food(i),
+                                    "compact.save")
+
+    def test_matches_object_graph(self):
+        """
+        Both modes should give the same answers on random mazes.
+        """
+
+        for seed in range(20):
+            plain, pv = random_maze(seed, 25, 40, False)
+            packed, cv = random_maze(seed, 25, 40, True)
+            rng = random.Random(seed)
+            for _ in range(20):
+                a = rng.randrange(25)
+                b = rng.randrange(25)
+                k = rng.randrange(4)
+                x = rng.randrange(3)
+
+                got = packed.find_path(cv[a], cv[b], k)
+                expected = plain.find_path(pv[a], pv[b], k)
+                should_be_equal(
+                    None if got is None else [cv.index(v) for v in got],
+                    None if expected is None else [pv.index(v) for v in expected],
+                    "find_path"
+                )
+                should_be_equal(
+                    packed.exists_path_with_extra_food(cv[a], cv[b], k, x),
+                    plain.exists_path_with_extra_food(pv[a], pv[b], k, x),
+                    "exists_path_with_extra_food"
+                )
+
+    def test_save_and_open(self):
+        """
+        A saved maze should map back with the same arrays and answers.
+        """
+
+        maze, _ = random_maze(7, 40, 80, True)
+        view = maze.compact_view()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "maze.bin")
+            maze.save(path)
+
+            with CompactMaze.open(path) as mapped:
+                should_be_equal(mapped.n, view.n, "compact.open")
+                should_be_equal(
+                    list(mapped.offsets),
+                    list(view.offsets),
+                    "compact.open"
+                )
+                should_be_equal(
+                    list(mapped.targets),
+                    list(view.targets),
+                    "compact.open"
+                )
+                for i in range(view.n):
+                    should_be_equal(
+                        mapped.has_food(i),
+                        view.has_food(i),
+                        "compact.has_food"
+                    )
+                for s in range(0, 40, 7):
+                    for t in range(0, 40, 5):
+                        should_be_equal(
+                            mapped.find_path(s, t, 2),
+                            view.find_path(s, t, 2),
+                            "compact.find_path"
+                        )
+
+    def test_open_rejects_other_files(self):
+        """
+        Opening something that isn't a saved maze should fail loudly.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "junk.bin")
+            with open(path, "wb") as f:
+                f.write(b"not a maze at all, just some bytes")
+            with self.assertRaises(ValueError):
+                CompactMaze.open(path)
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def reachable(v):
+    """
+    Every vertex reachable from v, by flood fill.
+    """
+
+    seen = {v}
+    stack = [v]
+    while stack:
+        for w in stack.pop().edges:
+            if w not in seen:
+                seen.add(w)
+                stack.append(w)
+    return seen
+
+
+class TestConnectivity(unittest.TestCase):
+
+    def test_split_and_merge(self):
+        """
+        Blocking a bridge splits a component, fixing it joins them again.
+        """
+
+        # A -- B -- C    D
+
+        A = Vertex(True)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(True)
+
+        m = QuokkaMaze()
+        for v in [A, B, C]:
+            m.add_vertex(v)
+        m.fix_edge(A, B)
+        m.fix_edge(B, C)
+
+        conn = m.connectivity()
+        m.add_vertex(D)
+
+        should_be_equal(conn.connected(A, C), True, "connected")
+        should_be_equal(conn.connected(A, D), False, "connected")
+        should_be_equal(conn.component_size(B), 3, "component_size")
+        should_be_equal(m.find_path(A, D, 5), None, "find_path")
+
+        m.block_edge(B, C)
+        should_be_equal(conn.connected(A, C), False, "connected")
+        should_be_equal(conn.component_size(C), 1, "component_size")
+        should_be_equal(
+            m.exists_path_with_extra_food(A, C, 1, 5),
+            False,
+            "exists_path_with_extra_food"
+        )
+
+        m.fix_edge(C, D)
+        m.fix_edge(D, A)
+        should_be_equal(conn.connected(B, C), True, "connected")
+        should_be_equal(conn.component_size(A), 4, "component_size")
+        should_be_equal(m.find_path(A, C, 1), [A, D, C], "find_path")
+
+    def test_matches_flood_fill(self):
+        """
+        Labels should match a flood fill after random changes.
+        """
+
+        for seed in range(20):
+            rng = random.Random(seed)
+            vertices = [Vertex(True) for _ in range(25)]
+            m = QuokkaMaze()
+            for v in vertices[:15]:
+                m.add_vertex(v)
+            conn = m.connectivity()
+            for v in vertices[15:]:
+                m.add_vertex(v)
+
+            for _ in range(150):
+                u, v = rng.choice(vertices), rng.choice(vertices)
+                if rng.random() < 0.5:
+                    m.fix_edge(u, v)
+                else:
+                    m.block_edge(u, v)
+
+                a = rng.choice(vertices)
+                component = reachable(a)
+                should_be_equal(
+                    conn.component_size(a),
+                    len(component),
+                    "component_size"
+                )
+                for b in vertices:
+                    should_be_equal(
+                        conn.connected(a, b),
+                        b in component,
+                        "connected"
+                    )
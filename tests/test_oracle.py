@@ -0,0 +1,142 @@
+import random
+import unittest
+
+import search
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def check_valid_path(path, s, t, k):
+    """
+    The path should be simple, follow edges and never go more than k steps
+    between locations with food.
+    """
+
+    should_be_equal(path[0], s, "find_path", "Path starts elsewhere")
+    should_be_equal(path[-1], t, "find_path", "Path ends elsewhere")
+    should_be_equal(len(set(path)), len(path), "find_path", "Path not simple")
+    steps = 0
+    for a, b in zip(path, path[1:]):
+        assert b in a.edges, "[find_path] MSG: Path uses a missing edge"
+        steps += 1
+        assert steps <= k, "[find_path] MSG: Path runs out of food"
+        if b.has_food:
+            steps = 0
+
+
+class TestFoodOracle(unittest.TestCase):
+
+    def test_comment_example(self):
+        """
+        The find_path examples should work through the index.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+        for v in [A, B, C, D, E]:
+            m.add_vertex(v)
+        m.fix_edge(A, B)
+        m.fix_edge(B, C)
+        m.fix_edge(C, D)
+        m.fix_edge(D, E)
+
+        m.food_oracle(2)
+        m.food_oracle(1)
+        m.food_oracle(4)
+
+        should_be_equal(m.find_path(A, E, 2), [A, B, C, D, E], "find_path")
+        should_be_equal(m.find_path(A, E, 1), None, "find_path")
+        should_be_equal(m.find_path(A, C, 4), [A, B, C], "find_path")
+        should_be_equal(m.find_path(E, A, 2), [E, D, C, B, A], "find_path")
+
+        m.block_edge(C, D)
+        should_be_equal(m.find_path(A, E, 2), None, "find_path")
+        m.fix_edge(C, D)
+        should_be_equal(m.find_path(A, E, 2), [A, B, C, D, E], "find_path")
+
+        should_be_equal(m.drop_food_oracle(2), True, "drop_food_oracle")
+        should_be_equal(m.drop_food_oracle(2), False, "drop_food_oracle")
+
+    def test_fewest_hops_not_fewest_food(self):
+        """
+        A route through more locations with food should win when it is
+        shorter.
+        """
+
+        #           *
+        # +-------- F --------+
+        # |                   |
+        # S -- A -- B -- C -- T
+
+        S, A, B, C, T = (Vertex(False) for _ in range(5))
+        F = Vertex(True)
+
+        m = QuokkaMaze()
+        m.add_vertices([S, A, B, C, T, F])
+        m.fix_edges([(S, A), (A, B), (B, C), (C, T), (S, F), (F, T)])
+
+        should_be_equal(m.food_oracle(4).find_path(S, T), [S, F, T],
+                        "FoodOracle.find_path")
+
+    def test_matches_full_search_under_changes(self):
+        """
+        The index should agree with a maze without one while edges change.
+        """
+
+        for seed in range(30):
+            rng = random.Random(seed)
+            n = 30
+            k = rng.randint(1, 4)
+            vertices = [Vertex(rng.random() < 0.3) for _ in range(n)]
+            indexed = QuokkaMaze()
+            for v in vertices:
+                indexed.add_vertex(v)
+            indexed.food_oracle(k)
+
+            for _ in range(200):
+                u, v = rng.choice(vertices), rng.choice(vertices)
+                if rng.random() < 0.6:
+                    indexed.fix_edge(u, v)
+                else:
+                    indexed.block_edge(u, v)
+
+                s, t = rng.choice(vertices), rng.choice(vertices)
+                got = indexed.find_path(s, t, k)
+                expected = search.find_path(
+                    s,
+                    t,
+                    k,
+                    lambda a: a.edges,
+                    lambda a: a.has_food
+                )
+                should_be_equal(
+                    got is None,
+                    expected is None,
+                    "find_path",
+                    "Index and full search disagree"
+                )
+                if got is not None:
+                    check_valid_path(got, s, t, k)
+                    should_be_equal(
+                        len(got),
+                        len(expected),
+                        "find_path",
+                        "Index path has more hops than the full search"
+                    )
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+from parallel import QueryPool
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestQueryPool(unittest.TestCase):
+
+    def test_matches_maze(self):
+        """
+        The workers should give the same answers as the maze itself.
+        """
+
+        rng = random.Random(11)
+        vertices = [Vertex(rng.random() < 0.3) for _ in range(60)]
+        maze = QuokkaMaze(compact=True)
+        maze.add_vertices(vertices)
+        maze.fix_edges(
+            (rng.choice(vertices), rng.choice(vertices)) for _ in range(120)
+        )
+
+        queries = [
+            (rng.choice(vertices), rng.choice(vertices), rng.randint(0, 3))
+            for _ in range(80)
+        ]
+        food_queries = [(s, t, k, rng.randint(0, 2)) for s, t, k in queries]
+
+        with QueryPool(maze, processes=2) as pool:
+            should_be_equal(
+                pool.find_paths(queries),
+                maze.find_paths(queries),
+                "pool.find_paths"
+            )
+            should_be_equal(
+                pool.exists_paths_with_extra_food(food_queries),
+                maze.exists_paths_with_extra_food(food_queries),
+                "pool.exists_paths_with_extra_food"
+            )
+
+            # Changes to the maze are published before the next batch.
+            s, t = queries[0][0], queries[0][1]
+            for v in list(s.edges):
+                maze.block_edge(s, v)
+            should_be_equal(
+                pool.find_paths([(s, t, 3)]),
+                [[s] if s is t else None],
+                "pool.find_paths"
+            )
@@ -0,0 +1,190 @@
+import random
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def valid(path, s, t, k):
+    """
+    Whether `path` is a simple path from `s` to `t` along existing edges,
+    with at most `k` hops between locations with food.
+    """
+    if path[0] is not s or path[-1] is not t:
+        return False
+    if len(set(map(id, path))) != len(path):
+        return False
+    hops = 0
+    for u, v in zip(path, path[1:]):
+        if v not in u.edges:
+            return False
+        hops += 1
+        if hops > k:
+            return False
+        if v.has_food or v is t:
+            hops = 0
+    return True
+
+
+class TestRoutes(unittest.TestCase):
+
+    def test_route_repaired_locally(self):
+        """
+        A blocked edge should be routed around between the food on either
+        side of it, keeping the rest of the route.
+        """
+
+        #      *         *         *
+        # A -- B -- C -- D -- E -- F -- G
+        #           |    |
+        #           H -- I
+
+        A, C, E, G, H, I = (Vertex(False) for _ in range(6))
+        B, D, F = (Vertex(True) for _ in range(3))
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B, C, D, E, F, G, H, I])
+        m.fix_edges([
+            (A, B), (B, C), (C, D), (D, E), (E, F), (F, G),
+            (C, H), (H, I), (I, D)
+        ])
+
+        route = m.track_route(A, G, 4)
+        should_be_equal(m.route(route), [A, B, C, D, E, F, G], "maze.route")
+
+        m.block_edge(C, D)
+        should_be_equal(
+            m.route(route),
+            [A, B, C, H, I, D, E, F, G],
+            "maze.route"
+        )
+        should_be_equal(m._routes.local_repairs, 1, "Routes.local_repairs")
+        should_be_equal(m._routes.full_repairs, 0, "Routes.full_repairs")
+
+    def test_route_falls_back_and_is_lost(self):
+        """
+        With no detour the whole route should be searched for again, and a
+        route with no path left should come back once an edge is fixed.
+        """
+
+        #      *
+        # A -- B -- C -- D
+        # |              |
+        # E -------------+
+
+        A, C, D, E = (Vertex(False) for _ in range(4))
+        B = Vertex(True)
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B, C, D, E])
+        m.fix_edges([(A, B), (B, C), (C, D), (A, E), (E, D)])
+
+        route = m.track_route(B, D, 3)
+        should_be_equal(m.route(route), [B, C, D], "maze.route")
+
+        m.block_edge(B, C)
+        should_be_equal(m.route(route), [B, A, E, D], "maze.route")
+        should_be_equal(m._routes.local_repairs, 0, "Routes.local_repairs")
+        should_be_equal(m._routes.full_repairs, 1, "Routes.full_repairs")
+
+        m.block_edge(A, E)
+        should_be_equal(m.route(route), None, "maze.route")
+        should_be_equal(m._routes.lost, 1, "Routes.lost")
+
+        m.fix_edge(B, C)
+        should_be_equal(m.route(route), [B, C, D], "maze.route")
+
+    def test_route_between_components(self):
+        """
+        A route between components that aren't connected yet should still be
+        tracked, and found once an edge joins them.
+        """
+
+        A, B = Vertex(False), Vertex(False)
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B])
+        m.connectivity()
+
+        route = m.track_route(A, B, 1)
+        should_be_equal(route is None, False, "maze.track_route")
+        should_be_equal(m.route(route), None, "maze.route")
+
+        m.fix_edge(A, B)
+        should_be_equal(m.route(route), [A, B], "maze.route")
+
+    def test_untouched_routes(self):
+        """
+        Only the routes over a blocked edge should change, and untracked
+        routes should not be repaired.
+        """
+
+        # A -- B    C -- D
+
+        A, B, C, D = (Vertex(False) for _ in range(4))
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B, C, D])
+        m.fix_edges([(A, B), (C, D)])
+
+        should_be_equal(m.route(0), None, "maze.route")
+        should_be_equal(m.track_route(A, B, -1), None, "maze.track_route")
+
+        first = m.track_route(A, B, 1)
+        second = m.track_route(C, D, 1)
+        kept = m._routes._routes[second][3]
+
+        m.block_edge(A, B)
+        should_be_equal(m.route(first), None, "maze.route")
+        should_be_equal(m._routes._routes[second][3] is kept, True,
+                        "maze.route")
+
+        should_be_equal(m.untrack_route(second), True, "maze.untrack_route")
+        should_be_equal(m.untrack_route(second), False, "maze.untrack_route")
+        m.block_edge(C, D)
+        should_be_equal(m._routes.lost, 1, "Routes.lost")
+
+    def test_repairs_match_find_path(self):
+        """
+        Repaired routes should be valid whenever `find_path` finds a route.
+        """
+
+        rng = random.Random(24)
+        for _ in range(30):
+            vertices = [Vertex(rng.random() < 0.4) for _ in range(14)]
+            m = QuokkaMaze()
+            m.add_vertices(vertices)
+            edges = [
+                (u, v) for i, u in enumerate(vertices)
+                for v in vertices[i + 1:] if rng.random() < 0.25
+            ]
+            m.fix_edges(edges)
+
+            k = rng.randint(1, 3)
+            routes = [
+                (m.track_route(s, t, k), s, t)
+                for s, t in (rng.sample(vertices, 2) for _ in range(6))
+            ]
+            for u, v in rng.sample(edges, len(edges) // 2):
+                m.block_edge(u, v)
+                for route, s, t in routes:
+                    path = m.route(route)
+                    if path is None:
+                        should_be_equal(m.find_path(s, t, k), None,
+                                        "maze.route")
+                    else:
+                        should_be_equal(valid(path, s, t, k), True,
+                                        "maze.route")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -223,6 +223,30 @@ class TestSampleGraph(unittest.TestCase):
             "maze.fix_edge"
         )
 
+    def test_invalid_edges(self):
+        """
+        Self loops and vertices outside the maze can't be fixed or blocked.
+        """
+
+        A = Vertex(True)
+        B = Vertex(True)
+        C = Vertex(True)
+
+        m = QuokkaMaze()
+
+        should_be_true(m.add_vertex(A), "maze.add_vertex")
+        should_be_true(m.add_vertex(B), "maze.add_vertex")
+
+        should_be_false(m.fix_edge(A, A), "maze.fix_edge")
+        should_be_false(m.fix_edge(A, C), "maze.fix_edge")
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_false(m.fix_edge(B, A), "maze.fix_edge")
+
+        should_be_false(m.block_edge(A, C), "maze.block_edge")
+        should_be_true(m.block_edge(B, A), "maze.block_edge")
+        should_be_false(m.block_edge(A, B), "maze.block_edge")
+        check_edges(A, B, False)
+
     def test_find_path_comment_example(self):
         """
         Checks that we can find the path as shown in comments.
@@ -307,6 +331,65 @@ class TestSampleGraph(unittest.TestCase):
 
 
 
+    def test_queries_leave_vertices_untouched(self):
+        """
+        Searching should not store any state on the vertices.
+        """
+
+        A = Vertex(True)
+        B = Vertex(False)
+        C = Vertex(True)
+
+        m = QuokkaMaze()
+
+        should_be_true(m.add_vertex(A), "maze.add_vertex")
+        should_be_true(m.add_vertex(B), "maze.add_vertex")
+        should_be_true(m.add_vertex(C), "maze.add_vertex")
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_true(m.fix_edge(B, C), "maze.fix_edge")
+
+        def fields(v):
+            return {name: getattr(v, name) for name in Vertex.__slots__}
+
+        before = [fields(v) for v in (A, B, C)]
+
+        check_path_should_match(m.find_path(A, C, 2), [A, B, C])
+        should_be_true(
+            m.exists_path_with_extra_food(A, C, 1, 1),
+            "maze.exists_path_with_extra_food"
+        )
+
+        should_be_equal(
+            [fields(v) for v in (A, B, C)],
+            before,
+            "maze.find_path",
+            "Vertices were modified by a query"
+        )
+
+    def test_find_path_long_corridor(self):
+        """
+        A long corridor should come back whole and in order.
+        """
+
+        corridor = [Vertex(i % 3 == 0) for i in range(20001)]
+
+        m = QuokkaMaze()
+
+        for v in corridor:
+            m.add_vertex(v)
+        for u, v in zip(corridor, corridor[1:]):
+            m.fix_edge(u, v)
+
+        check_path_should_match(
+            m.find_path(corridor[0], corridor[-1], 3),
+            corridor,
+        )
+        should_be_true(
+            m.find_path(corridor[0], corridor[-1], 2) is None,
+            "maze.find_path",
+            "Returned not `None` path when no valid path exists"
+        )
+
     def test_exists_path_sample_comments(self):
         """
         Checks that the example in the comment can be run.
@@ -355,6 +438,60 @@ class TestSampleGraph(unittest.TestCase):
             "Able to reach path with extra added food, should be true."
         )
 
+    def test_plan_path_sample_comments(self):
+        """
+        The plan should agree with exists_path_with_extra_food and leave the
+        food where it was.
+        """
+
+        #                     *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(False)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([A, B, C, D, E])
+            m.fix_edges([(A, B), (B, C), (C, D), (D, E)])
+
+            should_be_equal(
+                m.plan_path_with_extra_food(A, E, 2, 1),
+                ([A, B, C, D, E], [C]),
+                "maze.plan_path_with_extra_food"
+            )
+            should_be_equal(
+                m.plan_path_with_extra_food(A, E, 2, 0),
+                None,
+                "maze.plan_path_with_extra_food"
+            )
+            should_be_equal(
+                m.plan_path_with_extra_food(A, A, 0, 0),
+                ([A], []),
+                "maze.plan_path_with_extra_food"
+            )
+
+            path, placed = m.plan_path_with_extra_food(A, E, 1, 6)
+            should_be_equal(
+                path,
+                [A, B, C, D, E],
+                "maze.plan_path_with_extra_food"
+            )
+            should_be_equal(
+                set(placed),
+                {B, C, D},
+                "maze.plan_path_with_extra_food"
+            )
+            should_be_equal(
+                [v.has_food for v in (A, B, C, D, E)],
+                [False, False, False, False, True],
+                "maze.plan_path_with_extra_food",
+                "has_food was modified"
+            )
+
     def test_exists_path1(self):
         A = Vertex(False)
         B = Vertex(False)
@@ -489,3 +626,35 @@ class TestSampleGraph(unittest.TestCase):
         )
 
 
+
+    def test_bulk_loading(self):
+        """
+        Bulk loading skips duplicates and invalid pairs.
+        """
+
+        A = Vertex(True)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+
+        m = QuokkaMaze()
+
+        should_be_equal(
+            m.add_vertices([A, B, None, A, C]),
+            3,
+            "maze.add_vertices"
+        )
+        should_be_equal(m.add_vertices([C]), 0, "maze.add_vertices")
+        should_be_equal(len(m.vertices), 3, "maze.add_vertices")
+
+        should_be_equal(
+            m.fix_edges([(A, B), (B, A), (B, C), (C, C), (C, D), (None, A)]),
+            2,
+            "maze.fix_edges"
+        )
+        check_edges(A, B, True)
+        check_edges(B, C, True)
+        check_edges(C, D, False)
+        should_be_false(m.fix_edge(A, B), "maze.fix_edge")
+
+        check_path_should_match(m.find_path(A, C, 2), [A, B, C])
@@ -110,3 +110,82 @@ class TestSampleVertex(unittest.TestCase):
             2,
             "vertex.rm_edge"
         )
+
+    def test_rm_edge_keeps_remaining_edges(self):
+        """
+        Removing an edge from the middle should keep the others reachable.
+        """
+
+        A = Vertex(True)
+        B = Vertex(True)
+        C = Vertex(True)
+        D = Vertex(True)
+
+        A.add_edge(B)
+        A.add_edge(C)
+        A.add_edge(D)
+
+        A.rm_edge(B)
+
+        should_be_equal(
+            len(A.edges),
+            2,
+            "vertex.rm_edge"
+        )
+        should_be_false(A.has_edge(B), "vertex.has_edge")
+        should_be_true(A.has_edge(C), "vertex.has_edge")
+        should_be_true(A.has_edge(D), "vertex.has_edge")
+
+        A.rm_edge(D)
+        A.rm_edge(C)
+
+        should_be_equal(
+            len(A.edges),
+            0,
+            "vertex.rm_edge"
+        )
+        should_be_false(A.has_edge(C), "vertex.has_edge")
+
+    def test_vertex_is_slotted(self):
+        """
+        Vertices carry no per-instance dict, and still compare by identity.
+        """
+
+        A = Vertex(True)
+        B = Vertex(True)
+
+        should_be_false(hasattr(A, "__dict__"), "vertex.__slots__")
+        with self.assertRaises(AttributeError):
+            A.visited = True
+
+        should_be_true(A == A, "vertex.__eq__")
+        should_be_false(A == B, "vertex.__eq__")
+        should_be_equal(len({A, B, A}), 2, "vertex.__hash__")
+
+    def test_edges_past_index_degree(self):
+        """
+        Edges should behave the same once a vertex has enough of them to be
+        indexed.
+        """
+
+        A = Vertex(True)
+        others = [Vertex(False) for _ in range(Vertex.INDEX_DEGREE + 4)]
+
+        for v in others:
+            A.add_edge(v)
+            A.add_edge(v)
+
+        should_be_equal(len(A.edges), len(others), "vertex.add_edge")
+        should_be_true(all(A.has_edge(v) for v in others), "vertex.has_edge")
+
+        for v in others[::2]:
+            A.rm_edge(v)
+        A.rm_edge(others[0])
+
+        should_be_equal(
+            set(A.edges),
+            set(others[1::2]),
+            "vertex.rm_edge"
+        )
+        should_be_false(A.has_edge(others[0]), "vertex.has_edge")
+        should_be_true(A.has_edge(others[-1]), "vertex.has_edge")
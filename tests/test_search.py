@@ -0,0 +1,775 @@
+import random
+import unittest
+
+import benchmark
+import search
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def random_graph(rng, n, m):
+    """
+    Random adjacency lists and food flags over ids 0..n-1.
+    """
+
+    adj = {i: [] for i in range(n)}
+    for _ in range(m):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b and b not in adj[a]:
+            adj[a].append(b)
+            adj[b].append(a)
+    food = [rng.random() < 0.3 for _ in range(n)]
+    return adj, food
+
+
+def min_food_on_path(path, food, k):
+    """
+    Fewest extra food needed along one fixed path, or None.
+    """
+
+    t = path[-1]
+    labels = {0: 0}
+    for v in path[1:]:
+        nxt = {}
+        for steps, used in labels.items():
+            if steps + 1 > k:
+                continue
+            if v == t or food[v]:
+                nxt[0] = min(nxt.get(0, used), used)
+                continue
+            if steps + 1 < k:
+                nxt[steps + 1] = min(nxt.get(steps + 1, used), used)
+            nxt[0] = min(nxt.get(0, used + 1), used + 1)
+        labels = nxt
+    return min(labels.values()) if labels else None
+
+
+def brute_force(adj, food, s, t, k):
+    """
+    Fewest extra food over every simple path from s to t, or None.
+    """
+
+    if s == t:
+        return 0
+    best = [None]
+
+    def dfs(path, seen):
+        v = path[-1]
+        if v == t:
+            cost = min_food_on_path(path, food, k)
+            if cost is not None and (best[0] is None or cost < best[0]):
+                best[0] = cost
+            return
+        for w in adj[v]:
+            if w not in seen:
+                seen.add(w)
+                path.append(w)
+                dfs(path, seen)
+                path.pop()
+                seen.discard(w)
+
+    dfs([s], {s})
+    return best[0]
+
+
+def check_simple_path(path, adj, s, t):
+    """
+    The path should start at s, end at t, follow edges and not repeat.
+    """
+
+    should_be_equal(path[0], s, "search", "Path starts elsewhere")
+    should_be_equal(path[-1], t, "search", "Path ends elsewhere")
+    should_be_equal(len(set(path)), len(path), "search", "Path not simple")
+    for a, b in zip(path, path[1:]):
+        assert b in adj[a], f"[search] MSG: {a} and {b} are not connected"
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_revisit_with_better_budget(self):
+        """
+        A vertex reached first with little food left must be retried later.
+        """
+
+        #      a -- m -- n -- t
+        #     /    /
+        #    s -- b -- f*
+
+        s = Vertex(True)
+        a = Vertex(False)
+        b = Vertex(False)
+        f = Vertex(True)
+        m = Vertex(False)
+        n = Vertex(False)
+        t = Vertex(True)
+
+        maze = QuokkaMaze()
+        for v in [s, a, b, f, m, n, t]:
+            maze.add_vertex(v)
+        maze.fix_edge(s, a)
+        maze.fix_edge(a, m)
+        maze.fix_edge(s, b)
+        maze.fix_edge(b, f)
+        maze.fix_edge(f, m)
+        maze.fix_edge(m, n)
+        maze.fix_edge(n, t)
+
+        should_be_equal(
+            maze.find_path(s, t, 3),
+            [s, b, f, m, n, t],
+            "maze.find_path"
+        )
+        should_be_equal(
+            maze.exists_path_with_extra_food(s, t, 2, 0),
+            False,
+            "maze.exists_path_with_extra_food"
+        )
+        should_be_equal(
+            maze.exists_path_with_extra_food(s, t, 2, 1),
+            True,
+            "maze.exists_path_with_extra_food"
+        )
+
+    def test_turned_down_state_is_searched(self):
+        """
+        A state turned down for being on its own chain can be the only way
+        to a route, so the searches must find it when they may search
+        exhaustively.
+        """
+
+        #  s* -- p1 -- X -- y -- t*
+        #  |           |
+        #  q1 -- q2 -- w*
+
+        s = Vertex(True)
+        p1 = Vertex(False)
+        X = Vertex(False)
+        w = Vertex(True)
+        q1 = Vertex(False)
+        q2 = Vertex(False)
+        y = Vertex(False)
+        t = Vertex(True)
+        route = [s, q1, q2, w, X, y, t]
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([s, p1, X, w, q1, q2, y, t])
+            m.fix_edges([
+                (s, p1), (s, q1), (p1, X), (X, w),
+                (q1, q2), (q2, w), (X, y), (y, t)
+            ])
+            should_be_equal(m.find_path(s, t, 3), None, "maze.find_path")
+            should_be_equal(t in m.reachable_from(s, 3), False,
+                            "maze.reachable_from")
+
+            m = QuokkaMaze(compact=compact, exhaustive=100)
+            m.add_vertices([s, p1, X, w, q1, q2, y, t])
+            m.fix_edges([
+                (s, p1), (s, q1), (p1, X), (X, w),
+                (q1, q2), (q2, w), (X, y), (y, t)
+            ])
+
+            for method in ("bfs", "bidirectional"):
+                should_be_equal(
+                    m.find_path(s, t, 3, method=method),
+                    route,
+                    "maze.find_path"
+                )
+            should_be_equal(m.find_path(s, t, 2), None, "maze.find_path")
+            should_be_equal(m.find_paths([(s, t, 3)]), [route],
+                            "maze.find_paths")
+            should_be_equal(
+                m.exists_path_with_extra_food(s, t, 3, 0),
+                True,
+                "maze.exists_path_with_extra_food"
+            )
+            should_be_equal(
+                m.plan_path_with_extra_food(s, t, 3, 0),
+                (route, []),
+                "maze.plan_path_with_extra_food"
+            )
+
+            m.landmarks()
+            should_be_equal(
+                m.find_path(s, t, 3, method="astar"),
+                route,
+                "maze.find_path"
+            )
+
+    def test_exhaustive_search_is_bounded(self):
+        """
+        The searches should stay polynomial on the benchmark maps, and the
+        exhaustive search should stop after its budget where no route
+        exists but many simple paths do.
+        """
+
+        n, edges, food = benchmark.make_map("geometric", 1000, 0)
+        for exhaustive in (0, 1000):
+            maze = QuokkaMaze(exhaustive=exhaustive)
+            vertices = [Vertex(f) for f in food]
+            maze.add_vertices(vertices)
+            maze.fix_edges((vertices[i], vertices[j]) for i, j in edges)
+            expanded = []
+            maze.stats().subscribe(lambda q: expanded.append(q.expanded))
+
+            rng = random.Random(f"queries-geometric-{n}-0")
+            for _ in range(50):
+                s, t = rng.choice(vertices), rng.choice(vertices)
+                maze.find_path(s, t, 4)
+                maze.exists_path_with_extra_food(s, t, 4, 2)
+            should_be_equal(len(expanded), 100, "maze.stats")
+            assert max(expanded) <= n * 4 * 3 + exhaustive, \
+                f"A query expanded {max(expanded)} states"
+
+        # A 6x6 grid of food, then a corridor p - c1 - c2 - t that is one
+        # hop too long, with food hanging off c1 that can't be used.
+        grid = [Vertex(True) for _ in range(36)]
+        p, c1, c2, t = (Vertex(False) for _ in range(4))
+        side = Vertex(True)
+        lattice = [
+            (grid[i], grid[i + 1]) for i in range(36) if i % 6 < 5
+        ] + [(grid[i], grid[i + 6]) for i in range(30)]
+
+        for compact in (False, True):
+            maze = QuokkaMaze(compact=compact, exhaustive=1000)
+            maze.add_vertices(grid + [p, c1, c2, t, side])
+            maze.fix_edges(
+                lattice + [(grid[35], p), (p, c1), (c1, c2), (c2, t),
+                           (c1, side)]
+            )
+            expanded = []
+            maze.stats().subscribe(lambda q: expanded.append(q.expanded))
+
+            should_be_equal(maze.find_path(grid[0], t, 3), None,
+                            "maze.find_path")
+            should_be_equal(
+                maze.exists_path_with_extra_food(grid[0], t, 3, 0),
+                False,
+                "maze.exists_path_with_extra_food"
+            )
+            assert max(expanded) <= 41 * 3 + 1000, \
+                f"A query expanded {max(expanded)} states"
+
+    def test_matches_brute_force(self):
+        """
+        Compare against trying every simple path on small graphs.
+        """
+
+        for seed in range(400):
+            rng = random.Random(seed)
+            n = rng.randint(2, 9)
+            adj, food = random_graph(rng, n, rng.randint(0, 16))
+            s, t = rng.randrange(n), rng.randrange(n)
+            k = rng.randint(0, 4)
+            x = rng.randint(0, 3)
+            expected = brute_force(adj, food, s, t, k)
+
+            path = search.find_path(
+                s, t, k, adj.__getitem__, food.__getitem__
+            )
+            should_be_equal(path is not None, expected == 0, "find_path")
+            if path is not None:
+                check_simple_path(path, adj, s, t)
+                should_be_equal(
+                    min_food_on_path(path, food, k),
+                    0,
+                    "find_path"
+                )
+
+            path = search.find_path_bidirectional(
+                s, t, k, adj.__getitem__, food.__getitem__
+            )
+            should_be_equal(
+                path is not None,
+                expected == 0,
+                "find_path_bidirectional"
+            )
+            if path is not None:
+                check_simple_path(path, adj, s, t)
+                should_be_equal(
+                    min_food_on_path(path, food, k),
+                    0,
+                    "find_path_bidirectional"
+                )
+
+            best = search.min_extra_food(
+                s, t, k, adj.__getitem__, food.__getitem__
+            )
+            should_be_equal(
+                None if best is None else len(best[1]),
+                expected,
+                "min_extra_food"
+            )
+            if best is not None:
+                check_simple_path(best[0], adj, s, t)
+                should_be_equal(
+                    min_food_on_path(best[0], food, k),
+                    len(best[1]),
+                    "min_extra_food"
+                )
+
+            profile = search.find_path_profile(
+                s, t, adj.__getitem__, food.__getitem__
+            )
+            ks = [
+                kk for kk in range(n + 1)
+                if brute_force(adj, food, s, t, kk) == 0
+            ]
+            should_be_equal(
+                profile[0][0] if profile else None,
+                ks[0] if ks else None,
+                "find_path_profile",
+                "Smallest k differs from brute force"
+            )
+            for kk in range(n + 1):
+                entries = [path for pk, path in profile if pk <= kk]
+                expected_path = search.find_path(
+                    s, t, kk, adj.__getitem__, food.__getitem__
+                )
+                should_be_equal(
+                    len(entries[-1]) if entries else None,
+                    None if expected_path is None else len(expected_path),
+                    "find_path_profile",
+                    "Path length differs from find_path"
+                )
+                if entries:
+                    check_simple_path(entries[-1], adj, s, t)
+                    should_be_equal(
+                        min_food_on_path(entries[-1], food, kk),
+                        0,
+                        "find_path_profile"
+                    )
+
+            plan = search.find_path_with_extra_food(
+                s, t, k, x, adj.__getitem__, food.__getitem__
+            )
+            should_be_equal(
+                plan is not None,
+                expected is not None and expected <= x,
+                "find_path_with_extra_food"
+            )
+            if plan is not None:
+                check_simple_path(plan[0], adj, s, t)
+                assert len(plan[1]) <= x
+
+    def test_bidirectional_comment_example(self):
+        """
+        The find_path examples should hold when searching from both ends.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([A, B, C, D, E])
+            m.fix_edges([(A, B), (B, C), (C, D), (D, E)])
+
+            should_be_equal(
+                m.find_path(A, E, 2, method="bidirectional"),
+                [A, B, C, D, E],
+                "maze.find_path"
+            )
+            should_be_equal(
+                m.find_path(A, E, 1, method="bidirectional"),
+                None,
+                "maze.find_path"
+            )
+            should_be_equal(
+                m.find_path(A, C, 4, method="bidirectional"),
+                [A, B, C],
+                "maze.find_path"
+            )
+            should_be_equal(
+                m.find_path(A, C, 4, method="sideways"),
+                None,
+                "maze.find_path"
+            )
+
+    def test_astar_matches_bfs(self):
+        """
+        A* with landmarks should find paths as short as BFS, also after the
+        maze changes.
+        """
+
+        for compact in (False, True):
+            rng = random.Random(3)
+            vertices = [Vertex(rng.random() < 0.4) for _ in range(60)]
+            maze = QuokkaMaze(compact=compact)
+            maze.add_vertices(vertices)
+            maze.fix_edges(
+                (rng.choice(vertices), rng.choice(vertices))
+                for _ in range(100)
+            )
+            maze.landmarks(4)
+
+            for step in range(150):
+                u, v = rng.choice(vertices), rng.choice(vertices)
+                if step % 3 == 0:
+                    maze.fix_edge(u, v)
+                elif step % 3 == 1:
+                    maze.block_edge(u, v)
+
+                s, t = rng.choice(vertices), rng.choice(vertices)
+                k = rng.randint(1, 4)
+                expected = maze.find_path(s, t, k)
+                got = maze.find_path(s, t, k, method="astar")
+                should_be_equal(
+                    None if got is None else len(got),
+                    None if expected is None else len(expected),
+                    "maze.find_path",
+                    "A* path length differs from BFS"
+                )
+
+    def test_astar_with_coordinates(self):
+        """
+        A caller supplied heuristic steers the search.
+        """
+
+        corridor = [Vertex(True) for _ in range(10)]
+        m = QuokkaMaze()
+        m.add_vertices(corridor)
+        m.fix_edges(zip(corridor, corridor[1:]))
+        position = {v: i for i, v in enumerate(corridor)}
+
+        should_be_equal(
+            m.find_path(
+                corridor[2],
+                corridor[7],
+                1,
+                method="astar",
+                heuristic=lambda v, t: abs(position[v] - position[t])
+            ),
+            corridor[2:8],
+            "maze.find_path"
+        )
+
+    def test_min_extra_food_comment_example(self):
+        """
+        Checks the examples in the min_extra_food comments.
+        """
+
+        #                     *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(False)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([A, B, C, D, E])
+            m.fix_edges([(A, B), (B, C), (C, D), (D, E)])
+
+            should_be_equal(
+                m.min_extra_food(A, E, 2),
+                (1, [C]),
+                "min_extra_food"
+            )
+            should_be_equal(
+                m.min_extra_food(A, E, 1),
+                (3, [B, C, D]),
+                "min_extra_food"
+            )
+            should_be_equal(
+                m.min_extra_food(A, E, 4),
+                (0, []),
+                "min_extra_food"
+            )
+            should_be_equal(m.min_extra_food(A, E, 0), None, "min_extra_food")
+            should_be_equal(m.min_extra_food(A, E, -1), None, "min_extra_food")
+
+            should_be_equal(
+                [v.has_food for v in (A, B, C, D, E)],
+                [False, False, False, False, True],
+                "min_extra_food",
+                "has_food was modified"
+            )
+
+    def test_min_extra_food_matches_exists(self):
+        """
+        The count from min_extra_food should be enough for
+        exists_path_with_extra_food, and just enough unless the search
+        turned down the state that leads to a cheaper route.
+        """
+
+        # s -- a -- b -- f*
+        #      |         |
+        #      +-------- c -- d -- t
+        #
+        # The route through f needs no extra food, but the search first
+        # reaches f through c, so it turns c down when it comes from f.
+
+        s, a, b, c, d, t = (Vertex(False) for _ in range(6))
+        f = Vertex(True)
+        m = QuokkaMaze()
+        m.add_vertices([s, a, b, f, c, d, t])
+        m.fix_edges([
+            (s, a), (a, b), (b, f), (f, c), (a, c), (c, d), (d, t)
+        ])
+        should_be_equal(
+            m.min_extra_food(s, t, 3),
+            (1, [d]),
+            "maze.min_extra_food"
+        )
+        should_be_equal(
+            m.exists_path_with_extra_food(s, t, 3, 0),
+            True,
+            "maze.exists_path_with_extra_food"
+        )
+
+        rng = random.Random(14)
+        for _ in range(40):
+            vertices = [Vertex(rng.random() < 0.3) for _ in range(12)]
+            m = QuokkaMaze()
+            m.add_vertices(vertices)
+            m.fix_edges(
+                (rng.choice(vertices), rng.choice(vertices))
+                for _ in range(16)
+            )
+            for _ in range(10):
+                s, t = rng.sample(vertices, 2)
+                k = rng.randint(1, 3)
+                found = m.min_extra_food(s, t, k)
+                if found is None:
+                    should_be_equal(
+                        m.exists_path_with_extra_food(s, t, k, len(vertices)),
+                        False,
+                        "maze.min_extra_food"
+                    )
+                    continue
+                should_be_equal(
+                    m.exists_path_with_extra_food(s, t, k, found[0]),
+                    True,
+                    "maze.min_extra_food"
+                )
+                if found[0] > 0:
+                    should_be_equal(
+                        m.exists_path_with_extra_food(s, t, k, found[0] - 1),
+                        False,
+                        "maze.min_extra_food"
+                    )
+
+    def test_profile_comment_example(self):
+        """
+        Checks the examples in the min_k and find_path_profile comments.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+        #  \                  /
+        #   F --------------- G
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+        F = Vertex(False)
+        G = Vertex(False)
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([A, B, C, D, E, F, G])
+            m.fix_edges([
+                (A, B), (B, C), (C, D), (D, E), (A, F), (F, G), (G, E)
+            ])
+
+            should_be_equal(m.min_k(A, E), 2, "maze.min_k")
+            should_be_equal(m.min_k(A, A), 0, "maze.min_k")
+            should_be_equal(m.min_k(A, Vertex(True)), None, "maze.min_k")
+            should_be_equal(
+                m.find_path_profile(A, E),
+                [(2, [A, B, C, D, E]), (3, [A, F, G, E])],
+                "maze.find_path_profile"
+            )
+            for k, path in m.find_path_profile(A, E):
+                should_be_equal(
+                    m.find_path(A, E, k),
+                    path,
+                    "maze.find_path_profile"
+                )
+
+            m.block_edge(F, G)
+            should_be_equal(
+                m.find_path_profile(A, E),
+                [(2, [A, B, C, D, E])],
+                "maze.find_path_profile"
+            )
+
+        # The route for k = 3 needs a state the search turns down, so it
+        # is missed.
+        #
+        #  s* -- p1 -- X -- y -- t*
+        #  |           |
+        #  q1 -- q2 -- w*
+
+        s, w, t = (Vertex(True) for _ in range(3))
+        p1, X, q1, q2, y = (Vertex(False) for _ in range(5))
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([s, p1, X, w, q1, q2, y, t])
+            m.fix_edges([
+                (s, p1), (s, q1), (p1, X), (X, w),
+                (q1, q2), (q2, w), (X, y), (y, t)
+            ])
+
+            should_be_equal(m.min_k(s, t), 4, "maze.min_k")
+            should_be_equal(
+                m.find_path_profile(s, t),
+                [(4, [s, p1, X, y, t])],
+                "maze.find_path_profile"
+            )
+
+    def test_reachable_from_comment_example(self):
+        """
+        Checks the examples in the reachable_from comments.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([A, B, C, D, E])
+            m.fix_edges([(A, B), (B, C), (C, D), (D, E)])
+
+            should_be_equal(
+                m.reachable_from(A, 1),
+                {A: (0, None), B: (1, A)},
+                "maze.reachable_from"
+            )
+            should_be_equal(
+                m.reachable_from(A, 2),
+                {A: (0, None), B: (1, A), C: (2, B), D: (3, C), E: (4, D)},
+                "maze.reachable_from"
+            )
+            should_be_equal(m.reachable_from(A, -1), {}, "maze.reachable_from")
+
+            # The kept search is dropped once the maze changes.
+            m.block_edge(C, D)
+            should_be_equal(m.find_path(A, E, 2), None, "maze.find_path")
+            should_be_equal(
+                m.reachable_from(A, 2),
+                {A: (0, None), B: (1, A), C: (2, B)},
+                "maze.reachable_from"
+            )
+
+    def test_reachable_from_matches_searches(self):
+        """
+        Lookups in the kept search should give the same answers as searching.
+        """
+
+        for compact in (False, True):
+            rng = random.Random(9)
+            vertices = [Vertex(rng.random() < 0.3) for _ in range(50)]
+            maze = QuokkaMaze(compact=compact)
+            maze.add_vertices(vertices)
+            maze.fix_edges(
+                (rng.choice(vertices), rng.choice(vertices))
+                for _ in range(110)
+            )
+
+            for _ in range(20):
+                s = rng.choice(vertices)
+                k = rng.randint(0, 3)
+                x = rng.randint(0, 2)
+                paths = maze.find_paths((s, t, k) for t in vertices)
+                exists = maze.exists_paths_with_extra_food(
+                    (s, t, k, x) for t in vertices
+                )
+
+                reached = maze.reachable_from(s, k)
+                should_be_equal(
+                    set(reached),
+                    {t for t, p in zip(vertices, paths) if p is not None},
+                    "maze.reachable_from"
+                )
+                for t, path in zip(vertices, paths):
+                    should_be_equal(
+                        maze.find_path(s, t, k),
+                        path,
+                        "maze.find_path"
+                    )
+                    if path is not None:
+                        should_be_equal(
+                            reached[t],
+                            (len(path) - 1, path[-2] if t is not s else None),
+                            "maze.reachable_from"
+                        )
+
+                maze.reachable_from(s, k, x)
+                for t, found in zip(vertices, exists):
+                    should_be_equal(
+                        maze.exists_path_with_extra_food(s, t, k, x),
+                        found,
+                        "maze.exists_path_with_extra_food"
+                    )
+
+                maze.block_edge(rng.choice(vertices), rng.choice(vertices))
+                maze.fix_edge(rng.choice(vertices), rng.choice(vertices))
+
+    def test_batch_matches_single_queries(self):
+        """
+        Batched queries should give the same answers, in order.
+        """
+
+        for compact in (False, True):
+            rng = random.Random(5)
+            vertices = [Vertex(rng.random() < 0.3) for _ in range(40)]
+            maze = QuokkaMaze(compact=compact)
+            maze.add_vertices(vertices)
+            maze.fix_edges(
+                (rng.choice(vertices), rng.choice(vertices))
+                for _ in range(90)
+            )
+
+            sources = vertices[:4]
+            queries = [
+                (rng.choice(sources), rng.choice(vertices), rng.randint(-1, 3))
+                for _ in range(120)
+            ]
+            queries.append((None, vertices[0], 2))
+            queries.append((vertices[0], Vertex(True), 2))
+
+            should_be_equal(
+                maze.find_paths(queries),
+                [maze.find_path(s, t, k) for s, t, k in queries],
+                "maze.find_paths"
+            )
+
+            food_queries = [
+                (s, t, k, rng.randint(-1, 2)) for s, t, k in queries
+            ]
+            should_be_equal(
+                maze.exists_paths_with_extra_food(food_queries),
+                [
+                    maze.exists_path_with_extra_food(s, t, k, x)
+                    for s, t, k, x in food_queries
+                ],
+                "maze.exists_paths_with_extra_food"
+            )
@@ -0,0 +1,168 @@
+import random
+import threading
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_snapshot_is_frozen(self):
+        """
+        A snapshot should keep answering for the maze it was taken of.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+        m.add_vertices([A, B, C, D, E])
+        m.fix_edges([(A, B), (B, C), (C, D), (D, E)])
+
+        before = m.snapshot()
+        should_be_equal(m.snapshot() is before, True, "maze.snapshot")
+
+        m.block_edge(C, D)
+        after = m.snapshot()
+        should_be_equal(
+            before.find_path(A, E, 2),
+            [A, B, C, D, E],
+            "snapshot.find_path"
+        )
+        should_be_equal(after.find_path(A, E, 2), None, "snapshot.find_path")
+        should_be_equal(
+            before.plan_path_with_extra_food(A, E, 1, 3),
+            ([A, B, C, D, E], [B, D]),
+            "snapshot.plan_path_with_extra_food"
+        )
+        should_be_equal(
+            after.exists_path_with_extra_food(A, E, 1, 3),
+            False,
+            "snapshot.exists_path_with_extra_food"
+        )
+        should_be_equal(before.find_path(A, E, -1), None, "snapshot.find_path")
+        should_be_equal(
+            before.find_path(A, Vertex(True), 2),
+            None,
+            "snapshot.find_path"
+        )
+
+        # Vertices the change didn't touch share their tuples.
+        should_be_equal(
+            after.neighbours(A) is before.neighbours(A),
+            True,
+            "maze.snapshot"
+        )
+        should_be_equal(after.neighbours(C), (B,), "maze.snapshot")
+        should_be_equal(
+            after.vertices is before.vertices,
+            True,
+            "maze.snapshot"
+        )
+
+        F = Vertex(True)
+        m.add_vertex(F)
+        m.fix_edge(E, F)
+        latest = m.snapshot()
+        should_be_equal(latest.vertices, (A, B, C, D, E, F), "maze.snapshot")
+        should_be_equal(latest.find_path(D, F, 1), [D, E, F], "maze.snapshot")
+        should_be_equal(after.find_path(D, F, 1), None, "maze.snapshot")
+
+    def test_snapshots_share_a_base(self):
+        """
+        Snapshots taken between changes should keep their own edges while
+        sharing one base, until the changes are folded into a new one.
+        """
+
+        rng = random.Random(19)
+        vertices = [Vertex(rng.random() < 0.3) for _ in range(200)]
+        m = QuokkaMaze()
+        m.add_vertices(vertices)
+        m.fix_edges(
+            (rng.choice(vertices), rng.choice(vertices)) for _ in range(400)
+        )
+
+        first = m.snapshot()
+        taken = []
+        for _ in range(200):
+            u, v = rng.sample(vertices, 2)
+            if rng.random() < 0.1:
+                m.add_vertex(Vertex(True))
+            elif not m.block_edge(u, v):
+                m.fix_edge(u, v)
+            snap = m.snapshot()
+            taken.append(
+                (snap, {w: tuple(w.edges) for w in m.vertices})
+            )
+
+        for snap, edges in taken:
+            should_be_equal(snap.vertices, tuple(edges), "maze.snapshot")
+            for w, expected in edges.items():
+                should_be_equal(snap.neighbours(w), expected, "maze.snapshot")
+            should_be_equal(dict(snap.adjacency), edges, "maze.snapshot")
+
+        should_be_equal(taken[0][0]._base is first._base, True,
+                        "maze.snapshot")
+        should_be_equal(taken[-1][0]._base is first._base, False,
+                        "maze.snapshot")
+
+    def test_readers_during_writes(self):
+        """
+        Readers on a snapshot should see the same answers while a writer
+        keeps changing the maze.
+        """
+
+        rng = random.Random(4)
+        vertices = [Vertex(rng.random() < 0.3) for _ in range(40)]
+        m = QuokkaMaze()
+        m.add_vertices(vertices)
+        m.fix_edges(
+            (rng.choice(vertices), rng.choice(vertices)) for _ in range(80)
+        )
+
+        snap = m.snapshot()
+        queries = [
+            (rng.choice(vertices), rng.choice(vertices), rng.randint(1, 3))
+            for _ in range(30)
+        ]
+        expected = [snap.find_path(s, t, k) for s, t, k in queries]
+        failures = []
+
+        def read():
+            for _ in range(20):
+                got = [snap.find_path(s, t, k) for s, t, k in queries]
+                if got != expected:
+                    failures.append(got)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for _ in range(2000):
+            u, v = rng.choice(vertices), rng.choice(vertices)
+            if not m.block_edge(u, v):
+                m.fix_edge(u, v)
+        for reader in readers:
+            reader.join()
+
+        should_be_equal(failures, [], "snapshot.find_path")
+        should_be_equal(
+            [m.snapshot().find_path(s, t, k) for s, t, k in queries],
+            [m.find_path(s, t, k) for s, t, k in queries],
+            "maze.snapshot"
+        )
@@ -0,0 +1,89 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestQueryStats(unittest.TestCase):
+
+    def test_queries_are_measured(self):
+        """
+        Every query should be recorded and passed to the subscribers.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        for compact in (False, True):
+            m = QuokkaMaze(compact=compact)
+            m.add_vertices([A, B, C, D, E])
+            m.fix_edges([(A, B), (B, C), (C, D), (D, E)])
+
+            # Nothing is recorded until stats() is called.
+            m.find_path(A, E, 2)
+            recorder = m.stats()
+            seen = []
+            recorder.subscribe(seen.append)
+
+            should_be_equal(
+                m.find_path(A, E, 2),
+                [A, B, C, D, E],
+                "maze.find_path"
+            )
+            should_be_equal(m.find_path(A, E, 1), None, "maze.find_path")
+            should_be_equal(
+                m.exists_path_with_extra_food(A, E, 1, 3),
+                True,
+                "maze.exists_path_with_extra_food"
+            )
+            m.find_path(A, E, 2, method="astar")
+
+            should_be_equal(
+                [r["query"] for r in recorder.recent()],
+                [
+                    "find_path",
+                    "find_path",
+                    "exists_path_with_extra_food",
+                    "find_path"
+                ],
+                "maze.stats"
+            )
+            first = recorder.records[0]
+            should_be_equal(first.path_length, 4, "maze.stats")
+            should_be_equal(first.expanded, 4, "maze.stats")
+            should_be_equal(first.pushed, 3, "maze.stats")
+            should_be_equal(first.peak_frontier, 1, "maze.stats")
+            assert first.seconds > 0, "Wall time was not measured"
+            for record in list(recorder.records)[1:3]:
+                should_be_equal(record.path_length, None, "maze.stats")
+            assert recorder.records[3].expanded > 0, \
+                "A* expansions were not counted"
+
+            should_be_equal(len(seen), 4, "maze.stats")
+            totals = recorder.totals()
+            should_be_equal(totals["find_path"]["count"], 3, "maze.stats")
+            should_be_equal(
+                totals["exists_path_with_extra_food"]["count"],
+                1,
+                "maze.stats"
+            )
+
+            should_be_equal(recorder.unsubscribe(seen.append), True, "stats")
+            should_be_equal(m.drop_stats(), True, "maze.drop_stats")
+            m.find_path(A, E, 2)
+            should_be_equal(len(recorder.records), 4, "maze.drop_stats")
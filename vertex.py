@@ -20,8 +20,23 @@ class Vertex:
         * add_edge(self, v) - connects 'v' to this vertex by adding an edge.
         * rm_edge(self, v) - removes the vertex 'v' from this vertex's edges,
             breaking the connection between this vertex and 'v'.
+        * has_edge(self, v) - checks whether 'v' is connected to this vertex.
+
+    Notes:
+        * Once a vertex has more than `INDEX_DEGREE` edges, `_edge_index`
+            maps every neighbour to its position in `edges`, so membership
+            checks and removals are O(1). Below that it is None and `edges`
+            is scanned, which is as fast and saves a dict per vertex. Always
+            go through `add_edge`/`rm_edge` so the two stay in sync.
+        * Vertices are slotted: they have no `__dict__`, so no attributes
+            other than the ones above can be set on them. Searches keep their
+            state in their own tables, never on the vertices.
     """
 
+    __slots__ = ("has_food", "edges", "_edge_index", "name")
+
+    INDEX_DEGREE = 16
+
     def __init__(self, has_food: bool) -> None:
         """
         Initialises this vertex, by setting the attribute whether it has food.
@@ -31,46 +46,69 @@ class Vertex:
 
         self.has_food = has_food
         self.edges = []
-        self.visited = False
+        self._edge_index = None
         self.name = None
-        self.n_visited = False
-        self.count = 0
-        self.food = 0
 
     def __str__(self):
         return self.name
 
+    def has_edge(self, v: 'Vertex') -> bool:
+        """
+        Checks whether there is an edge between this vertex and vertex 'v'.
+
+        :param v - The vertex to look for.
+        :return true if 'v' is in this vertex's edges, else false.
+        """
+        index = self._edge_index
+        if index is None:
+            return v in self.edges
+        return v in index
+
     def add_edge(self, v: 'Vertex') -> None:
         """
         Add an edge between this vertex and vertex 'v'.
 
         :param v - The vertex to add an edge between.
         """
-        # TODO implement me please!
         if self == v:
             return None
         if v is None:
             return None
 
-        find = False
-        for i in range(len(self.edges)):
-            if self.edges[i] == v:
-                find = True
-
-        if find is False:
-            self.edges.append(v)
+        edges = self.edges
+        index = self._edge_index
+        if index is None:
+            if v in edges:
+                return None
+            edges.append(v)
+            if len(edges) > self.INDEX_DEGREE:
+                self._edge_index = {u: i for i, u in enumerate(edges)}
+        elif v not in index:
+            index[v] = len(edges)
+            edges.append(v)
 
     def rm_edge(self, v: 'Vertex') -> None:
         """
         Removes the edge between this vertex and 'v'.
 
+        The ordering of `edges` does not matter, so the last neighbour is
+        swapped into the removed slot instead of shifting the whole list.
+
         :param v - The vertex to remove from edges.
         """
-        # TODO implement me please!
-        if len(self.edges) == 0:
-            return
-
-        for i in range(len(self.edges)):
-            if self.edges[i] == v:
-                self.edges.remove(v)
-                break
+        edges = self.edges
+        index = self._edge_index
+        if index is None:
+            if v not in edges:
+                return
+            pos = edges.index(v)
+        else:
+            pos = index.pop(v, None)
+            if pos is None:
+                return
+
+        last = edges.pop()
+        if last is not v:
+            edges[pos] = last
+            if index is not None:
+                index[last] = pos